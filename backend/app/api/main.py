@@ -1,6 +1,9 @@
 from fastapi import APIRouter
-from backend.app.api.routes import home
+from backend.app.api.routes import auth, home, tasks, workers
 
 api_router = APIRouter()
 
-api_router.include_router(home.router)
\ No newline at end of file
+api_router.include_router(home.router)
+api_router.include_router(auth.router)
+api_router.include_router(workers.router)
+api_router.include_router(tasks.router)
\ No newline at end of file
@@ -0,0 +1,59 @@
+from typing import Any
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.api.services.user_auth import user_auth_service
+from backend.app.auth.dependencies import get_access_token_claims
+from backend.app.auth.login_limits import enforce_login_rate_limit
+from backend.app.auth.schema import LoginRequestSchema, OTPVerifyRequestSchema
+from backend.app.auth.tokens import token_service
+from backend.app.auth.utils import create_access_token
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+router = APIRouter(
+    prefix="/auth",
+    tags=["Auth"],
+)
+
+@router.post("/login", dependencies=[Depends(enforce_login_rate_limit)])
+async def login(login_data: LoginRequestSchema, session: AsyncSession = Depends(get_session)):
+    """Check the password, then email a one-time code that completes the login."""
+    user = await user_auth_service.authenticate_user(login_data, session)
+    await user_auth_service.send_login_otp(user)
+    return {
+        "status": "success",
+        "message": "A one-time password has been sent to your email.",
+    }
+
+@router.post("/verify-otp")
+async def verify_otp(otp_data: OTPVerifyRequestSchema, session: AsyncSession = Depends(get_session)):
+    """Exchange the emailed one-time code for an access token."""
+    user = await user_auth_service.get_user_by_email(otp_data.email, session)
+    if user is None:
+        # Same answer as a wrong code, so the endpoint does not reveal which emails exist.
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status": "error",
+                "message": "Invalid OTP.",
+                "action": "Please check the code and try again.",
+            },
+        )
+
+    await user_auth_service.verify_login_otp(user, otp_data.otp)
+    logger.info(f"User {user.id} logged in")
+    return {
+        "access_token": create_access_token(user.id),
+        "token_type": "bearer",
+    }
+
+@router.post("/logout")
+async def logout(claims: dict[str, Any] = Depends(get_access_token_claims)):
+    """Revoke the access token used for this request."""
+    await token_service.revoke(claims)
+    return {
+        "status": "success",
+        "message": "You have been logged out.",
+    }
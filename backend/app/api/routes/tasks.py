@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from backend.app.auth.dependencies import require_admin
+from backend.app.core.logging import get_logger
+from backend.app.core.task_results import get_task_status
+
+logger = get_logger()
+
+router = APIRouter(
+    prefix="/tasks",
+    tags=["Tasks"],
+    # Results can carry recipient addresses and error details.
+    dependencies=[Depends(require_admin)],
+)
+
+@router.get("/{task_id}")
+async def task_status(task_id: str):
+    try:
+        return await get_task_status(task_id)
+    except Exception as e:
+        logger.error(f"Failed to read status of task {task_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "status": "error",
+                "message": "Task results are unavailable.",
+                "action": "Please try again later."
+            }
+        )
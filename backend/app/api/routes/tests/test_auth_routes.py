@@ -0,0 +1,183 @@
+import httpx
+import pytest
+from sqlalchemy.sql import Select, Update
+
+from backend.app.api.services import user_auth
+from backend.app.auth import hashing
+from backend.app.auth.models import User
+from backend.app.auth.schema import AccountStatusSchema, RoleChoicesSchema, SecurityQuestionsSchema
+from backend.app.auth.tokens import token_service
+from backend.app.auth.utils import create_access_token, generate_password_hash
+from backend.app.core.config import settings
+from backend.app.core.db import get_session
+from backend.app.main import app
+
+pytestmark = pytest.mark.anyio
+
+PASSWORD = "correct-horse-battery"
+LOGIN_URL = f"{settings.API_V1_STR}/auth/login"
+VERIFY_OTP_URL = f"{settings.API_V1_STR}/auth/verify-otp"
+LOGOUT_URL = f"{settings.API_V1_STR}/auth/logout"
+
+
+class FakeResult:
+    def __init__(self, row):
+        self._row = row
+
+    def first(self):
+        return self._row
+
+
+class FakeSession:
+    """Returns ``user`` for every SELECT; UPDATEs and commits are accepted and ignored."""
+
+    def __init__(self, user: User | None):
+        self.user = user
+
+    async def exec(self, statement):
+        if isinstance(statement, Select):
+            return FakeResult(self.user)
+        if isinstance(statement, Update):
+            return FakeResult(None)
+        raise AssertionError(f"Unexpected statement {statement}")
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+    def __contains__(self, instance):
+        return instance is self.user
+
+
+@pytest.fixture
+def user() -> User:
+    return User(
+        email="jane@example.com",
+        username="jane",
+        first_name="jane",
+        last_name="doe",
+        id_no=12345678,
+        is_active=True,
+        account_status=AccountStatusSchema.ACTIVE,
+        role=RoleChoicesSchema.CUSTOMER,
+        securtiy_question=SecurityQuestionsSchema.MOTHERS_MAIDEN_NAME,
+        security_answer="answer",
+        hashed_password=generate_password_hash(PASSWORD),
+    )
+
+
+@pytest.fixture
+def sent_otps(monkeypatch) -> dict[str, str]:
+    """Capture login OTP emails instead of queueing them."""
+    sent: dict[str, str] = {}
+
+    async def send_login_otp_email(email_to: str, otp: str) -> None:
+        sent[email_to] = otp
+
+    monkeypatch.setattr(user_auth, "send_login_otp_email", send_login_otp_email)
+    return sent
+
+
+@pytest.fixture
+async def client(redis, user, monkeypatch):
+    async def run(operation, func, *args):
+        return func(*args)
+
+    # Hash inline rather than in the process pool.
+    monkeypatch.setattr(hashing.password_hash_pool, "run", run)
+    app.dependency_overrides[get_session] = lambda: FakeSession(user)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+async def test_login_checks_the_password_and_emails_an_otp(client, user, sent_otps):
+    response = await client.post(LOGIN_URL, json={"email": user.email, "password": PASSWORD})
+
+    assert response.status_code == 200
+    assert len(sent_otps[user.email]) == 6
+
+
+async def test_wrong_password_is_rejected_without_an_otp(client, user, sent_otps):
+    response = await client.post(LOGIN_URL, json={"email": user.email, "password": "wrong-password"})
+
+    assert response.status_code == 401
+    assert sent_otps == {}
+
+
+async def test_throttled_login_never_reaches_password_verification(client, user, sent_otps, monkeypatch):
+    verified: list[str] = []
+    verify_password_async = user_auth.verify_password_async
+
+    async def counting_verify(password: str, hashed_password: str) -> bool:
+        verified.append(password)
+        return await verify_password_async(password, hashed_password)
+
+    monkeypatch.setattr(user_auth, "verify_password_async", counting_verify)
+    monkeypatch.setattr(settings, "LOGIN_RATE_LIMIT_PER_EMAIL", 2)
+
+    statuses = [
+        (await client.post(LOGIN_URL, json={"email": user.email, "password": "wrong-password"})).status_code
+        for _ in range(3)
+    ]
+
+    assert statuses == [401, 401, 429]
+    assert len(verified) == 2
+
+
+async def test_otp_from_login_is_exchanged_for_an_access_token(client, user, sent_otps):
+    await client.post(LOGIN_URL, json={"email": user.email, "password": PASSWORD})
+
+    response = await client.post(VERIFY_OTP_URL, json={"email": user.email, "otp": sent_otps[user.email]})
+
+    assert response.status_code == 200
+    claims = await token_service.decode(response.json()["access_token"], token_type="access")
+    assert claims["id"] == str(user.id)
+
+    # The code is consumed by the first successful verify.
+    replay = await client.post(VERIFY_OTP_URL, json={"email": user.email, "otp": sent_otps[user.email]})
+    assert replay.status_code == 400
+
+
+async def test_wrong_otps_exhaust_the_code(client, user, sent_otps):
+    await client.post(LOGIN_URL, json={"email": user.email, "password": PASSWORD})
+    wrong = "000000" if sent_otps[user.email] != "000000" else "111111"
+
+    messages = [
+        (await client.post(VERIFY_OTP_URL, json={"email": user.email, "otp": wrong})).json()["detail"]["message"]
+        for _ in range(settings.OTP_MAX_ATTEMPTS)
+    ]
+    late = await client.post(VERIFY_OTP_URL, json={"email": user.email, "otp": sent_otps[user.email]})
+
+    assert messages == ["Invalid OTP."] * (settings.OTP_MAX_ATTEMPTS - 1) + ["Too many invalid OTP attempts."]
+    assert late.status_code == 400
+
+
+async def test_otp_for_an_unknown_email_is_rejected(redis):
+    app.dependency_overrides[get_session] = lambda: FakeSession(None)
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post(VERIFY_OTP_URL, json={"email": "nobody@example.com", "otp": "123456"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["message"] == "Invalid OTP."
+
+
+async def test_logout_revokes_the_access_token(client, user):
+    token = create_access_token(user.id)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = await client.post(LOGOUT_URL, headers=headers)
+    assert response.status_code == 200
+
+    again = await client.post(LOGOUT_URL, headers=headers)
+    assert again.status_code == 401
+    assert again.json()["detail"]["message"] == "Token has been revoked."
+
+
+async def test_logout_requires_a_token(client):
+    assert (await client.post(LOGOUT_URL)).status_code == 401
@@ -0,0 +1,56 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from backend.app.auth.dependencies import require_admin
+from backend.app.core.logging import get_logger
+from backend.app.core.worker_registry import get_live_workers
+
+logger = get_logger()
+
+router = APIRouter(
+    prefix="/workers",
+    tags=["Workers"],
+    dependencies=[Depends(require_admin)],
+)
+
+@router.get("/")
+async def list_workers():
+    try:
+        workers = await get_live_workers()
+    except Exception as e:
+        logger.error(f"Failed to read worker registry: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "status": "error",
+                "message": "Worker registry is unavailable.",
+                "action": "Please try again later."
+            }
+        )
+
+    return {
+        "count": len(workers),
+        "total_concurrency": sum(worker.get("concurrency") or 0 for worker in workers),
+        "active_tasks": sum(worker.get("active_tasks", 0) for worker in workers),
+        "workers": workers,
+    }
+
+
+@router.get("/queues")
+async def queue_depths():
+    # Imports the Celery app, so keep it off the API import path.
+    from backend.app.core.queue_metrics import get_queue_depths
+
+    try:
+        queues = await run_in_threadpool(get_queue_depths)
+    except Exception as e:
+        logger.error(f"Failed to read queue depths from the broker: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "status": "error",
+                "message": "Broker is unavailable.",
+                "action": "Please try again later."
+            }
+        )
+
+    return {"queues": queues}
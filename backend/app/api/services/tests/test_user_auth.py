@@ -0,0 +1,141 @@
+import pytest
+from argon2 import PasswordHasher
+from sqlalchemy.sql import Select, Update
+
+from backend.app.api.services.user_auth import user_auth_service
+from backend.app.api.services.user_cache import user_cache
+from backend.app.auth import hashing
+from backend.app.auth.models import User
+from backend.app.auth.schema import AccountStatusSchema, LoginRequestSchema, RoleChoicesSchema, SecurityQuestionsSchema
+from backend.app.auth.utils import generate_password_hash, password_needs_rehash, verify_password
+
+pytestmark = pytest.mark.anyio
+
+PASSWORD = "correct-horse-battery"
+
+
+class FakeResult:
+    def __init__(self, row):
+        self._row = row
+
+    def first(self):
+        return self._row
+
+
+class FakeSession:
+    """Returns ``user`` for every SELECT and records UPDATE parameters and commits."""
+
+    def __init__(self, user: User | None):
+        self.user = user
+        self.updates: list[dict] = []
+        self.selects: list[Select] = []
+        self.commits = 0
+
+    async def exec(self, statement):
+        if isinstance(statement, Select):
+            self.selects.append(statement)
+            return FakeResult(self.user)
+        if isinstance(statement, Update):
+            self.updates.append(dict(statement.compile().params))
+            return FakeResult(None)
+        raise AssertionError(f"Unexpected statement {statement}")
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        pass
+
+    def __contains__(self, instance):
+        return instance is self.user
+
+
+class RacingSession(FakeSession):
+    """Invalidates the user, as a concurrent activation would, while the SELECT is in flight."""
+
+    async def exec(self, statement):
+        result = await super().exec(statement)
+        if isinstance(statement, Select):
+            await user_cache.invalidate(self.user.id, self.user.email)
+        return result
+
+
+@pytest.fixture(autouse=True)
+def inline_hashing(monkeypatch):
+    """Run hashing inline instead of spawning the process pool."""
+    async def run(operation, func, *args):
+        return func(*args)
+
+    monkeypatch.setattr(hashing.password_hash_pool, "run", run)
+
+
+def make_user(hashed_password: str, **overrides) -> User:
+    fields = dict(
+        email="jane@example.com",
+        username="jane",
+        first_name="jane",
+        last_name="doe",
+        id_no=12345678,
+        is_active=True,
+        account_status=AccountStatusSchema.ACTIVE,
+        role=RoleChoicesSchema.CUSTOMER,
+        securtiy_question=SecurityQuestionsSchema.MOTHERS_MAIDEN_NAME,
+        security_answer="answer",
+        hashed_password=hashed_password,
+    )
+    fields.update(overrides)
+    return User(**fields)
+
+
+def outdated_hash(password: str) -> str:
+    return PasswordHasher(time_cost=1, memory_cost=8192, parallelism=1).hash(password)
+
+
+async def test_verify_returns_a_replacement_for_an_outdated_hash():
+    user = make_user(outdated_hash(PASSWORD))
+
+    verified, new_hash = await user_auth_service.verify_user_password(user, PASSWORD)
+
+    assert verified
+    assert verify_password(PASSWORD, new_hash)
+    assert not password_needs_rehash(new_hash)
+
+
+async def test_verify_with_current_parameters_needs_no_rehash():
+    user = make_user(generate_password_hash(PASSWORD))
+
+    assert await user_auth_service.verify_user_password(user, PASSWORD) == (True, None)
+    assert await user_auth_service.verify_user_password(user, "wrong-password") == (False, None)
+
+
+async def test_login_persists_the_upgraded_hash(redis):
+    user = make_user(outdated_hash(PASSWORD))
+    session = FakeSession(user)
+
+    result = await user_auth_service.authenticate_user(
+        LoginRequestSchema(email=user.email, password=PASSWORD), session
+    )
+
+    assert result is user
+    (update,) = session.updates
+    assert verify_password(PASSWORD, update["hashed_password"])
+    assert not password_needs_rehash(update["hashed_password"])
+
+
+async def test_lookup_racing_an_invalidation_does_not_cache_the_old_row(redis):
+    user = make_user(generate_password_hash(PASSWORD), is_active=False)
+
+    found = await user_auth_service.get_user_by_email(user.email, RacingSession(user), include_inactive=True)
+
+    assert found is user
+    assert await user_cache.get("email", user.email) is None
+
+
+async def test_lookup_caches_the_row_when_nothing_raced(redis):
+    user = make_user(generate_password_hash(PASSWORD))
+
+    await user_auth_service.get_user_by_email(user.email, FakeSession(user))
+
+    cached = await user_cache.get("id", user.id)
+    assert cached["email"] == user.email
+    assert "hashed_password" not in cached
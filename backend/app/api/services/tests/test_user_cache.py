@@ -0,0 +1,137 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+
+from backend.app.api.services.user_cache import UserCache, deserialize_user, serialize_user
+from backend.app.auth.models import User
+from backend.app.auth.schema import AccountStatusSchema, RoleChoicesSchema, SecurityQuestionsSchema
+
+pytestmark = pytest.mark.anyio
+
+
+def make_user(**overrides) -> User:
+    fields = dict(
+        email="jane@example.com",
+        username="jane",
+        first_name="jane",
+        last_name="doe",
+        id_no=12345678,
+        is_active=True,
+        is_superuser=False,
+        account_status=AccountStatusSchema.ACTIVE,
+        role=RoleChoicesSchema.CUSTOMER,
+        securtiy_question=SecurityQuestionsSchema.MOTHERS_MAIDEN_NAME,
+        security_answer="secret-answer",
+        hashed_password="$argon2id$secret",
+        failed_login_attempts=2,
+    )
+    fields.update(overrides)
+    return User(**fields)
+
+
+async def fill(cache: UserCache, user: User) -> None:
+    await cache.set(serialize_user(user), "id", user.id, await cache.fill_generation("id", user.id))
+
+
+def test_serialize_user_excludes_credentials_and_lockout_state():
+    data = serialize_user(make_user())
+
+    for field in ("hashed_password", "security_answer", "failed_login_attempts", "last_failed_login", "created_at"):
+        assert field not in data
+    assert data["email"] == "jane@example.com"
+
+
+def test_deserialize_round_trip_keeps_cached_fields():
+    user = make_user()
+    cached = deserialize_user(json.loads(json.dumps(serialize_user(user))))
+
+    assert cached.id == user.id
+    assert cached.full_name == user.full_name
+    assert cached.has_role(RoleChoicesSchema.CUSTOMER)
+    assert not hasattr(cached, "hashed_password")
+
+
+async def test_get_after_set_reads_both_keys_from_redis(redis):
+    cache = UserCache(enabled=True, local_maxsize=10, local_ttl=60, redis_ttl=60)
+    user = make_user()
+    await fill(cache, user)
+
+    by_id = await cache.get("id", user.id)
+    by_email = await cache.get("email", user.email)
+
+    assert by_id == by_email
+    assert deserialize_user(by_id).email == user.email
+    assert 0 < await redis.ttl(f"user:id:{user.id}") <= 60
+
+
+async def test_local_tier_is_bypassed_until_subscribed(redis):
+    cache = UserCache(enabled=True, local_maxsize=10, local_ttl=60, redis_ttl=60)
+    await fill(cache, make_user())
+
+    assert cache.stats()["local_size"] == 0
+
+
+async def test_invalidation_is_broadcast_to_other_processes(redis):
+    writer = UserCache(enabled=True, local_maxsize=10, local_ttl=60, redis_ttl=60)
+    reader = UserCache(enabled=True, local_maxsize=10, local_ttl=60, redis_ttl=60)
+    user = make_user()
+    reader.start_invalidation_listener()
+    try:
+        for _ in range(100):
+            if reader._local_enabled:
+                break
+            await asyncio.sleep(0.01)
+
+        await fill(writer, user)
+        assert await reader.get("id", user.id) is not None
+        assert reader.stats()["local_size"] == 1
+
+        await writer.invalidate(user.id, user.email)
+        for _ in range(100):
+            if reader.stats()["local_size"] == 0:
+                break
+            await asyncio.sleep(0.01)
+
+        assert reader.stats()["local_size"] == 0
+        assert await reader.get("id", user.id) is None
+    finally:
+        await reader.stop_invalidation_listener()
+
+
+async def test_disabled_cache_is_a_no_op(redis):
+    cache = UserCache(enabled=False, local_maxsize=10, local_ttl=60, redis_ttl=60)
+    user = make_user()
+    await fill(cache, user)
+
+    assert await cache.get("id", user.id) is None
+    assert await redis.keys("user:*") == []
+
+
+async def test_fill_that_raced_an_invalidation_is_dropped(redis):
+    cache = UserCache(enabled=True, local_maxsize=10, local_ttl=60, redis_ttl=60)
+    user = make_user(is_active=False)
+
+    # The fill reads its generation and SELECTs the inactive row...
+    generation = await cache.fill_generation("email", user.email)
+    stale = serialize_user(user)
+    # ...then the user is activated and the cache invalidated before the fill writes.
+    await cache.invalidate(user.id, user.email)
+    await cache.set(stale, "email", user.email, generation)
+
+    assert await cache.get("email", user.email) is None
+    assert await cache.get("id", user.id) is None
+
+    # The next fill sees the new generation and is stored.
+    await cache.set(serialize_user(make_user(id=user.id)), "email", user.email, await cache.fill_generation("email", user.email))
+    assert (await cache.get("id", user.id))["is_active"] is True
+
+
+async def test_fill_without_a_generation_is_skipped(redis):
+    cache = UserCache(enabled=True, local_maxsize=10, local_ttl=60, redis_ttl=60)
+    user = make_user()
+
+    await cache.set(serialize_user(user), "id", user.id, None)
+
+    assert await redis.keys("user:*") == []
@@ -1,36 +1,280 @@
-import asyncio
-import jwt
 import uuid
 from fastapi import HTTPException, status
-from sqlmodel import select
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import any_, bindparam
+from sqlalchemy.dialects import postgresql as pg
+from sqlmodel import col, select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
 from backend.app.auth.models import User
-from backend.app.auth.schema import AccountStatusSchema, UserCreateSchema
-from backend.app.auth.utils import generate_password_hash, generate_username, verify_password, create_activation_token, generate_otp
+from backend.app.api.services.user_cache import deserialize_user, serialize_user, user_cache
+from backend.app.auth.schema import AccountStatusSchema, CachedUserSchema, LoginRequestSchema, UserCreateSchema
+from backend.app.auth.login_limits import clear_login_failures, enforce_otp_issue_rate_limit, record_login_failure
+from backend.app.auth.otp import OTPVerifyResult, otp_store
+from backend.app.auth.utils import generate_username, create_activation_token, generate_password_hash_async, verify_password_async, password_needs_rehash
 from datetime import datetime, timedelta, timezone
 from backend.app.core.services.activation_email import send_activation_email
+from backend.app.core.services.login_otp_email import send_login_otp_email
 from backend.app.core.config import settings
 from backend.app.core.logging import get_logger
+from backend.app.core.singleflight import SingleFlight
 
 logger = get_logger()
 
+# Concurrent lookups of the same user share one SELECT. Credentials and lockout state are always
+# read from the database rather than from the cache.
+user_lookups = SingleFlight("user_lookup")
+
 class UserAuthService:
-    async def get_user_by_email(self, email: str, session: AsyncSession, include_inactive: bool = False) -> User | None:
-        statement = select(User).where(User.email == email)
+    async def _fetch_user(self, field: str, value: uuid.UUID | str, session: AsyncSession) -> tuple[User, dict] | None:
+        generation = await user_cache.fill_generation(field, value)
+        column = User.id if field == "id" else User.email
+        result = await session.exec(select(User).where(column == value))
+        user = result.first()
+        if user is None:
+            return None
+
+        data = serialize_user(user)
+        await user_cache.set(data, field, value, generation)
+        return user, data
+
+    async def _load_user(
+        self, field: str, value: uuid.UUID | str, session: AsyncSession, include_inactive: bool
+    ) -> User | CachedUserSchema | None:
+        """Cache hits and coalesced lookups return a detached ``CachedUserSchema``; a lookup that
+        queried through ``session`` returns the attached ``User``. Callers that write must use an
+        attached row (``session.merge`` or a fresh query)."""
+        data = await user_cache.get(field, value)
+        if data is not None:
+            user = None
+        else:
+            fetched = await user_lookups.do(
+                (field, str(value)),
+                lambda: self._fetch_user(field, value, session),
+            )
+            if fetched is None:
+                return None
+            user, data = fetched
+
+        if not include_inactive and not data["is_active"]:
+            return None
+        # The leader's row belongs to its own session; coalesced callers get a detached copy.
+        if user is not None and user in session:
+            return user
+        return deserialize_user(data)
+
+    async def get_user_by_email(self, email: str, session: AsyncSession, include_inactive: bool = False) -> User | CachedUserSchema | None:
+        return await self._load_user("email", email, session, include_inactive)
+    
+    async def get_user_by_id(self, user_id: uuid.UUID, session: AsyncSession, include_inactive: bool = False) -> User | CachedUserSchema | None:
+        return await self._load_user("id", user_id, session, include_inactive)
+
+    async def get_user_for_login(self, email: str, session: AsyncSession) -> User | None:
+        """Load the full row, credentials and lockout state included, straight from the database.
+
+        The row is locked ``FOR UPDATE`` so concurrent logins see each other's lockout
+        changes; ``check_user_lockout`` commits to release it.
+        """
+        result = await session.exec(select(User).where(User.email == email, User.is_active).with_for_update())
+        return result.first()
+
+    async def get_users_by_ids(self, user_ids: list[uuid.UUID], session: AsyncSession, include_inactive: bool = False) -> list[User | None]:
+        ids_param = bindparam("ids", list(set(user_ids)), type_=pg.ARRAY(pg.UUID(as_uuid=True)))
+        statement = select(User).where(col(User.id) == any_(ids_param))
 
         if not include_inactive:
             statement = statement.where(User.is_active)
-        
+
         result = await session.exec(statement)
-        user = result.first()
-        return user
-    
-    async def get_user_by_id(self, user_id: uuid.UUID, session: AsyncSession, include_inactive: bool = False) -> User | None:
-        statement = select(User).where(User.id == user_id)
+        users = {user.id: user for user in result.all()}
+        return [users.get(user_id) for user_id in user_ids]
+
+    async def get_users_by_emails(self, emails: list[str], session: AsyncSession, include_inactive: bool = False) -> list[User | None]:
+        emails_param = bindparam("emails", list(set(emails)), type_=pg.ARRAY(pg.VARCHAR))
+        statement = select(User).where(col(User.email) == any_(emails_param))
 
         if not include_inactive:
             statement = statement.where(User.is_active)
-        
+
         result = await session.exec(statement)
-        user = result.first()
-        return user
\ No newline at end of file
+        users = {user.email: user for user in result.all()}
+        return [users.get(email) for email in emails]
+
+    async def create_user(self, user_data: UserCreateSchema, session: AsyncSession) -> User:
+        if await self.get_user_by_email(user_data.email, session, include_inactive=True):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "status": "error",
+                    "message": "A user with this email already exists.",
+                    "action": "Please log in or use a different email address.",
+                },
+            )
+
+        user_fields = user_data.model_dump(
+            exclude={"password", "confirm_password", "username", "is_active", "account_status"}
+        )
+        new_user = User(
+            **user_fields,
+            username=generate_username(),
+            hashed_password=await generate_password_hash_async(user_data.password),
+            is_active=False,
+            account_status=AccountStatusSchema.PENDING,
+        )
+
+        try:
+            session.add(new_user)
+            # Staged in the same transaction: the email is only relayed if the user row commits,
+            # and the request never waits on a broker publish.
+            await send_activation_email(new_user.email, create_activation_token(new_user.id), session=session)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Failed to create user {user_data.email}: {e}")
+            raise
+
+        logger.info(f"Created user {new_user.id}; activation email staged in outbox")
+        return new_user
+
+    async def check_user_lockout(self, user: User, session: AsyncSession) -> None:
+        """Reject a locked account or clear an expired lockout.
+
+        ``user`` must come from ``get_user_for_login``; the transaction holding its
+        row lock is committed before this returns or raises.
+        """
+        if user.account_status != AccountStatusSchema.LOCKED:
+            await session.commit()
+            return
+
+        lockout_ends = (user.last_failed_login or datetime.min.replace(tzinfo=timezone.utc)) + timedelta(
+            minutes=settings.LOCKOUT_DURATION_MINUTES
+        )
+        if datetime.now(timezone.utc) >= lockout_ends:
+            await session.exec(
+                update(User)
+                .where(User.id == user.id)
+                .values(account_status=AccountStatusSchema.ACTIVE, failed_login_attempts=0)
+            )
+            await session.commit()
+            set_committed_value(user, "account_status", AccountStatusSchema.ACTIVE)
+            set_committed_value(user, "failed_login_attempts", 0)
+            await self.invalidate_user_cache(user)
+            logger.info(f"Lockout expired for user {user.id}")
+            return
+
+        await session.commit()
+        remaining_minutes = int((lockout_ends - datetime.now(timezone.utc)).total_seconds() // 60) + 1
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "status": "error",
+                "message": "Your account is temporarily locked.",
+                "action": f"Please try again in {remaining_minutes} minutes.",
+            },
+        )
+
+    async def handle_failed_login(self, user: User, session: AsyncSession) -> None:
+        """Count the failure in Redis; the user row is only written when the account locks."""
+        failures = await record_login_failure(user.email)
+        if failures < settings.LOGIN_ATTEMPTS:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail={
+                    "status": "error",
+                    "message": "Invalid email or password.",
+                    "action": f"You have {settings.LOGIN_ATTEMPTS - failures} attempts remaining.",
+                },
+            )
+
+        now = datetime.now(timezone.utc)
+        await session.exec(
+            update(User)
+            .where(User.id == user.id)
+            .values(account_status=AccountStatusSchema.LOCKED, failed_login_attempts=failures, last_failed_login=now)
+        )
+        await session.commit()
+        await self.invalidate_user_cache(user)
+        await clear_login_failures(user.email)
+        logger.warning(f"User {user.id} locked after {failures} failed login attempts")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "status": "error",
+                "message": "Your account has been locked due to too many failed login attempts.",
+                "action": f"Please try again in {settings.LOCKOUT_DURATION_MINUTES} minutes.",
+            },
+        )
+
+    async def authenticate_user(self, login_data: LoginRequestSchema, session: AsyncSession) -> User:
+        """Check lockout and credentials; pair with the enforce_login_rate_limit dependency."""
+        user = await self.get_user_for_login(login_data.email, session)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail={
+                    "status": "error",
+                    "message": "Invalid email or password.",
+                    "action": "Please check your credentials and try again.",
+                },
+            )
+
+        await self.check_user_lockout(user, session)
+        verified, new_hash = await self.verify_user_password(user, login_data.password)
+        if not verified:
+            await self.handle_failed_login(user, session)
+
+        if new_hash is not None:
+            try:
+                await self.save_password_hash(user.id, new_hash, session)
+                await session.commit()
+                await self.invalidate_user_cache(user)
+                logger.info(f"Upgraded password hash parameters for user {user.id}")
+            except Exception as e:
+                # The login itself succeeded; the upgrade is retried on the next one.
+                await session.rollback()
+                logger.error(f"Failed to rehash password for user {user.id}: {e}")
+
+        await clear_login_failures(user.email)
+        return user
+
+    async def send_login_otp(self, user: User | CachedUserSchema) -> None:
+        await enforce_otp_issue_rate_limit(user.id)
+        otp = await otp_store.issue(user.id)
+        await send_login_otp_email(user.email, otp)
+        logger.info(f"Login OTP issued for user {user.id}")
+
+    async def verify_login_otp(self, user: User | CachedUserSchema, otp: str) -> None:
+        result = await otp_store.verify(user.id, otp)
+        if result is OTPVerifyResult.VERIFIED:
+            return
+
+        messages = {
+            OTPVerifyResult.INVALID: ("Invalid OTP.", "Please check the code and try again."),
+            OTPVerifyResult.EXPIRED: ("OTP has expired or was never issued.", "Please request a new OTP."),
+            OTPVerifyResult.EXHAUSTED: ("Too many invalid OTP attempts.", "Please request a new OTP."),
+        }
+        message, action = messages[result]
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"status": "error", "message": message, "action": action},
+        )
+
+    async def invalidate_user_cache(self, user: User | CachedUserSchema) -> None:
+        await user_cache.invalidate(user.id, user.email)
+
+    async def verify_user_password(self, user: User, password: str) -> tuple[bool, str | None]:
+        """Check the password. When the stored hash uses outdated Argon2 parameters, also
+        return a replacement hash; persisting it is left to the caller."""
+        if not await verify_password_async(password, user.hashed_password):
+            return False, None
+
+        if password_needs_rehash(user.hashed_password):
+            return True, await generate_password_hash_async(password)
+        return True, None
+
+    async def save_password_hash(self, user_id: uuid.UUID, hashed_password: str, session: AsyncSession) -> None:
+        """Stage a password hash update in the caller's transaction."""
+        await session.exec(
+            update(User).where(User.id == user_id).values(hashed_password=hashed_password)
+        )
+
+user_auth_service = UserAuthService()
@@ -0,0 +1,210 @@
+import asyncio
+import json
+import uuid
+from typing import Any
+
+from backend.app.auth.models import User
+from backend.app.auth.schema import CachedUserSchema
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.metrics import USER_CACHE_REQUESTS
+from backend.app.core.redis_client import get_redis
+from backend.app.core.retry import backoff_delay
+from backend.app.core.ttl_cache import LocalTTLCache
+
+logger = get_logger()
+
+INVALIDATION_CHANNEL = "user_cache:invalidate"
+
+# Writes the entry under every key only if no invalidation bumped the lookup key's
+# generation since the fill read it (KEYS[1] is the generation, the rest are entries).
+GUARDED_FILL = """
+if (redis.call('GET', KEYS[1]) or '0') ~= ARGV[1] then
+    return 0
+end
+for i = 2, #KEYS do
+    redis.call('SET', KEYS[i], ARGV[2], 'EX', tonumber(ARGV[3]))
+end
+return 1
+"""
+
+# Only these fields are written to Redis; credentials and lockout state never leave the database.
+CACHED_USER_FIELDS = set(CachedUserSchema.model_fields)
+
+
+def serialize_user(user: User | CachedUserSchema) -> dict[str, Any]:
+    return user.model_dump(mode="json", include=CACHED_USER_FIELDS)
+
+
+def deserialize_user(data: dict[str, Any]) -> CachedUserSchema:
+    return CachedUserSchema.model_validate(data)
+
+
+class UserCache:
+    """Two-tier read-through cache of the non-secret user fields, keyed by id and by email.
+
+    Rows are cached regardless of ``is_active``; callers apply the
+    ``include_inactive`` filter on the cached row. Invalidations are broadcast
+    over Redis pub/sub so every process drops its local copy. The local tier is
+    only used while this process is subscribed; after a disconnect it is
+    cleared and bypassed until the subscription is back.
+    """
+
+    def __init__(self, enabled: bool, local_maxsize: int, local_ttl: float, redis_ttl: int):
+        self._enabled = enabled
+        self._local = LocalTTLCache(local_maxsize, local_ttl)
+        self._local_enabled = False
+        self._redis_ttl = redis_ttl
+        self._listener: asyncio.Task | None = None
+        self._fill_script = None
+        self._stats = {"local_hit": 0, "local_miss": 0, "redis_hit": 0, "redis_miss": 0}
+
+    @staticmethod
+    def _key(field: str, value: uuid.UUID | str) -> str:
+        return f"user:{field}:{value}"
+
+    def _record(self, tier: str, result: str) -> None:
+        self._stats[f"{tier}_{result}"] += 1
+        USER_CACHE_REQUESTS.labels(tier=tier, result=result).inc()
+
+    async def get(self, field: str, value: uuid.UUID | str) -> dict[str, Any] | None:
+        if not self._enabled:
+            return None
+
+        key = self._key(field, value)
+        if self._local_enabled:
+            data = self._local.get(key)
+            if data is not None:
+                self._record("local", "hit")
+                return data
+            self._record("local", "miss")
+
+        try:
+            raw = await get_redis().get(key)
+        except Exception as e:
+            logger.warning(f"User cache Redis read failed for {key}: {e}")
+            return None
+
+        if raw is None:
+            self._record("redis", "miss")
+            return None
+
+        self._record("redis", "hit")
+        data = json.loads(raw)
+        if self._local_enabled:
+            self._local.set(key, data)
+        return data
+
+    @staticmethod
+    def _generation_key(key: str) -> str:
+        return f"{key}:gen"
+
+    async def fill_generation(self, field: str, value: uuid.UUID | str) -> str | None:
+        """Read before querying the database and hand to ``set``.
+
+        ``invalidate`` bumps the generation, so a fill whose SELECT raced an
+        invalidation is dropped instead of writing the old row back. Returns
+        None when the cache is disabled or unreachable; ``set`` then skips.
+        """
+        if not self._enabled:
+            return None
+        try:
+            return await get_redis().get(self._generation_key(self._key(field, value))) or "0"
+        except Exception as e:
+            logger.warning(f"User cache generation read failed for {field}={value}: {e}")
+            return None
+
+    async def set(self, data: dict[str, Any], field: str, value: uuid.UUID | str, generation: str | None) -> None:
+        if not self._enabled or generation is None:
+            return
+
+        keys = [self._key("id", data["id"])]
+        if data.get("email"):
+            keys.append(self._key("email", data["email"]))
+
+        try:
+            redis = get_redis()
+            if self._fill_script is None:
+                self._fill_script = redis.register_script(GUARDED_FILL)
+            stored = await self._fill_script(
+                keys=[self._generation_key(self._key(field, value)), *keys],
+                args=[generation, json.dumps(data), self._redis_ttl],
+                client=redis,
+            )
+        except Exception as e:
+            logger.warning(f"User cache Redis write failed for user {data['id']}: {e}")
+            return
+
+        if not stored:
+            logger.debug(f"Dropped stale user cache fill for {field}={value}")
+            return
+        if self._local_enabled:
+            for key in keys:
+                self._local.set(key, data)
+
+    async def invalidate(self, user_id: uuid.UUID, *emails: str | None) -> None:
+        """Drop the user's entries everywhere; pass every email the row had or now has."""
+        keys = [self._key("id", user_id)]
+        keys.extend(self._key("email", email) for email in emails if email)
+
+        for key in keys:
+            self._local.delete(key)
+
+        try:
+            async with get_redis().pipeline(transaction=False) as pipe:
+                pipe.delete(*keys)
+                for key in keys:
+                    pipe.incr(self._generation_key(key))
+                    # Outlives any in-flight fill; an expired generation only drops fills, never admits one.
+                    pipe.expire(self._generation_key(key), self._redis_ttl)
+                pipe.publish(INVALIDATION_CHANNEL, json.dumps(keys))
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"User cache invalidation failed for user {user_id}: {e}")
+
+    async def _listen_for_invalidations(self) -> None:
+        attempt = 0
+        while True:
+            try:
+                async with get_redis().pubsub() as pubsub:
+                    await pubsub.subscribe(INVALIDATION_CHANNEL)
+                    self._local_enabled = True
+                    attempt = 0
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            for key in json.loads(message["data"]):
+                                self._local.delete(key)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"User cache invalidation subscription lost: {e}")
+            finally:
+                # Invalidations may have been missed while disconnected.
+                self._local_enabled = False
+                self._local.clear()
+
+            await asyncio.sleep(backoff_delay(attempt, 0.5, 30.0))
+            attempt += 1
+
+    def start_invalidation_listener(self) -> None:
+        if self._enabled and self._listener is None:
+            self._listener = asyncio.create_task(
+                self._listen_for_invalidations(), name="user-cache-invalidation"
+            )
+
+    async def stop_invalidation_listener(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+
+    def stats(self) -> dict[str, int]:
+        return {**self._stats, "local_size": len(self._local)}
+
+
+user_cache = UserCache(
+    enabled=settings.USER_CACHE_ENABLED,
+    local_maxsize=settings.USER_CACHE_LOCAL_MAXSIZE,
+    local_ttl=settings.USER_CACHE_LOCAL_TTL_SECONDS,
+    redis_ttl=settings.USER_CACHE_REDIS_TTL_SECONDS,
+)
@@ -0,0 +1,63 @@
+import asyncio
+import uuid
+
+from fastapi import Depends
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.api.services.user_auth import user_auth_service
+from backend.app.auth.models import User
+from backend.app.core.dataloader import DataLoader
+from backend.app.core.db import get_session
+
+
+class UserLoader:
+    """Per-request batching loader for users by id and by email.
+
+    ``load_by_id``/``load_by_email`` calls issued in the same event-loop tick
+    are resolved with one ``= ANY(...)`` query per key type. Rows are loaded
+    regardless of ``is_active`` so both filters share the memo. Both loaders
+    query through the request session, which cannot run two statements at
+    once, so their batches take turns on a lock.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+        self._session_lock = asyncio.Lock()
+        self._by_id: DataLoader[uuid.UUID, User] = DataLoader(self._load_by_ids)
+        self._by_email: DataLoader[str, User] = DataLoader(self._load_by_emails)
+
+    async def _load_by_ids(self, user_ids: list[uuid.UUID]) -> list[User | None]:
+        async with self._session_lock:
+            users = await user_auth_service.get_users_by_ids(user_ids, self._session, include_inactive=True)
+        for user in users:
+            if user is not None and user.email:
+                self._by_email.prime(user.email, user)
+        return users
+
+    async def _load_by_emails(self, emails: list[str]) -> list[User | None]:
+        async with self._session_lock:
+            users = await user_auth_service.get_users_by_emails(emails, self._session, include_inactive=True)
+        for user in users:
+            if user is not None:
+                self._by_id.prime(user.id, user)
+        return users
+
+    @staticmethod
+    def _filter(user: User | None, include_inactive: bool) -> User | None:
+        if user is None or (not include_inactive and not user.is_active):
+            return None
+        return user
+
+    async def load_by_id(self, user_id: uuid.UUID, include_inactive: bool = False) -> User | None:
+        return self._filter(await self._by_id.load(user_id), include_inactive)
+
+    async def load_by_email(self, email: str, include_inactive: bool = False) -> User | None:
+        return self._filter(await self._by_email.load(email), include_inactive)
+
+    async def load_many_by_id(self, user_ids: list[uuid.UUID], include_inactive: bool = False) -> list[User | None]:
+        users = await self._by_id.load_many(user_ids)
+        return [self._filter(user, include_inactive) for user in users]
+
+
+def get_user_loader(session: AsyncSession = Depends(get_session)) -> UserLoader:
+    return UserLoader(session)
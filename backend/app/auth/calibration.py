@@ -0,0 +1,115 @@
+import argparse
+import os
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from argon2 import PasswordHasher
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+# Candidates are tried from strongest to weakest; 19456 KiB is the OWASP floor for Argon2id.
+MEMORY_COST_CANDIDATES = (131072, 65536, 47104, 19456)
+PARALLELISM_CANDIDATES = (1, 2, 4, 8)
+MAX_TIME_COST = 10
+BENCHMARK_PASSWORD = "calibration-password"
+
+
+@dataclass(frozen=True)
+class Argon2Parameters:
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+    verify_ms: float
+
+    def as_env(self) -> dict[str, str]:
+        return {
+            "ARGON2_TIME_COST": str(self.time_cost),
+            "ARGON2_MEMORY_COST": str(self.memory_cost),
+            "ARGON2_PARALLELISM": str(self.parallelism),
+        }
+
+
+def measure_verify_ms(time_cost: int, memory_cost: int, parallelism: int, samples: int = 3) -> float:
+    """Median wall time of one Argon2 verify with the given parameters, in milliseconds."""
+    hasher = PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    hashed = hasher.hash(BENCHMARK_PASSWORD)
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.verify(hashed, BENCHMARK_PASSWORD)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate_argon2(target_ms: float, samples: int = 3) -> Argon2Parameters:
+    """Pick the strongest Argon2 parameters whose verify time stays within ``target_ms`` on this host."""
+    cpu_count = os.cpu_count() or 1
+    parallelism_options = [p for p in PARALLELISM_CANDIDATES if p <= cpu_count] or [1]
+
+    for memory_cost in MEMORY_COST_CANDIDATES:
+        parallelism = min(
+            parallelism_options,
+            key=lambda p: measure_verify_ms(1, memory_cost, p, samples),
+        )
+
+        best: Argon2Parameters | None = None
+        for time_cost in range(1, MAX_TIME_COST + 1):
+            elapsed = measure_verify_ms(time_cost, memory_cost, parallelism, samples)
+            logger.debug(
+                f"Argon2 t={time_cost} m={memory_cost} p={parallelism}: {elapsed:.1f} ms"
+            )
+            if elapsed > target_ms:
+                break
+            best = Argon2Parameters(time_cost, memory_cost, parallelism, elapsed)
+
+        if best is not None:
+            logger.info(
+                f"Argon2 calibrated to t={best.time_cost} m={best.memory_cost} "
+                f"p={best.parallelism} ({best.verify_ms:.1f} ms, target {target_ms} ms)"
+            )
+            return best
+
+    floor = MEMORY_COST_CANDIDATES[-1]
+    elapsed = measure_verify_ms(1, floor, 1, samples)
+    logger.warning(
+        f"No Argon2 parameters meet the {target_ms} ms target; using the minimum ({elapsed:.1f} ms)."
+    )
+    return Argon2Parameters(1, floor, 1, elapsed)
+
+
+def write_env_file(path: Path, values: dict[str, str]) -> None:
+    lines = path.read_text().splitlines() if path.exists() else []
+    remaining = dict(values)
+    for index, line in enumerate(lines):
+        key = line.split("=", 1)[0].strip()
+        if key in remaining:
+            lines[index] = f"{key}={remaining.pop(key)}"
+    lines.extend(f"{key}={value}" for key, value in remaining.items())
+    path.write_text("\n".join(lines) + "\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Calibrate Argon2 cost parameters for this host.")
+    parser.add_argument("--target-ms", type=float, default=settings.ARGON2_TARGET_VERIFY_MS)
+    parser.add_argument("--samples", type=int, default=3)
+    parser.add_argument("--env-file", type=Path, help="Write the chosen parameters into this env file.")
+    args = parser.parse_args()
+
+    params = calibrate_argon2(args.target_ms, args.samples)
+    values = params.as_env()
+
+    if args.env_file:
+        write_env_file(args.env_file, values)
+        print(f"Wrote Argon2 parameters to {args.env_file}")
+    for key, value in values.items():
+        print(f"{key}={value}")
+    print(f"# verify time: {params.verify_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
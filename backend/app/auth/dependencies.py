@@ -0,0 +1,66 @@
+import uuid
+from typing import Any, Awaitable, Callable
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.api.services.user_auth import user_auth_service
+from backend.app.auth.models import User
+from backend.app.auth.schema import CachedUserSchema, RoleChoicesSchema
+from backend.app.auth.tokens import token_service
+from backend.app.core.db import get_session
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def _unauthorized() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail={
+            "status": "error",
+            "message": "Authentication required.",
+            "action": "Please log in and try again.",
+        },
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def get_access_token_claims(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+) -> dict[str, Any]:
+    """Verified claims of the bearer access token."""
+    if credentials is None:
+        raise _unauthorized()
+    return await token_service.decode(credentials.credentials, token_type="access")
+
+
+async def get_current_user(
+    claims: dict[str, Any] = Depends(get_access_token_claims),
+    session: AsyncSession = Depends(get_session),
+) -> User | CachedUserSchema:
+    """Resolve the active user from a bearer access token."""
+    user = await user_auth_service.get_user_by_id(uuid.UUID(claims["id"]), session)
+    if user is None:
+        raise _unauthorized()
+    return user
+
+
+def require_roles(*roles: RoleChoicesSchema) -> Callable[..., Awaitable[User | CachedUserSchema]]:
+    """Dependency that admits superusers and users holding one of ``roles``."""
+    async def dependency(user: User | CachedUserSchema = Depends(get_current_user)) -> User | CachedUserSchema:
+        if user.is_superuser or any(user.has_role(role) for role in roles):
+            return user
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "status": "error",
+                "message": "You do not have permission to access this resource.",
+                "action": "Please contact an administrator.",
+            },
+        )
+
+    return dependency
+
+
+require_admin = require_roles(RoleChoicesSchema.ADMIN, RoleChoicesSchema.SUPER_ADMIN)
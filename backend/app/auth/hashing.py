@@ -0,0 +1,86 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from fastapi import HTTPException, status
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.metrics import (
+    PASSWORD_HASH_DURATION,
+    PASSWORD_HASH_IN_FLIGHT,
+    PASSWORD_HASH_QUEUE_WAIT,
+    PASSWORD_HASH_REJECTED,
+)
+
+logger = get_logger()
+
+T = TypeVar("T")
+
+
+class PasswordHashPool:
+    """Runs Argon2 work on a bounded process pool so it never blocks the event loop.
+
+    Admission is capped at the worker count, so an admitted call starts at once:
+    waiting happens only on the semaphore, where it is timed as queue wait and
+    shed with a 503, never inside the executor where it would count as hash time.
+    """
+
+    def __init__(self, max_workers: int, queue_timeout: float):
+        self._max_workers = max_workers
+        self._queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_workers)
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"Password hashing pool started with {self._max_workers} workers.")
+        return self._executor
+
+    async def run(self, operation: str, func: Callable[..., T], *args: Any) -> T:
+        queued_at = time.perf_counter()
+        try:
+            async with asyncio.timeout(self._queue_timeout):
+                await self._semaphore.acquire()
+        except asyncio.TimeoutError:
+            PASSWORD_HASH_REJECTED.labels(operation=operation).inc()
+            logger.warning(
+                f"Password {operation} rejected after waiting {self._queue_timeout} seconds for a slot."
+            )
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail={
+                    "status": "error",
+                    "message": "The server is busy processing other logins.",
+                    "action": "Please try again in a few moments."
+                }
+            )
+
+        started_at = time.perf_counter()
+        PASSWORD_HASH_QUEUE_WAIT.labels(operation=operation).observe(started_at - queued_at)
+        PASSWORD_HASH_IN_FLIGHT.inc()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._semaphore.release()
+            PASSWORD_HASH_IN_FLIGHT.dec()
+            PASSWORD_HASH_DURATION.labels(operation=operation).observe(time.perf_counter() - started_at)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info("Password hashing pool shut down.")
+
+
+password_hash_pool = PasswordHashPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    queue_timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS,
+)
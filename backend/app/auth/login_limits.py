@@ -0,0 +1,76 @@
+import uuid
+
+from fastapi import HTTPException, Request, status
+
+from backend.app.auth.schema import LoginRequestSchema
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.rate_limit import RateLimit, rate_limiter
+
+logger = get_logger()
+
+
+def _failures_key(email: str) -> str:
+    return f"login:failures:{email.lower()}"
+
+
+async def enforce_login_rate_limit(request: Request, login_data: LoginRequestSchema) -> None:
+    """Dependency that throttles login attempts per email, per client IP and globally.
+
+    Runs before the user lookup and Argon2 verify, so a credential-stuffing burst
+    is rejected from Redis alone.
+    """
+    window = settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS
+    client_ip = request.client.host if request.client else "unknown"
+    result = await rate_limiter.hit(
+        RateLimit("email", f"login:email:{login_data.email.lower()}", settings.LOGIN_RATE_LIMIT_PER_EMAIL, window),
+        RateLimit("ip", f"login:ip:{client_ip}", settings.LOGIN_RATE_LIMIT_PER_IP, window),
+        RateLimit("global", "login:global", settings.LOGIN_RATE_LIMIT_GLOBAL, window),
+    )
+    if result.allowed:
+        return
+
+    logger.warning(f"Login rate limit '{result.limit_name}' exceeded for {login_data.email} from {client_ip}")
+    raise HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail={
+            "status": "error",
+            "message": "Too many login attempts.",
+            "action": f"Please try again in {int(result.retry_after_seconds) + 1} seconds.",
+        },
+        headers={"Retry-After": str(int(result.retry_after_seconds) + 1)},
+    )
+
+
+async def enforce_otp_issue_rate_limit(user_id: uuid.UUID) -> None:
+    """Cap how many login OTPs a user can request per window."""
+    result = await rate_limiter.hit(
+        RateLimit(
+            "otp_issue",
+            f"otp:issue:{user_id}",
+            settings.OTP_ISSUE_RATE_LIMIT,
+            settings.OTP_ISSUE_RATE_LIMIT_WINDOW_SECONDS,
+        ),
+    )
+    if result.allowed:
+        return
+
+    logger.warning(f"OTP issue rate limit exceeded for user {user_id}")
+    raise HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail={
+            "status": "error",
+            "message": "Too many OTP requests.",
+            "action": f"Please try again in {int(result.retry_after_seconds) + 1} seconds.",
+        },
+        headers={"Retry-After": str(int(result.retry_after_seconds) + 1)},
+    )
+
+
+async def record_login_failure(email: str) -> int:
+    """Count a failed login in the lockout window; returns the failures inside it."""
+    return await rate_limiter.record(_failures_key(email), settings.LOCKOUT_DURATION_MINUTES * 60)
+
+
+async def clear_login_failures(email: str) -> None:
+    await rate_limiter.reset(_failures_key(email))
@@ -11,8 +11,6 @@ class User(BaseUserSchema, table=True):
     hashed_password: str 
     failed_login_attempts: int = Field(default=0, sa_type=pg.SMALLINT)
     last_failed_login: datetime | None = Field(default=None, sa_column=Column(pg.TIMESTAMP(timezone=True)))
-    otp: str = Field(max_length=6, default="")
-    otp_expiry_time : datetime | None = Field(default=None, sa_column=Column(pg.TIMESTAMP(timezone=True)))
     created_at: datetime = Field(
         default_factory= lambda: datetime.now(timezone.utc),
         sa_column=Column(
@@ -0,0 +1,115 @@
+import hashlib
+import hmac
+import uuid
+from enum import Enum
+
+from backend.app.auth.utils import generate_otp
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.redis_client import get_redis
+
+logger = get_logger()
+
+OTP_KEY_PREFIX = "otp:"
+
+# Replaces the code but keeps the attempts already spent on an outstanding one,
+# so requesting a new code does not buy more guesses.
+ISSUE = """
+redis.call('HSET', KEYS[1], 'code', ARGV[1])
+redis.call('HSETNX', KEYS[1], 'attempts', 0)
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]))
+return redis.call('HGET', KEYS[1], 'attempts')
+"""
+
+# Compares and consumes in one step so two concurrent verifies cannot both succeed,
+# and counts failed attempts on the same key so they expire with the code.
+VERIFY_AND_CONSUME = """
+local stored = redis.call('HGET', KEYS[1], 'code')
+if not stored then
+    return 0
+end
+if stored == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return 1
+end
+local attempts = redis.call('HINCRBY', KEYS[1], 'attempts', 1)
+if attempts >= tonumber(ARGV[2]) then
+    redis.call('DEL', KEYS[1])
+    return -2
+end
+return -1
+"""
+
+
+class OTPVerifyResult(str, Enum):
+    VERIFIED = "verified"
+    INVALID = "invalid"
+    EXPIRED = "expired"
+    EXHAUSTED = "exhausted"
+
+
+_RESULTS = {
+    1: OTPVerifyResult.VERIFIED,
+    0: OTPVerifyResult.EXPIRED,
+    -1: OTPVerifyResult.INVALID,
+    -2: OTPVerifyResult.EXHAUSTED,
+}
+
+
+def otp_key(user_id: uuid.UUID) -> str:
+    return f"{OTP_KEY_PREFIX}{user_id}"
+
+
+class OTPStore:
+    """One-time passwords kept in Redis with native expiry instead of on the user row.
+
+    Codes are stored as an HMAC keyed with ``secret`` so Redis never holds a usable OTP.
+    """
+
+    def __init__(self, secret: str, ttl_seconds: int, max_attempts: int):
+        if not secret:
+            raise ValueError("OTP_SECRET_KEY must be set to a non-empty secret.")
+        self._secret = secret.encode()
+        self._ttl_seconds = ttl_seconds
+        self._max_attempts = max_attempts
+        self._issue_script = None
+        self._verify_script = None
+
+    def _digest(self, code: str) -> str:
+        return hmac.new(self._secret, code.encode(), hashlib.sha256).hexdigest()
+
+    async def issue(self, user_id: uuid.UUID) -> str:
+        """Generate a code for the user, replacing any outstanding one but keeping its attempt count."""
+        redis = get_redis()
+        if self._issue_script is None:
+            self._issue_script = redis.register_script(ISSUE)
+
+        code = generate_otp()
+        await self._issue_script(
+            keys=[otp_key(user_id)], args=[self._digest(code), self._ttl_seconds], client=redis
+        )
+        return code
+
+    async def verify(self, user_id: uuid.UUID, code: str) -> OTPVerifyResult:
+        redis = get_redis()
+        if self._verify_script is None:
+            self._verify_script = redis.register_script(VERIFY_AND_CONSUME)
+
+        # Passing the client keeps the script usable after the Redis client is recreated.
+        outcome = await self._verify_script(
+            keys=[otp_key(user_id)], args=[self._digest(code), self._max_attempts], client=redis
+        )
+        result = _RESULTS[int(outcome)]
+        if result is not OTPVerifyResult.VERIFIED:
+            logger.info(f"OTP verification for user {user_id} failed: {result.value}")
+        return result
+
+    async def revoke(self, user_id: uuid.UUID) -> None:
+        await get_redis().delete(otp_key(user_id))
+
+
+otp_store = OTPStore(
+    secret=settings.OTP_SECRET_KEY,
+    ttl_seconds=settings.OTP_EXPIRATION_MINUTES * 60,
+    max_attempts=settings.OTP_MAX_ATTEMPTS,
+)
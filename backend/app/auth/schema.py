@@ -73,6 +73,32 @@ class UserReadSchema(BaseUserSchema):
     id: uuid.UUID
     full_name: str
 
+class CachedUserSchema(SQLModel):
+    """The non-secret part of a ``User`` that may be kept in shared caches.
+
+    Credentials, the security answer and lockout state are left out; code that
+    checks them loads the row from the database.
+    """
+    id: uuid.UUID
+    username: str | None = None
+    email: EmailStr | None = None
+    first_name: str | None = None
+    middle_name: str | None = None
+    last_name: str | None = None
+    id_no: int
+    is_active: bool
+    is_superuser: bool
+    account_status: AccountStatusSchema
+    role: RoleChoicesSchema
+
+    @property
+    def full_name(self) -> str:
+        names = [self.first_name, self.middle_name, self.last_name]
+        return " ".join(name for name in names if name).title().strip()
+
+    def has_role(self, role: RoleChoicesSchema) -> bool:
+        return self.role == role
+
 class EmailRequestSchema(SQLModel):
     email: EmailStr
 
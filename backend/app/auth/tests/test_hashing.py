@@ -0,0 +1,51 @@
+import asyncio
+import os
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from backend.app.auth.hashing import PasswordHashPool
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def pool():
+    pool = PasswordHashPool(max_workers=1, queue_timeout=0.2)
+    yield pool
+    pool.shutdown()
+
+
+async def test_work_runs_in_another_process(pool):
+    assert await pool.run("verify", os.getpid) != os.getpid()
+
+
+async def test_calls_beyond_the_worker_count_are_shed_with_503(pool):
+    # Start the worker process first so the slow call is not timed against spawn.
+    await pool.run("verify", os.getpid)
+
+    slow = asyncio.ensure_future(pool.run("hash", time.sleep, 1.0))
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(HTTPException) as exc:
+        await pool.run("verify", os.getpid)
+    assert exc.value.status_code == 503
+    await slow
+
+
+async def test_event_loop_stays_responsive_during_hashing(pool):
+    await pool.run("verify", os.getpid)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.ensure_future(ticker())
+    await pool.run("hash", time.sleep, 0.3)
+    task.cancel()
+
+    assert ticks >= 10
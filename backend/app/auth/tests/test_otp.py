@@ -0,0 +1,70 @@
+import uuid
+
+import pytest
+
+from backend.app.auth.otp import OTPStore, OTPVerifyResult, otp_key
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def store(redis):
+    return OTPStore(secret="test-otp-secret", ttl_seconds=60, max_attempts=3)
+
+
+def wrong(code: str) -> str:
+    return "0" * len(code) if code != "0" * len(code) else "1" * len(code)
+
+
+async def test_correct_code_verifies_once(store):
+    user_id = uuid.uuid4()
+    code = await store.issue(user_id)
+
+    assert await store.verify(user_id, code) is OTPVerifyResult.VERIFIED
+    assert await store.verify(user_id, code) is OTPVerifyResult.EXPIRED
+
+
+async def test_code_is_stored_as_a_keyed_digest(store, redis):
+    user_id = uuid.uuid4()
+    code = await store.issue(user_id)
+
+    stored = await redis.hgetall(otp_key(user_id))
+    assert stored["code"] != code
+    assert stored["code"] != OTPStore(secret="another-secret", ttl_seconds=60, max_attempts=3)._digest(code)
+    assert 0 < await redis.ttl(otp_key(user_id)) <= 60
+
+
+async def test_attempts_are_capped(store):
+    user_id = uuid.uuid4()
+    code = await store.issue(user_id)
+
+    assert await store.verify(user_id, wrong(code)) is OTPVerifyResult.INVALID
+    assert await store.verify(user_id, wrong(code)) is OTPVerifyResult.INVALID
+    assert await store.verify(user_id, wrong(code)) is OTPVerifyResult.EXHAUSTED
+    assert await store.verify(user_id, code) is OTPVerifyResult.EXPIRED
+
+
+async def test_reissue_keeps_spent_attempts(store, redis):
+    user_id = uuid.uuid4()
+    first = await store.issue(user_id)
+    await store.verify(user_id, wrong(first))
+    await store.verify(user_id, wrong(first))
+
+    second = await store.issue(user_id)
+
+    assert await redis.hget(otp_key(user_id), "attempts") == "2"
+    assert await store.verify(user_id, first) in (OTPVerifyResult.INVALID, OTPVerifyResult.EXHAUSTED)
+    assert await store.verify(user_id, second) is OTPVerifyResult.EXPIRED
+
+
+async def test_revoke_removes_the_code(store):
+    user_id = uuid.uuid4()
+    code = await store.issue(user_id)
+    await store.revoke(user_id)
+
+    assert await store.verify(user_id, code) is OTPVerifyResult.EXPIRED
+
+
+def test_empty_secret_is_rejected():
+    with pytest.raises(ValueError):
+        OTPStore(secret="", ttl_seconds=60, max_attempts=3)
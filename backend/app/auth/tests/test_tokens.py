@@ -0,0 +1,98 @@
+import time
+from datetime import timedelta
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from backend.app.auth.tokens import KeyRing, TokenService
+from backend.app.core.ttl_cache import LocalTTLCache
+
+pytestmark = pytest.mark.anyio
+
+OLD_SECRET = "old-secret-" + "x" * 32
+NEW_SECRET = "new-secret-" + "y" * 32
+
+
+def service(kid: str, secret: str, retired: dict[str, str] | None = None) -> TokenService:
+    return TokenService(
+        KeyRing(algorithm="HS256", kid=kid, active_key=secret, retired_keys=retired or {}),
+        LocalTTLCache(maxsize=100, ttl=300),
+    )
+
+
+def issue(tokens: TokenService, token_type: str = "access") -> str:
+    return tokens.encode({"id": "user-1"}, token_type=token_type, expires_in=timedelta(minutes=5))
+
+
+async def test_round_trip(redis):
+    tokens = service("k1", OLD_SECRET)
+
+    claims = await tokens.decode(issue(tokens), token_type="access")
+
+    assert claims["id"] == "user-1"
+    assert claims["type"] == "access"
+
+
+async def test_tokens_from_a_retired_key_still_verify_after_rotation(redis):
+    before = service("k1", OLD_SECRET)
+    token = issue(before)
+
+    after = service("k2", NEW_SECRET, retired={"k1": OLD_SECRET})
+
+    assert (await after.decode(token, token_type="access"))["id"] == "user-1"
+    assert (await after.decode(issue(after), token_type="access"))["id"] == "user-1"
+
+
+async def test_tokens_from_a_dropped_key_are_rejected(redis):
+    token = issue(service("k1", OLD_SECRET))
+
+    with pytest.raises(HTTPException) as exc:
+        await service("k2", NEW_SECRET).decode(token, token_type="access")
+    assert exc.value.status_code == 401
+
+
+async def test_wrong_token_type_is_rejected(redis):
+    tokens = service("k1", OLD_SECRET)
+
+    with pytest.raises(HTTPException):
+        await tokens.decode(issue(tokens, "activation"), token_type="access")
+
+
+async def test_revoked_token_is_rejected_even_when_cached(redis):
+    tokens = service("k1", OLD_SECRET)
+    token = issue(tokens)
+    claims = await tokens.decode(token, token_type="access")
+
+    await tokens.revoke(claims)
+
+    with pytest.raises(HTTPException) as exc:
+        await tokens.decode(token, token_type="access")
+    assert "revoked" in exc.value.detail["message"]
+    assert 0 < await redis.ttl(f"jwt:denylist:{claims['jti']}") <= 301
+
+
+async def test_cached_claims_are_copied_on_read(redis):
+    tokens = service("k1", OLD_SECRET)
+    token = issue(tokens)
+
+    first = await tokens.decode(token, token_type="access")
+    first["id"] = "tampered"
+
+    assert (await tokens.decode(token, token_type="access"))["id"] == "user-1"
+
+
+@pytest.mark.parametrize("missing", ["exp", "type", "jti"])
+async def test_tokens_missing_required_claims_are_rejected(redis, missing):
+    tokens = service("k1", OLD_SECRET)
+    claims = {"id": "user-1", "type": "access", "jti": "abc", "exp": int(time.time()) + 300}
+    del claims[missing]
+    token = jwt.encode(claims, OLD_SECRET, algorithm="HS256", headers={"kid": "k1"})
+
+    with pytest.raises(HTTPException) as exc:
+        await tokens.decode(token, token_type="access")
+    assert exc.value.status_code == 401
+
+
+def test_symmetric_keys_are_not_published():
+    assert service("k1", OLD_SECRET).keyring.jwks() == {"keys": []}
@@ -0,0 +1,161 @@
+import hashlib
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import jwt
+from fastapi import HTTPException, status
+from jwt.algorithms import get_default_algorithms
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.redis_client import get_redis
+from backend.app.core.ttl_cache import LocalTTLCache
+
+logger = get_logger()
+
+DENYLIST_KEY_PREFIX = "jwt:denylist:"
+
+SYMMETRIC_ALGORITHMS = {"HS256", "HS384", "HS512"}
+
+
+@dataclass(frozen=True)
+class TokenKey:
+    kid: str
+    algorithm: str
+    signing_key: Any
+    verification_key: Any
+
+
+class KeyRing:
+    """The active signing key plus retired keys that are still accepted for verification.
+
+    With an HS algorithm the keys are shared secrets. With RS/ES/PS/EdDSA the
+    active key is a PEM private key and retired keys are PEM public keys, so
+    other services can verify tokens from the JWKS document alone.
+    """
+
+    def __init__(self, algorithm: str, kid: str, active_key: str, retired_keys: dict[str, str]):
+        self.algorithm = algorithm
+        self._algorithm = get_default_algorithms()[algorithm]
+        self._symmetric = algorithm in SYMMETRIC_ALGORITHMS
+
+        signing_key = self._algorithm.prepare_key(active_key)
+        verification_key = signing_key if self._symmetric else signing_key.public_key()
+        self.active = TokenKey(kid, algorithm, signing_key, verification_key)
+
+        self._keys = {kid: self.active}
+        for retired_kid, key in retired_keys.items():
+            prepared = self._algorithm.prepare_key(key)
+            self._keys[retired_kid] = TokenKey(retired_kid, algorithm, None, prepared)
+
+    def get(self, kid: str | None) -> TokenKey | None:
+        return self._keys.get(kid or self.active.kid)
+
+    def jwks(self) -> dict[str, list[dict]]:
+        if self._symmetric:
+            # Shared secrets are never published.
+            return {"keys": []}
+        keys = []
+        for key in self._keys.values():
+            jwk = self._algorithm.to_jwk(key.verification_key, as_dict=True)
+            keys.append({**jwk, "kid": key.kid, "alg": key.algorithm, "use": "sig"})
+        return {"keys": keys}
+
+
+def _invalid_token(message: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail={
+            "status": "error",
+            "message": message,
+            "action": "Please request a new token.",
+        },
+    )
+
+
+class TokenService:
+    """Issues, verifies and revokes JWTs.
+
+    Verified claims are cached in-process by token hash until the token expires,
+    so repeated requests with the same token skip the signature check. The
+    revocation denylist lives in Redis and is consulted on every decode.
+    """
+
+    def __init__(self, keyring: KeyRing, cache: LocalTTLCache):
+        self._keyring = keyring
+        self._cache = cache
+
+    @property
+    def keyring(self) -> KeyRing:
+        return self._keyring
+
+    def encode(self, claims: dict[str, Any], token_type: str, expires_in: timedelta) -> str:
+        now = datetime.now(tz=timezone.utc)
+        payload = {
+            **claims,
+            "type": token_type,
+            "jti": uuid.uuid4().hex,
+            "iat": now,
+            "exp": now + expires_in,
+        }
+        key = self._keyring.active
+        return jwt.encode(payload, key.signing_key, algorithm=key.algorithm, headers={"kid": key.kid})
+
+    def _verify(self, token: str) -> dict[str, Any]:
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+        except jwt.PyJWTError:
+            raise _invalid_token("Invalid token.")
+
+        key = self._keyring.get(kid)
+        if key is None:
+            raise _invalid_token("Token was signed with an unknown key.")
+
+        try:
+            # Every token we issue carries these; rejecting tokens without them keeps the
+            # cache TTL, type check and revocation below from failing on missing claims.
+            return jwt.decode(
+                token,
+                key.verification_key,
+                algorithms=[key.algorithm],
+                options={"require": ["exp", "type", "jti"]},
+            )
+        except jwt.ExpiredSignatureError:
+            raise _invalid_token("Token has expired.")
+        except jwt.PyJWTError:
+            raise _invalid_token("Invalid token.")
+
+    async def decode(self, token: str, token_type: str) -> dict[str, Any]:
+        token_hash = hashlib.sha256(token.encode()).hexdigest()
+        claims = self._cache.get(token_hash)
+        if claims is None:
+            claims = self._verify(token)
+            self._cache.set(token_hash, claims, ttl=claims["exp"] - time.time())
+
+        if claims.get("type") != token_type:
+            raise _invalid_token("Invalid token type.")
+        if await get_redis().exists(f"{DENYLIST_KEY_PREFIX}{claims['jti']}"):
+            raise _invalid_token("Token has been revoked.")
+        # Callers get their own copy so nothing they change leaks into the cache.
+        return dict(claims)
+
+    async def revoke(self, claims: dict[str, Any]) -> None:
+        """Deny the token until it would have expired anyway."""
+        ttl = int(claims["exp"] - time.time()) + 1
+        if ttl > 0:
+            await get_redis().set(f"{DENYLIST_KEY_PREFIX}{claims['jti']}", 1, ex=ttl)
+            logger.info(f"Revoked {claims.get('type')} token {claims['jti']}")
+
+
+token_service = TokenService(
+    KeyRing(
+        algorithm=settings.JWT_ALGORITHM,
+        kid=settings.JWT_KEY_ID,
+        active_key=settings.JWT_PRIVATE_KEY or settings.JWT_SECRET_KEY,
+        retired_keys=settings.JWT_RETIRED_KEYS,
+    ),
+    LocalTTLCache(maxsize=settings.JWT_VERIFY_CACHE_SIZE, ttl=settings.JWT_VERIFY_CACHE_MAX_SECONDS),
+)
@@ -1,19 +1,24 @@
 import random
+import secrets
 import string
 import uuid
-import jwt
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 
+from backend.app.auth.hashing import password_hash_pool
 from backend.app.core.config import settings
 
-_ph = PasswordHasher()
+_ph = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST,
+    parallelism=settings.ARGON2_PARALLELISM,
+)
 
 def generate_otp(length: int = 6) -> str:
-    """Generate a numeric OTP of specified length."""
-    return ''.join(random.choices(string.digits, k=length))
+    """Generate a numeric OTP of specified length from a CSPRNG."""
+    return ''.join(secrets.choice(string.digits) for _ in range(length))
 
 def generate_password_hash(password: str) -> str:
     """Generate a hashed password using Argon2."""
@@ -25,6 +30,18 @@ def verify_password(password: str, hashed_password: str) -> bool:
         return _ph.verify(hashed_password, password)
     except VerifyMismatchError:
         return False
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a hash was created with different Argon2 parameters than the current ones."""
+    return _ph.check_needs_rehash(hashed_password)
+
+async def generate_password_hash_async(password: str) -> str:
+    """Generate a hashed password on the password hashing process pool."""
+    return await password_hash_pool.run("hash", generate_password_hash, password)
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    """Verify a password on the password hashing process pool."""
+    return await password_hash_pool.run("verify", verify_password, password, hashed_password)
     
 def generate_username() -> str:
     bank_name = settings.SITE_NAME
@@ -37,14 +54,28 @@ def generate_username() -> str:
 
 def create_activation_token(id: uuid.UUID) -> str:
     """Create a JWT activation token."""
-    expiration = datetime.now(tz=timezone.utc) + timedelta(
-        minutes=settings.ACTIVATION_TOKEN_EXPIRATION_MINUTES
+    # Imported here so the password hashing worker processes, which load this module, stay lean.
+    from backend.app.auth.tokens import token_service
+
+    return token_service.encode(
+        {"id": str(id)},
+        token_type="activation",
+        expires_in=timedelta(minutes=settings.ACTIVATION_TOKEN_EXPIRATION_MINUTES),
     )
-    payload = {
-        "id": str(id),
-        "exp": expiration,
-        "type": "activation",
-        "iat": datetime.now(tz=timezone.utc),
-    }
-    token = jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
-    return token
\ No newline at end of file
+
+def create_access_token(id: uuid.UUID) -> str:
+    """Create a JWT access token."""
+    from backend.app.auth.tokens import token_service
+
+    return token_service.encode(
+        {"id": str(id)},
+        token_type="access",
+        expires_in=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRATION_MINUTES),
+    )
+
+async def verify_activation_token(token: str) -> uuid.UUID:
+    """Verify an activation token and return the user id it was issued for."""
+    from backend.app.auth.tokens import token_service
+
+    claims = await token_service.decode(token, token_type="activation")
+    return uuid.UUID(claims["id"])
\ No newline at end of file
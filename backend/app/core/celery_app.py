@@ -1,31 +1,53 @@
 from celery import Celery
+from kombu import Queue
 from backend.app.core.config import settings
 
+DEFAULT_QUEUE = "bank_tasks"
+HIGH_PRIORITY_QUEUE = "high_priority"
+# Message priorities on HIGH_PRIORITY_QUEUE; higher is delivered first.
+MAX_PRIORITY = 9
+DEFAULT_PRIORITY = 5
+
 celery_app = Celery(
     "worker",
     broker=f"amqp://{settings.RABBITMQ_USER}:{settings.RABBITMQ_PASSWORD}@{settings.RABBITMQ_HOST}:{settings.RABBITMQ_PORT}//",
-    backend=f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}"
+    # Same Redis store, but only tasks declaring result_policy="extended" write extended metadata.
+    backend=f"backend.app.core.task_policy:PolicyRedisBackend+redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}",
+    task_cls="backend.app.core.task_policy:PolicyTask",
 )
 
 celery_app.conf.update(
     task_serializer="json",
-    task_track_started=True,
+    # Tasks store nothing unless they declare a result_policy; see backend.app.core.task_policy.
+    task_ignore_result=True,
+    task_track_started=False,
     result_serializer="json",
     accept_content=["application/json"],
     result_backend_max_retries=10,
-    task_send_sent_event=True,
-    result_extended=True,
+    task_send_sent_event=False,
+    result_extended=False,
     result_backend_always_retry=True,
     result_expires=3600,
     task_time_limit=5*60,
     task_soft_time_limit=5*60,
-    worker_send_task_events=True,
+    # Only needed when Flower is watching.
+    worker_send_task_events=settings.CELERY_TASK_EVENTS,
     task_acks_late=True,
     task_reject_on_worker_lost=True,
     worker_prefetch_multiplier=1,
     task_default_retry_delay=300,
     task_max_retries=3,
-    task_default_queue="bank_tasks",
+    task_default_queue=DEFAULT_QUEUE,
+    task_queues=(
+        # Transactional mail never waits behind bulk work. Within the queue each call's
+        # priority (e.g. OTP above activation) orders delivery; see EmailTemplate.priority.
+        Queue(HIGH_PRIORITY_QUEUE, routing_key=HIGH_PRIORITY_QUEUE, queue_arguments={"x-max-priority": MAX_PRIORITY}),
+        Queue(DEFAULT_QUEUE, routing_key=DEFAULT_QUEUE),
+    ),
+    task_routes={
+        "send_email_task": {"queue": HIGH_PRIORITY_QUEUE, "priority": DEFAULT_PRIORITY},
+        "send_bulk_email_task": {"queue": DEFAULT_QUEUE},
+    },
     task_create_missing_queues=True,
     worker_max_tasks_per_child=1000,
     worker_max_memory_per_child=50000,
@@ -37,4 +59,9 @@ celery_app.autodiscover_tasks(
     packages=["backend.app.core.emails"],
     related_name="tasks",
     force=True
-)
\ No newline at end of file
+)
+
+# Registers the worker_ready/worker_shutdown handlers that publish heartbeats.
+from backend.app.core import worker_heartbeat  # noqa: E402, F401
+# Registers the publish/prerun handlers that measure queue wait time and the metrics exporter.
+from backend.app.core import queue_metrics  # noqa: E402, F401
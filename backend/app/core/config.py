@@ -18,6 +18,13 @@ class Settings(BaseSettings):
     API_V1_STR: str = ""
     SITE_NAME: str = ""
     DATABASE_URL: str = ""
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_WARMUP: bool = True
+
+    STARTUP_TIMEOUT_SECONDS: float = 90.0
+    STARTUP_BACKOFF_BASE_SECONDS: float = 0.25
+    STARTUP_BACKOFF_MAX_SECONDS: float = 5.0
     
     MAIL_FROM: str = ""
     MAIL_FROM_NAME: str = ""
@@ -25,23 +32,93 @@ class Settings(BaseSettings):
     SMTP_HOST: str = "mailpit"
     SMTP_PORT: int = 1025
     MAILPIT_UI_PORT: int = 8025
+    SMTP_TIMEOUT_SECONDS: float = 30.0
+    SMTP_POOL_SIZE: int = 4
+    SMTP_POOL_MAX_MESSAGES: int = 100
+    SMTP_POOL_MAX_IDLE_SECONDS: float = 60.0
+    EMAIL_BULK_BATCH_SIZE: int = 100
+    EMAIL_RENDER_IN_WORKER: bool = False
+
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 1.0
+    OUTBOX_MAX_ATTEMPTS: int = 10
+    OUTBOX_RETENTION_HOURS: int = 72
+    OUTBOX_PURGE_INTERVAL_SECONDS: float = 3600.0
 
     REDIS_HOST: str = "redis"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 2.0
 
     RABBITMQ_HOST: str = "rabbitmq"
     RABBITMQ_PORT: int = 5672
     RABBITMQ_USER: str = "guest"
     RABBITMQ_PASSWORD: str = "guest"
 
+    CELERY_HEARTBEAT_INTERVAL_SECONDS: float = 10.0
+    CELERY_HEARTBEAT_TTL_SECONDS: int = 30
+    CELERY_TASK_EVENTS: bool = False
+
+    METRICS_QUEUE_DEPTH_REFRESH_SECONDS: float = 15.0
+    # Bearer token Prometheus sends to scrape /metrics. Unset, /metrics is only served locally.
+    METRICS_BEARER_TOKEN: str = ""
+    # Port of the worker's Prometheus exporter in multiprocess mode; 0 disables it.
+    CELERY_METRICS_PORT: int = 9808
+
+    SQL_INSTRUMENTATION: bool = False
+    SQL_SLOW_QUERY_MS: float = 200.0
+    SQL_N_PLUS_ONE_THRESHOLD: int = 10
+
+    LOG_ENQUEUE: bool = True
+    LOG_FILE_SINKS: bool = True
+    LOG_JSON_STDOUT: bool = False
+    # Module prefix -> minimum level, e.g. {"backend.app.core.health": "WARNING"}. Overrides are
+    # filters, so they can only raise a sink's level, never lower it below the sink's own.
+    LOG_LEVEL_OVERRIDES: dict[str, str] = {}
+    # Module prefix -> fraction of DEBUG/INFO records kept; WARNING and above are never sampled.
+    LOG_SAMPLE_RATES: dict[str, float] = {}
+
     OTP_EXPIRATION_MINUTES: int = 2 if ENVIRONMENT == "local" else 5
+    OTP_MAX_ATTEMPTS: int = 5
+    # HMAC key for stored OTP digests; required, and separate from the JWT keys.
+    OTP_SECRET_KEY: str = ""
+    OTP_ISSUE_RATE_LIMIT: int = 3
+    OTP_ISSUE_RATE_LIMIT_WINDOW_SECONDS: int = 900
     LOGIN_ATTEMPTS: int = 3
     LOCKOUT_DURATION_MINUTES: int = 2 if ENVIRONMENT == "local" else 5
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: int = 60
+    LOGIN_RATE_LIMIT_PER_EMAIL: int = 10
+    LOGIN_RATE_LIMIT_PER_IP: int = 30
+    LOGIN_RATE_LIMIT_GLOBAL: int = 1000
     ACTIVATION_TOKEN_EXPIRATION_MINUTES: int = 2 if ENVIRONMENT == "local" else 5
+    ACCESS_TOKEN_EXPIRATION_MINUTES: int = 30
     API_BASE_URL : str = ""
     SUPPORT_EMAIL: str = ""
     JWT_SECRET_KEY: str = ""
     JWT_ALGORITHM: str = "HS256"
+    JWT_KEY_ID: str = "primary"
+    # PEM private key, required when JWT_ALGORITHM is asymmetric (RS*, ES*, PS*, EdDSA).
+    JWT_PRIVATE_KEY: str = ""
+    # kid -> secret (HS*) or PEM public key, for tokens signed before a rotation.
+    JWT_RETIRED_KEYS: dict[str, str] = {}
+    JWT_VERIFY_CACHE_SIZE: int = 10000
+    JWT_VERIFY_CACHE_MAX_SECONDS: int = 300
+
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS: float = 5.0
+
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536
+    ARGON2_PARALLELISM: int = 4
+    ARGON2_TARGET_VERIFY_MS: int = 50
+
+    HEALTH_PROBE_INTERVAL_SECONDS: float = 15.0
+    HEALTH_SNAPSHOT_TTL_SECONDS: int = 60
+    HEALTH_STALE_WHILE_REVALIDATE_SECONDS: float = 30.0
+
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_LOCAL_MAXSIZE: int = 1024
+    USER_CACHE_LOCAL_TTL_SECONDS: float = 30.0
+    USER_CACHE_REDIS_TTL_SECONDS: int = 300
 
 settings = Settings()
\ No newline at end of file
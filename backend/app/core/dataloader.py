@@ -0,0 +1,94 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, Sequence, TypeVar
+
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """Batches ``load`` calls made in the same event-loop tick into one ``batch_load`` call.
+
+    ``batch_load`` receives a list of unique keys and must return values in the
+    same order, using ``None`` for missing keys. Chunks of one dispatch run one
+    after another, so ``batch_load`` may use a single database session. Results
+    are memoized for the lifetime of the loader, so create one loader per request.
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[list[K]], Awaitable[Sequence[V | None]]],
+        max_batch_size: int = 500,
+    ):
+        self._batch_load = batch_load
+        self._max_batch_size = max_batch_size
+        self._memo: dict[K, asyncio.Future] = {}
+        self._queue: list[K] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> V | None:
+        future = self._memo.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._memo[key] = future
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            self._queue.append(key)
+        return await future
+
+    async def load_many(self, keys: Sequence[K]) -> list[V | None]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V | None) -> None:
+        if key not in self._memo:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._memo[key] = future
+
+    def clear(self, key: K) -> None:
+        self._memo.pop(key, None)
+
+    def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        task = asyncio.create_task(self._run_batches(keys))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batches(self, keys: list[K]) -> None:
+        futures = {key: self._memo[key] for key in keys if key in self._memo}
+        try:
+            for start in range(0, len(keys), self._max_batch_size):
+                await self._run_batch(keys[start:start + self._max_batch_size])
+        finally:
+            # If cancelled partway, later chunks never run; release their waiters.
+            for key, future in futures.items():
+                if not future.done():
+                    if self._memo.get(key) is future:
+                        del self._memo[key]
+                    future.cancel()
+
+    async def _run_batch(self, keys: list[K]) -> None:
+        try:
+            values = await self._batch_load(keys)
+            if len(values) != len(keys):
+                raise ValueError(
+                    f"batch_load returned {len(values)} values for {len(keys)} keys"
+                )
+        except BaseException as e:
+            logger.error(f"DataLoader batch of {len(keys)} keys failed: {e}")
+            for key in keys:
+                future = self._memo.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return
+
+        for key, value in zip(keys, values):
+            future = self._memo.get(key)
+            if future is not None and not future.done():
+                future.set_result(value)
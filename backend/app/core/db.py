@@ -1,4 +1,5 @@
 import asyncio
+import time
 from typing import AsyncGenerator
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy import text
@@ -6,20 +7,45 @@ from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.pool import AsyncAdaptedQueuePool
 from backend.app.core.config import settings
 from backend.app.core.logging import get_logger
+from backend.app.core.metrics import DB_POOL_CHECKED_OUT, DB_POOL_CHECKOUT_WAIT, DB_POOL_OVERFLOW
 from backend.app.core.model_registry import load_models
+from backend.app.core.retry import backoff_delay
+from backend.app.core.sql_instrumentation import install_query_instrumentation
 
 logger = get_logger()
 
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """Queue pool that reports checkout waits and occupancy to Prometheus."""
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        connection = super()._do_get()
+        DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started_at)
+        self._report()
+        return connection
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        self._report()
+
+    def _report(self) -> None:
+        DB_POOL_CHECKED_OUT.set(self.checkedout())
+        # overflow() counts up from -pool_size until the pool is full.
+        DB_POOL_OVERFLOW.set(max(self.overflow(), 0))
+
 engine = create_async_engine(
     settings.DATABASE_URL,
-    poolclass=AsyncAdaptedQueuePool,
+    poolclass=InstrumentedAsyncPool,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
     pool_timeout=30,
     pool_recycle=1800
 )
 
+if settings.SQL_INSTRUMENTATION:
+    install_query_instrumentation(engine)
+
 async_session = async_sessionmaker(
     engine, 
     class_=AsyncSession, 
@@ -54,7 +80,6 @@ async def init_db() -> None:
         logger.info("Model registry loaded successfully.")
 
         max_retries = 3
-        retry_delay = 2  # seconds
 
         for attempt in range(max_retries):
             try:
@@ -67,8 +92,24 @@ async def init_db() -> None:
                     logger.error(f"Failed to connect to the database after {max_retries} attempts: {e}")
                     raise
                 logger.warning(f"Database connection failed (attempt {attempt + 1}/{max_retries}): {e}")
-                await asyncio.sleep(retry_delay * (attempt + 1))
+                await asyncio.sleep(
+                    backoff_delay(attempt, settings.STARTUP_BACKOFF_BASE_SECONDS, settings.STARTUP_BACKOFF_MAX_SECONDS)
+                )
             
     except Exception as e: 
         logger.error(f"Database initialization failed: {e}")
-        raise
\ No newline at end of file
+        raise
+
+
+async def warm_pool(size: int | None = None) -> int:
+    """Open ``size`` pooled connections (default: the pool size) so first requests skip the connect."""
+    size = size or engine.pool.size()
+    results = await asyncio.gather(*(engine.connect() for _ in range(size)), return_exceptions=True)
+
+    connections = [conn for conn in results if not isinstance(conn, BaseException)]
+    for error in (result for result in results if isinstance(result, BaseException)):
+        logger.warning(f"Failed to open a connection while warming the pool: {error}")
+
+    await asyncio.gather(*(conn.close() for conn in connections))
+    logger.info(f"Database pool warmed with {len(connections)}/{size} connections.")
+    return len(connections)
@@ -1,20 +1,81 @@
-from jinja2 import Environment, FileSystemLoader
+import asyncio
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Mapping, Sequence
 
-from backend.app.core.emails.config import TEMPLATES_DIR
-from backend.app.core.emails.tasks import send_email_task
+from backend.app.core.config import settings
+from backend.app.core.emails.config import COMPILED_TEMPLATES_DIR, TEMPLATES_DIR
 from backend.app.core.logging import get_logger
+from backend.app.core.metrics import EMAIL_ENQUEUE_DURATION
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
+    from sqlmodel.ext.asyncio.session import AsyncSession
 
 logger = get_logger()
 
-email_env = Environment(
-    loader=FileSystemLoader(TEMPLATES_DIR),
-    autoescape=True,
-)
+def create_email_env(precompiled: bool = True) -> "Environment":
+    """Build the Jinja environment, preferring templates compiled at build time."""
+    from jinja2 import ChoiceLoader, Environment, FileSystemLoader, ModuleLoader
+
+    loader = FileSystemLoader(TEMPLATES_DIR)
+    if precompiled and COMPILED_TEMPLATES_DIR.is_dir():
+        # Templates added after the build still resolve from source.
+        loader = ChoiceLoader([ModuleLoader(COMPILED_TEMPLATES_DIR), loader])
+
+    return Environment(
+        loader=loader,
+        autoescape=True,
+        auto_reload=settings.ENVIRONMENT == "local",
+    )
+
+@lru_cache
+def get_email_env() -> "Environment":
+    """Create the Jinja environment on first render rather than at import time."""
+    return create_email_env()
+
+def render_template(template_name: str, template_name_plain: str, context: dict) -> tuple[str, str]:
+    """Render the HTML and plain text bodies of an email."""
+    email_env = get_email_env()
+    html_template = email_env.get_template(template_name)
+    plain_template = email_env.get_template(template_name_plain)
+    return html_template.render(**context), plain_template.render(**context)
 
 class EmailTemplate:
     template_name: str
     template_name_plain: str
     subject: str
+    # Delivery priority on the high_priority queue, 0-9; the more time-bound the mail, the higher.
+    priority: int = 5
+
+    @classmethod
+    def render(cls, context: dict) -> tuple[str, str]:
+        if not cls.template_name or not cls.template_name_plain:
+            raise ValueError("Both HTML and plain text template names must be defined in the subclass.")
+
+        return render_template(cls.template_name, cls.template_name_plain, context)
+
+    @classmethod
+    def build_payload(cls, context: dict) -> dict:
+        """Return the task arguments carrying the email body.
+
+        With ``EMAIL_RENDER_IN_WORKER`` only the template names and context are
+        queued and the worker renders; otherwise the rendered bodies are sent.
+        """
+        if settings.EMAIL_RENDER_IN_WORKER:
+            return {
+                "template_name": cls.template_name,
+                "template_name_plain": cls.template_name_plain,
+                "context": context,
+            }
+        html_content, plain_content = cls.render(context)
+        return {"html_content": html_content, "plain_content": plain_content}
+
+    @classmethod
+    def _observe_enqueue(cls, path: str, started_at: float) -> None:
+        EMAIL_ENQUEUE_DURATION.labels(template=cls.template_name, path=path).observe(
+            time.perf_counter() - started_at
+        )
 
     @classmethod
     async def send_email(
@@ -22,27 +83,109 @@ class EmailTemplate:
         email_to: str | list[str],
         context: dict,
         subject_override: str | None = None,
+        session: "AsyncSession | None" = None,
     ) -> None:
+        """Queue the email; with ``session`` it goes through the outbox and is only sent once the caller commits."""
+        recipients_list = [email_to] if isinstance(email_to, str) else email_to
+        if len(recipients_list) > 1:
+            # One message per recipient so nobody sees the other addresses.
+            await cls.send_bulk(recipients_list, context, subject_override, session=session)
+            return
+
+        started_at = time.perf_counter()
         try:
-            recipients_list = [email_to] if isinstance(email_to, str) else email_to
-            
-            if not cls.template_name or not cls.template_name_plain:
-                raise ValueError("Both HTML and plain text template names must be defined in the subclass.")
-
-            html_template = email_env.get_template(cls.template_name)
-            plain_template = email_env.get_template(cls.template_name_plain)
-
-            html_content = html_template.render(**context)
-            plain_content = plain_template.render(**context)
-
-            task = send_email_task.delay(
-                recipients=recipients_list,
-                subject=subject_override or cls.subject,
-                html_content=html_content,
-                plain_content=plain_content,
+            payload = cls.build_payload(context)
+
+            if session is not None:
+                from backend.app.outbox.service import add_outbox_message
+
+                message = add_outbox_message(session, "send_email_task", {
+                    "recipients": recipients_list,
+                    "subject": subject_override or cls.subject,
+                    **payload,
+                }, priority=cls.priority)
+                cls._observe_enqueue("outbox", started_at)
+                logger.info(f"Email to {recipients_list} staged in outbox as {message.id}")
+                return
+
+            # Importing the task pulls in the Celery app; defer it until mail is actually sent.
+            from backend.app.core.emails.tasks import send_email_task
+
+            task = send_email_task.apply_async(
+                kwargs={
+                    "recipients": recipients_list,
+                    "subject": subject_override or cls.subject,
+                    **payload,
+                },
+                priority=cls.priority,
             )
+            cls._observe_enqueue("broker", started_at)
             logger.info(f"Email task {task.id} queued for {recipients_list} with subject '{subject_override or cls.subject}'")
 
         except Exception as e:
             logger.error(f"Failed to queue email to {recipients_list}: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    @classmethod
+    def _build_messages(cls, per_recipient: Mapping[str, dict], context: dict, subject: str) -> list[dict]:
+        return [
+            {"recipient": recipient, "subject": subject, **cls.build_payload({**context, **overrides})}
+            for recipient, overrides in per_recipient.items()
+        ]
+
+    @classmethod
+    async def send_bulk(
+        cls,
+        recipients: Mapping[str, dict] | Sequence[str],
+        context: dict,
+        subject_override: str | None = None,
+        batch_size: int | None = None,
+        session: "AsyncSession | None" = None,
+    ) -> list[str]:
+        """Build one message per recipient and queue them in batches.
+
+        ``recipients`` is either a list of addresses or a mapping of address to
+        per-recipient context merged over ``context``. Each batch is sent by one
+        ``send_bulk_email_task`` over a single SMTP session and its result maps
+        every recipient to ``"sent"`` or the failure reason. Returns the task ids.
+        With ``session`` the batches are staged in the outbox instead; the outbox
+        ids become the task ids once the relay publishes them.
+        """
+        per_recipient = recipients if isinstance(recipients, Mapping) else dict.fromkeys(recipients, {})
+        subject = subject_override or cls.subject
+        batch_size = batch_size or settings.EMAIL_BULK_BATCH_SIZE
+
+        started_at = time.perf_counter()
+        try:
+            # Rendering a large batch is CPU-bound; keep it off the event loop.
+            messages = await asyncio.to_thread(cls._build_messages, per_recipient, context, subject)
+            batches = [messages[i:i + batch_size] for i in range(0, len(messages), batch_size)]
+
+            if session is not None:
+                from backend.app.outbox.service import add_outbox_message
+
+                task_ids = [
+                    str(add_outbox_message(session, "send_bulk_email_task", {"messages": batch}).id)
+                    for batch in batches
+                ]
+                cls._observe_enqueue("outbox", started_at)
+                logger.info(f"Staged {len(messages)} '{subject}' emails in outbox as {len(task_ids)} batches")
+                return task_ids
+
+            from celery import group
+            from backend.app.core.emails.tasks import send_bulk_email_task
+
+            # Publishing blocks on the broker connection.
+            result = await asyncio.to_thread(
+                group(send_bulk_email_task.s(messages=batch) for batch in batches).apply_async
+            )
+            task_ids = [child.id for child in result.results]
+            cls._observe_enqueue("broker", started_at)
+            logger.info(
+                f"Queued {len(messages)} '{subject}' emails in {len(task_ids)} batches: {task_ids}"
+            )
+            return task_ids
+
+        except Exception as e:
+            logger.error(f"Failed to queue bulk email '{subject}' to {len(per_recipient)} recipients: {e}")
+            raise
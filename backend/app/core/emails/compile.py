@@ -0,0 +1,53 @@
+"""Precompile the email templates into Python modules.
+
+Run at image build time so workers and the API load bytecode through a
+``ModuleLoader`` instead of parsing and compiling templates on first render.
+The local entrypoint runs it again at container start, because local.yml
+bind-mounts the source tree over the image and hides the build output.
+"""
+import argparse
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from backend.app.core.emails.base import create_email_env
+from backend.app.core.emails.config import COMPILED_TEMPLATES_DIR
+
+def compile_email_templates(target: Path = COMPILED_TEMPLATES_DIR) -> list[str]:
+    """Compile every template under TEMPLATES_DIR into ``target``.
+
+    Output is written to a scratch directory and swapped in, so containers
+    starting together never load a half-written module.
+    """
+    staging = target.with_name(f"{target.name}.{os.getpid()}")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+
+    env = create_email_env(precompiled=False)
+    names = env.list_templates()
+    # zip=None writes plain .py modules, which the ModuleLoader imports directly.
+    env.compile_templates(str(staging), zip=None, ignore_errors=False)
+
+    shutil.rmtree(target, ignore_errors=True)
+    try:
+        staging.rename(target)
+    except OSError:
+        # Another process swapped in the same output first.
+        shutil.rmtree(staging, ignore_errors=True)
+    return names
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--target", type=Path, default=COMPILED_TEMPLATES_DIR,
+        help=f"Output directory (default: {COMPILED_TEMPLATES_DIR})",
+    )
+    args = parser.parse_args()
+
+    names = compile_email_templates(args.target)
+    print(f"Compiled {len(names)} email templates into {args.target}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,28 @@
-import asyncio
-from fastapi_mail import MessageSchema, MessageType, MultipartSubtypeEnum, NameEmail
 from backend.app.core.celery_app import celery_app
 from backend.app.core.logging import get_logger
-from backend.app.core.emails.config import fastmail
+from backend.app.core.emails.base import render_template
+from backend.app.core.emails.transport import build_message, smtp_pool, worker_loop
 
 logger = get_logger()
 
+def resolve_bodies(
+    html_content: str | None = None,
+    plain_content: str | None = None,
+    template_name: str | None = None,
+    template_name_plain: str | None = None,
+    context: dict | None = None,
+) -> tuple[str, str]:
+    """Return the rendered bodies, rendering here when only templates were queued."""
+    if html_content is not None and plain_content is not None:
+        return html_content, plain_content
+    if not template_name or not template_name_plain:
+        raise ValueError("Either rendered content or template names must be provided.")
+    return render_template(template_name, template_name_plain, context or {})
+
 @celery_app.task(
     name="send_email_task",
     bind=True,
+    result_policy="ignore",
     max_retries=3,
     soft_time_limit=60,
     auto_retry_for=(Exception,),
@@ -16,26 +30,64 @@ logger = get_logger()
     retry_backoff_max=60,
 )
 def send_email_task(
-    self, *, recipients: list[NameEmail], subject: str, html_content: str, plain_content: str
+    self,
+    *,
+    recipients: list[str],
+    subject: str,
+    html_content: str | None = None,
+    plain_content: str | None = None,
+    template_name: str | None = None,
+    template_name_plain: str | None = None,
+    context: dict | None = None,
 ) -> bool:
-    """Asynchronous task to send an email using FastAPI-Mail."""
+    """Send an email over the worker's pooled SMTP connections."""
     try:
-        message = MessageSchema(
-            subject=subject,
-            recipients=recipients,
-            body=html_content,
-            subtype=MessageType.html,
-            alternative_body=plain_content,
-            multipart_subtype=MultipartSubtypeEnum.alternative,
+        html_content, plain_content = resolve_bodies(
+            html_content, plain_content, template_name, template_name_plain, context
         )
-
-        async def send_email():
-            await fastmail.send_message(message, template_name=None)
-
-        asyncio.run(send_email())
+        message = build_message(recipients, subject, html_content, plain_content)
+        worker_loop.run(smtp_pool.send(message))
         logger.info(f"Email sent to {recipients} with subject '{subject}'")
         return True
     
     except Exception as e:
         logger.error(f"Failed to send email to {recipients}: {e}")
-        return False
\ No newline at end of file
+        return False
+
+
+@celery_app.task(
+    name="send_bulk_email_task",
+    bind=True,
+    result_policy="minimal",
+    soft_time_limit=5*60,
+)
+def send_bulk_email_task(self, *, messages: list[dict[str, str]]) -> dict[str, str]:
+    """Send a batch of individually addressed emails over pooled SMTP sessions.
+
+    Each message is a dict with ``recipient``, ``subject`` and either the rendered
+    ``html_content``/``plain_content`` or ``template_name``, ``template_name_plain``
+    and ``context``. Returns ``"sent"`` or the failure reason per recipient.
+    """
+    try:
+        built = []
+        for m in messages:
+            html_content, plain_content = resolve_bodies(
+                m.get("html_content"),
+                m.get("plain_content"),
+                m.get("template_name"),
+                m.get("template_name_plain"),
+                m.get("context"),
+            )
+            built.append(build_message([m["recipient"]], m["subject"], html_content, plain_content))
+        errors = worker_loop.run(smtp_pool.send_many(built))
+    except Exception as e:
+        logger.error(f"Bulk email batch of {len(messages)} messages failed: {e}")
+        return {m["recipient"]: f"failed: {e}" for m in messages}
+
+    results = {
+        m["recipient"]: "sent" if error is None else f"failed: {error}"
+        for m, error in zip(messages, errors)
+    }
+    failed = sum(error is not None for error in errors)
+    logger.info(f"Bulk email batch sent {len(messages) - failed}/{len(messages)} messages")
+    return results
@@ -0,0 +1,110 @@
+import celery
+import pytest
+
+from backend.app.core.config import settings
+from backend.app.core.emails import tasks
+from backend.app.core.services.login_otp_email import LoginOTPEmail
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeSession:
+    def __init__(self):
+        self.added: list = []
+
+    def add(self, instance) -> None:
+        self.added.append(instance)
+
+
+async def test_send_bulk_renders_per_recipient_and_stages_batches():
+    session = FakeSession()
+    recipients = {f"user{i}@example.com": {"otp": f"otp-{i}"} for i in range(5)}
+
+    task_ids = await LoginOTPEmail.send_bulk(recipients, {"expiry_time": 5}, batch_size=2, session=session)
+
+    assert task_ids == [str(message.id) for message in session.added]
+    assert [message.task_name for message in session.added] == ["send_bulk_email_task"] * 3
+    batches = [message.payload["messages"] for message in session.added]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+    messages = [message for batch in batches for message in batch]
+    assert [message["recipient"] for message in messages] == list(recipients)
+    for i, message in enumerate(messages):
+        assert message["subject"] == LoginOTPEmail.subject
+        assert f"otp-{i}" in message["plain_content"]
+        assert all(f"otp-{j}" not in message["plain_content"] for j in range(5) if j != i)
+
+
+async def test_render_in_worker_queues_only_template_and_context(monkeypatch):
+    monkeypatch.setattr(settings, "EMAIL_RENDER_IN_WORKER", True)
+    session = FakeSession()
+
+    await LoginOTPEmail.send_bulk(["a@example.com"], {"otp": "123456"}, session=session)
+
+    [message] = session.added[0].payload["messages"]
+    assert message == {
+        "recipient": "a@example.com",
+        "subject": LoginOTPEmail.subject,
+        "template_name": "login_otp.html",
+        "template_name_plain": "login_otp.txt",
+        "context": {"otp": "123456"},
+    }
+
+
+async def test_send_email_to_several_recipients_sends_one_message_each():
+    session = FakeSession()
+
+    await LoginOTPEmail.send_email(["a@example.com", "b@example.com"], {"otp": "1"}, session=session)
+
+    [staged] = session.added
+    recipients = [message["recipient"] for message in staged.payload["messages"]]
+    assert recipients == ["a@example.com", "b@example.com"]
+
+
+async def test_send_bulk_publishes_one_group_of_batches(monkeypatch):
+    published: list[list[dict]] = []
+
+    class FakeGroup:
+        def __init__(self, signatures):
+            self.signatures = list(signatures)
+
+        def apply_async(self):
+            published.extend(signature.kwargs["messages"] for signature in self.signatures)
+            children = [type("Result", (), {"id": f"task-{i}"})() for i in range(len(self.signatures))]
+            return type("GroupResult", (), {"results": children})()
+
+    monkeypatch.setattr(celery, "group", FakeGroup)
+
+    task_ids = await LoginOTPEmail.send_bulk([f"user{i}@example.com" for i in range(3)], {}, batch_size=2)
+
+    assert task_ids == ["task-0", "task-1"]
+    assert [[message["recipient"] for message in batch] for batch in published] == [
+        ["user0@example.com", "user1@example.com"],
+        ["user2@example.com"],
+    ]
+
+
+def test_bulk_task_reports_each_recipient(monkeypatch):
+    sent: list[str] = []
+
+    async def send_many(messages):
+        sent.extend(message["To"] for message in messages)
+        return [None, RuntimeError("mailbox full"), None]
+
+    monkeypatch.setattr(tasks.smtp_pool, "send_many", send_many)
+    messages = [
+        {"recipient": f"user{i}@example.com", "subject": "Notice", "html_content": "<p>hi</p>", "plain_content": "hi"}
+        for i in range(3)
+    ]
+
+    try:
+        results = tasks.send_bulk_email_task.run(messages=messages)
+    finally:
+        tasks.worker_loop.close()
+
+    assert sent == ["user0@example.com", "user1@example.com", "user2@example.com"]
+    assert results == {
+        "user0@example.com": "sent",
+        "user1@example.com": "failed: mailbox full",
+        "user2@example.com": "sent",
+    }
@@ -0,0 +1,41 @@
+from jinja2 import Environment, ModuleLoader
+
+from backend.app.core.emails import base
+from backend.app.core.emails.compile import compile_email_templates
+from backend.app.core.emails.config import TEMPLATES_DIR
+
+CONTEXT = {"otp": "424242", "expiry_time": 5, "site_name": "Test Bank", "support_email": "help@example.com"}
+
+
+def test_compiled_templates_render_like_the_sources(tmp_path):
+    target = tmp_path / "compiled_templates"
+
+    names = compile_email_templates(target)
+
+    assert sorted(names) == sorted(path.name for path in TEMPLATES_DIR.iterdir())
+    compiled = Environment(loader=ModuleLoader(target), autoescape=True)
+    source = base.create_email_env(precompiled=False)
+    for name in ("login_otp.html", "login_otp.txt"):
+        assert compiled.get_template(name).render(**CONTEXT) == source.get_template(name).render(**CONTEXT)
+
+
+def test_recompiling_swaps_the_output_in_place(tmp_path):
+    target = tmp_path / "compiled_templates"
+    compile_email_templates(target)
+    (target / "leftover.py").write_text("")
+
+    compile_email_templates(target)
+
+    assert not (target / "leftover.py").exists()
+    assert [path.name for path in tmp_path.iterdir()] == ["compiled_templates"]
+
+
+def test_email_env_prefers_compiled_templates(tmp_path, monkeypatch):
+    target = tmp_path / "compiled_templates"
+    compile_email_templates(target)
+    monkeypatch.setattr(base, "COMPILED_TEMPLATES_DIR", target)
+
+    env = base.create_email_env()
+
+    assert env.get_template("login_otp.txt").filename.startswith(str(target))
+    assert "424242" in env.get_template("login_otp.txt").render(**CONTEXT)
@@ -0,0 +1,107 @@
+from email.message import EmailMessage
+
+import aiosmtplib
+import pytest
+
+from backend.app.core.emails import transport
+from backend.app.core.emails.transport import SMTPConnectionPool
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeSMTP:
+    """Stands in for aiosmtplib.SMTP; ``failures`` maps a subject to the error its send raises once."""
+
+    opened: list["FakeSMTP"] = []
+    failures: dict[str, Exception] = {}
+
+    def __init__(self, **kwargs):
+        self.is_connected = False
+        self.sent: list[str] = []
+        FakeSMTP.opened.append(self)
+
+    async def connect(self) -> None:
+        self.is_connected = True
+
+    async def send_message(self, message: EmailMessage) -> None:
+        error = FakeSMTP.failures.pop(message["Subject"], None)
+        if isinstance(error, (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPTimeoutError)):
+            self.is_connected = False
+        if error is not None:
+            raise error
+        self.sent.append(message["Subject"])
+
+    async def quit(self) -> None:
+        self.is_connected = False
+
+    def close(self) -> None:
+        self.is_connected = False
+
+
+@pytest.fixture
+def smtp(monkeypatch):
+    FakeSMTP.opened = []
+    FakeSMTP.failures = {}
+    monkeypatch.setattr(transport.aiosmtplib, "SMTP", FakeSMTP)
+    return FakeSMTP
+
+
+def make_pool(max_messages: int = 100) -> SMTPConnectionPool:
+    return SMTPConnectionPool(host="smtp", port=25, size=2, max_messages=max_messages, max_idle=60, timeout=5)
+
+
+def messages(count: int) -> list[EmailMessage]:
+    return [transport.build_message(["user@example.com"], f"m{i}", "<p>hi</p>", "hi") for i in range(count)]
+
+
+async def test_send_many_reuses_one_session_and_rotates_at_the_message_cap(smtp):
+    pool = make_pool(max_messages=3)
+
+    errors = await pool.send_many(messages(7))
+
+    assert errors == [None] * 7
+    assert [conn.sent for conn in smtp.opened] == [["m0", "m1", "m2"], ["m3", "m4", "m5"], ["m6"]]
+
+
+async def test_rejected_message_does_not_end_the_session(smtp):
+    pool = make_pool()
+    smtp.failures["m1"] = aiosmtplib.SMTPRecipientsRefused([])
+
+    errors = await pool.send_many(messages(3))
+
+    assert errors[0] is None and errors[2] is None
+    assert isinstance(errors[1], aiosmtplib.SMTPRecipientsRefused)
+    assert len(smtp.opened) == 1
+
+
+async def test_timed_out_session_is_dropped_and_the_message_retried(smtp):
+    pool = make_pool()
+    smtp.failures["m1"] = aiosmtplib.SMTPTimeoutError("timed out")
+
+    errors = await pool.send_many(messages(3))
+
+    assert errors == [None, None, None]
+    assert [conn.sent for conn in smtp.opened] == [["m0"], ["m1", "m2"]]
+    assert smtp.opened[0].is_connected is False
+
+
+async def test_reconnect_budget_fails_the_remaining_messages(smtp):
+    pool = make_pool()
+    smtp.failures["m1"] = aiosmtplib.SMTPServerDisconnected("gone")
+
+    errors = await pool.send_many(messages(3), max_reconnects=0)
+
+    assert errors[0] is None
+    assert all(isinstance(error, aiosmtplib.SMTPServerDisconnected) for error in errors[1:])
+
+
+async def test_idle_connections_are_reused_across_sends(smtp):
+    pool = make_pool()
+
+    for message in messages(3):
+        await pool.send(message)
+    await pool.close()
+
+    assert len(smtp.opened) == 1
+    assert smtp.opened[0].sent == ["m0", "m1", "m2"]
+    assert smtp.opened[0].is_connected is False
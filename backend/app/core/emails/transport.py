@@ -0,0 +1,201 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from email.message import EmailMessage
+from email.utils import formataddr
+from typing import Any, AsyncIterator, Coroutine, TypeVar
+
+import aiosmtplib
+from celery.signals import worker_process_init, worker_process_shutdown
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+T = TypeVar("T")
+
+
+def build_message(recipients: list[str], subject: str, html_content: str, plain_content: str) -> EmailMessage:
+    message = EmailMessage()
+    message["Subject"] = subject
+    message["From"] = formataddr((settings.MAIL_FROM_NAME, settings.MAIL_FROM))
+    message["To"] = ", ".join(recipients)
+    message.set_content(plain_content)
+    message.add_alternative(html_content, subtype="html")
+    return message
+
+
+class PooledSMTPConnection:
+    def __init__(self, client: aiosmtplib.SMTP):
+        self.client = client
+        self.messages_sent = 0
+        self.last_used = time.monotonic()
+
+
+class SMTPConnectionPool:
+    """Keeps SMTP sessions open across tasks.
+
+    A connection is closed and replaced after ``max_messages`` sends, after
+    sitting idle for ``max_idle`` seconds, or when a send on it fails.
+    """
+
+    def __init__(self, host: str, port: int, size: int, max_messages: int, max_idle: float, timeout: float):
+        self._host = host
+        self._port = port
+        self._size = size
+        self._max_messages = max_messages
+        self._max_idle = max_idle
+        self._timeout = timeout
+        self._idle: list[PooledSMTPConnection] = []
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def _open(self) -> PooledSMTPConnection:
+        client = aiosmtplib.SMTP(
+            hostname=self._host,
+            port=self._port,
+            timeout=self._timeout,
+            use_tls=False,
+            start_tls=False,
+        )
+        await client.connect()
+        logger.debug(f"Opened SMTP connection to {self._host}:{self._port}")
+        return PooledSMTPConnection(client)
+
+    async def _discard(self, conn: PooledSMTPConnection) -> None:
+        try:
+            if conn.client.is_connected:
+                await conn.client.quit()
+        except Exception:
+            conn.client.close()
+
+    def _is_reusable(self, conn: PooledSMTPConnection) -> bool:
+        return (
+            conn.client.is_connected
+            and conn.messages_sent < self._max_messages
+            and time.monotonic() - conn.last_used < self._max_idle
+        )
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[PooledSMTPConnection]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._size)
+
+        async with self._semaphore:
+            conn = None
+            while self._idle:
+                candidate = self._idle.pop()
+                if self._is_reusable(candidate):
+                    conn = candidate
+                    break
+                await self._discard(candidate)
+            if conn is None:
+                conn = await self._open()
+
+            try:
+                yield conn
+            except BaseException:
+                await self._discard(conn)
+                raise
+
+            conn.last_used = time.monotonic()
+            if self._is_reusable(conn):
+                self._idle.append(conn)
+            else:
+                await self._discard(conn)
+
+    async def send(self, message: EmailMessage) -> None:
+        try:
+            async with self.connection() as conn:
+                await conn.client.send_message(message)
+                conn.messages_sent += 1
+        except aiosmtplib.SMTPServerDisconnected:
+            # The server may drop an idle session between checks; retry once on a fresh one.
+            async with self.connection() as conn:
+                await conn.client.send_message(message)
+                conn.messages_sent += 1
+
+    async def send_many(self, messages: list[EmailMessage], max_reconnects: int = 3) -> list[Exception | None]:
+        """Send messages in order over as few sessions as possible.
+
+        Returns one entry per message: ``None`` if it was accepted, otherwise the
+        error. A rejected message does not end the session; a dropped session is
+        replaced and the interrupted message is retried, up to ``max_reconnects`` times.
+        """
+        errors: list[Exception | None] = [None] * len(messages)
+        index = 0
+        reconnects = 0
+        while index < len(messages):
+            try:
+                async with self.connection() as conn:
+                    while index < len(messages) and conn.messages_sent < self._max_messages:
+                        try:
+                            await conn.client.send_message(messages[index])
+                            conn.messages_sent += 1
+                        except (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPTimeoutError):
+                            # The session is in an unknown state; drop it and retry on a fresh one.
+                            raise
+                        except aiosmtplib.SMTPException as e:
+                            errors[index] = e
+                        index += 1
+            except (
+                aiosmtplib.SMTPServerDisconnected,
+                aiosmtplib.SMTPTimeoutError,
+                aiosmtplib.SMTPConnectError,
+                OSError,
+            ) as e:
+                reconnects += 1
+                logger.warning(f"SMTP session lost after {index}/{len(messages)} messages: {e}")
+                if reconnects > max_reconnects:
+                    for remaining in range(index, len(messages)):
+                        errors[remaining] = e
+                    break
+        return errors
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(self._discard(conn) for conn in idle), return_exceptions=True)
+
+
+class WorkerEventLoop:
+    """One long-lived event loop per worker process, reused by every task instead of asyncio.run()."""
+
+    def __init__(self):
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+        return self._loop.run_until_complete(coro)
+
+    def close(self) -> None:
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.run_until_complete(smtp_pool.close())
+            self._loop.close()
+        self._loop = None
+
+
+smtp_pool = SMTPConnectionPool(
+    host=settings.SMTP_HOST,
+    port=settings.SMTP_PORT,
+    size=settings.SMTP_POOL_SIZE,
+    max_messages=settings.SMTP_POOL_MAX_MESSAGES,
+    max_idle=settings.SMTP_POOL_MAX_IDLE_SECONDS,
+    timeout=settings.SMTP_TIMEOUT_SECONDS,
+)
+
+worker_loop = WorkerEventLoop()
+
+
+@worker_process_init.connect
+def reset_worker_loop(**kwargs: Any) -> None:
+    # A forked child must not reuse the parent's loop or sockets.
+    worker_loop._loop = None
+    smtp_pool._idle = []
+    smtp_pool._semaphore = None
+
+
+@worker_process_shutdown.connect
+def close_worker_loop(**kwargs: Any) -> None:
+    worker_loop.close()
@@ -1,11 +1,22 @@
 import asyncio
+import json
+import os
+import socket
+import time
+from graphlib import CycleError, TopologicalSorter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Callable, Awaitable, Optional
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from sqlalchemy import text
 from backend.app.core.db import async_session
-from backend.app.core.celery_app import celery_app
+from backend.app.core.config import settings
 from backend.app.core.logging import get_logger
+from backend.app.core.metrics import HEALTH_CACHE_EVENTS, HEALTH_PROBE_DURATION
+from backend.app.core.redis_client import get_redis
+from backend.app.core.retry import backoff_delay
+from backend.app.core.singleflight import SingleFlight
+from backend.app.core.worker_registry import get_live_workers
 
 logger = get_logger()
 
@@ -18,6 +29,7 @@ class ServiceStatus(str, Enum):
 
 
 class HealthCheck:
+    REFRESH_KEY = "check_all_services"
 
     def __init__(self):
         self._services: Dict[str, ServiceStatus] = {}
@@ -28,10 +40,22 @@ class HealthCheck:
         self._max_retries: Dict [str, int] = {}
         self._lock = asyncio.Lock()
         self._dependencies: Dict[str, set[str]] = {}
+        self._probe_intervals: Dict[str, float] = {}
+        self._probe_tasks: Dict[str, asyncio.Task] = {}
+        self._worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._probe_executor: Optional[ThreadPoolExecutor] = None
 
         self._cache_duration: timedelta = timedelta(seconds=25)
+        self._stale_while_revalidate: timedelta = timedelta(
+            seconds=settings.HEALTH_STALE_WHILE_REVALIDATE_SECONDS
+        )
         self._cached_status: Optional[Dict[str, Any]] = None
         self._last_check_time: Optional[datetime] = None
+        self._refresh_flight = SingleFlight("health_refresh")
+        self._background_refresh: Optional[asyncio.Task] = None
+        self._cache_stats: Dict[str, int] = {
+            "hits": 0, "stale_hits": 0, "refreshes": 0, "coalesced_waits": 0
+        }
 
     async def validate_dependencies(self, 
         service_name: str, 
@@ -44,6 +68,15 @@ class HealthCheck:
             if dependency not in self._services:
                 raise ValueError(f"Dependency {dependency} not registered for service {service_name}")
 
+        graph = {name: set(deps) for name, deps in self._dependencies.items()}
+        graph[service_name] = set(depends_on)
+        try:
+            TopologicalSorter(graph).prepare()
+        except CycleError as e:
+            raise ValueError(
+                f"Dependencies {depends_on} for service {service_name} would create a cycle: {e.args[1]}"
+            )
+
     async def add_service(
         self, 
         service_name: str, 
@@ -51,17 +84,20 @@ class HealthCheck:
         timeout: float=5.0, 
         retry_delay: float=1.0, 
         max_retries: int=3, 
-        depends_on: list[str] | None = None
+        depends_on: list[str] | None = None,
+        probe_interval: float | None = None,
     ) -> None:
+        await self.validate_dependencies(service_name, depends_on)
+
         self._services[service_name] = ServiceStatus.STARTING
         self._check_functions[service_name] = check_function  # Corroutines
         self._timeouts[service_name] = timeout
         self._retry_delays[service_name] = retry_delay
         self._max_retries[service_name] = max_retries
+        self._probe_intervals[service_name] = probe_interval or settings.HEALTH_PROBE_INTERVAL_SECONDS
         self._last_check[service_name] = datetime.now(timezone.utc)
 
         if depends_on:
-            await self.validate_dependencies(service_name, depends_on)
             self._dependencies[service_name] = set(depends_on)
             logger.info(
                 f"Service '{service_name}' registered with dependencies: {depends_on}"
@@ -80,51 +116,151 @@ class HealthCheck:
 
     async def check_redis(self) -> bool:
         try:
-            redis_client = celery_app.backend.client
-            redis_client.ping()
+            await get_redis().ping()
             self._last_check["redis"] = datetime.now(timezone.utc)
             return True
         except Exception as e:
             logger.error(f"Redis health check failed: {e}")
             return False
-        
+
+    @staticmethod
+    def _ping_broker(connect_timeout: float) -> None:
+        # Imported here so the API process only builds the Celery app if this fallback runs.
+        from backend.app.core.celery_app import celery_app
+
+        conn = celery_app.connection(connect_timeout=connect_timeout)
+        try:
+            conn.ensure_connection(max_retries=1, timeout=connect_timeout)
+        finally:
+            conn.close()
+
+    async def _run_blocking_probe(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking client call on the probe thread pool so the event loop stays free."""
+        if self._probe_executor is None:
+            self._probe_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="health-probe")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._probe_executor, func, *args)
+
     async def check_celery(self) -> bool:
         try:
-            inspect = celery_app.control.inspect()
-            workers = inspect.ping()
+            workers = await get_live_workers()
 
             if not workers:
-                conn = celery_app.connection()
-                try:
-                    conn.ensure_connection(max_retries=3)
-                    logger.warning("No celery workers found, but Rabbitmq is reachable.")
-                    self._last_check["celery"] = datetime.now(timezone.utc)
-                    return True
-                finally:
-                    conn.close()
+                await self._run_blocking_probe(self._ping_broker, self._timeouts.get("celery", 5.0) / 2)
+                logger.warning("No celery worker heartbeats found, but Rabbitmq is reachable.")
             self._last_check["celery"] = datetime.now(timezone.utc)
             return True
         except Exception as e:
             logger.error(f"Celery health check failed: {e}")
             return False
         
+    def _dependency_closure(self, services: list[str]) -> Dict[str, set[str]]:
+        graph: Dict[str, set[str]] = {}
+        pending = list(services)
+        while pending:
+            name = pending.pop()
+            if name in graph:
+                continue
+            if name not in self._check_functions:
+                raise ValueError(f"Unknown service {name}")
+            graph[name] = set(self._dependencies.get(name, ()))
+            pending.extend(graph[name])
+        return graph
+
+    async def _mark_degraded(self, service_name: str, dependency: str) -> ServiceStatus:
+        async with self._lock:
+            self._services[service_name] = ServiceStatus.DEGRADED
+            self._last_check[service_name] = datetime.now(timezone.utc)
+        logger.error(
+            f"Service '{service_name}' is degraded due to unhealthy dependency '{dependency}'"
+        )
+        return ServiceStatus.DEGRADED
+
+    async def _evaluate_after(self, service_name: str, dependency_tasks: Dict[str, asyncio.Task]) -> ServiceStatus:
+        dependency_results = await asyncio.gather(*dependency_tasks.values(), return_exceptions=True)
+        for dependency, result in zip(dependency_tasks, dependency_results):
+            if result != ServiceStatus.HEALTHY:
+                return await self._mark_degraded(service_name, dependency)
+        return await self._probe_service(service_name)
+
+    async def evaluate_services(self, services: list[str] | None = None) -> Dict[str, ServiceStatus | BaseException]:
+        """Probe ``services`` and their dependencies once each, in dependency order.
+
+        Services whose dependencies have finished start immediately, so
+        independent probes run in parallel. A service with an unhealthy
+        dependency is marked degraded without being probed.
+        """
+        async with self._lock:
+            graph = self._dependency_closure(services if services is not None else list(self._services))
+
+        tasks: Dict[str, asyncio.Task] = {}
+        for name in TopologicalSorter(graph).static_order():
+            tasks[name] = asyncio.create_task(
+                self._evaluate_after(name, {dep: tasks[dep] for dep in graph[name]})
+            )
+
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        return dict(zip(tasks, results))
+
     async def check_service_health(self, 
         service_name: str, 
-        max_retries: int=3
+        probe_dependencies: bool = True,
     ) -> ServiceStatus:
-        if service_name in self._dependencies:
-            for dep in self._dependencies[service_name]:
-                dep_status = await self.check_service_health(dep)
+        """Check one service. Dependencies are probed first unless ``probe_dependencies`` is
+        False, in which case their shared status from the Redis snapshot is used."""
+        if probe_dependencies:
+            result = (await self.evaluate_services([service_name]))[service_name]
+            if isinstance(result, BaseException):
+                raise result
+            return result
 
-                if dep_status != ServiceStatus.HEALTHY:
-                    logger.error(
-                        f"Service '{service_name}' is degraded due to unhealthy dependency '{dep}'"
-                    )
-                    return ServiceStatus.DEGRADED
-        
+        dependencies = sorted(self._dependencies.get(service_name, ()))
+        statuses = await self._shared_statuses(dependencies)
+        for dep in dependencies:
+            if statuses[dep] != ServiceStatus.HEALTHY:
+                return await self._mark_degraded(service_name, dep)
+        return await self._probe_service(service_name)
+
+    async def _shared_statuses(self, services: list[str]) -> Dict[str, ServiceStatus]:
+        """Status of ``services`` as last published by whichever worker probed them.
+
+        A missing or stale snapshot counts as not healthy. The local status is
+        only used when Redis itself is unreachable.
+        """
+        if not services:
+            return {}
+        try:
+            raw_snapshots = await get_redis().mget([self._snapshot_key(s) for s in services])
+        except Exception as e:
+            logger.warning(f"Health snapshot unavailable, using local dependency status: {e}")
+            return {service: self._services.get(service, ServiceStatus.STARTING) for service in services}
+
+        current_time = datetime.now(timezone.utc)
+        statuses: Dict[str, ServiceStatus] = {}
+        for service, raw in zip(services, raw_snapshots):
+            if raw is None:
+                statuses[service] = ServiceStatus.STARTING
+                continue
+            snapshot = json.loads(raw)
+            age = (current_time - datetime.fromisoformat(snapshot["last_check"])).total_seconds()
+            if age > self._probe_intervals[service] * 2:
+                statuses[service] = ServiceStatus.STARTING
+            else:
+                statuses[service] = ServiceStatus(snapshot["status"])
+        return statuses
+
+    async def _probe_service(self, service_name: str, max_retries: int = 3) -> ServiceStatus:
         if service_name not in self._check_functions:
             raise ValueError(f"Unknown service {service_name}")
-    
+
+        started_at = time.perf_counter()
+        result = await self._run_probe(service_name, max_retries)
+        HEALTH_PROBE_DURATION.labels(service=service_name, status=result.value).observe(
+            time.perf_counter() - started_at
+        )
+        return result
+
+    async def _run_probe(self, service_name: str, max_retries: int) -> ServiceStatus:
         check_function = self._check_functions[service_name]
         timeout = self._timeouts.get(service_name, 5.0)
         max_retries = self._max_retries.get(service_name, max_retries)
@@ -177,20 +313,54 @@ class HealthCheck:
             )
         return ServiceStatus.UNHEALTHY
     
+    def _record_cache_event(self, event: str) -> None:
+        self._cache_stats[event] += 1
+        HEALTH_CACHE_EVENTS.labels(event=event).inc()
+
+    def _log_background_refresh(self, task: asyncio.Task) -> None:
+        self._background_refresh = None
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background health refresh failed: {task.exception()}")
+
     async def check_all_services(self) -> Dict[str, Any]:
+        """Return the cached status, refreshing it at most once at a time.
+
+        Within the cache window the cached value is returned. Within the
+        stale-while-revalidate window after it, the stale value is returned and
+        a single background refresh is started. Past that, callers wait on the
+        one in-flight refresh.
+        """
+        if self._cached_status is not None and self._last_check_time is not None:
+            age = datetime.now(timezone.utc) - self._last_check_time
+            if age < self._cache_duration:
+                self._record_cache_event("hits")
+                return self._cached_status
+
+            if age < self._cache_duration + self._stale_while_revalidate:
+                self._record_cache_event("stale_hits")
+                if not self._refresh_flight.in_flight(self.REFRESH_KEY):
+                    self._background_refresh = asyncio.create_task(
+                        self._refresh_flight.do(self.REFRESH_KEY, self._refresh_all_services)
+                    )
+                    self._background_refresh.add_done_callback(self._log_background_refresh)
+                return self._cached_status
+
+        if self._refresh_flight.in_flight(self.REFRESH_KEY):
+            self._record_cache_event("coalesced_waits")
+        return await self._refresh_flight.do(self.REFRESH_KEY, self._refresh_all_services)
+
+    def cache_stats(self) -> Dict[str, int]:
+        return dict(self._cache_stats)
+
+    async def _refresh_all_services(self) -> Dict[str, Any]:
+        self._record_cache_event("refreshes")
         current_time = datetime.now(timezone.utc)
-        if (
-            self._cached_status is not None
-            and self._last_check_time is not None
-            and (current_time - self._last_check_time) < self._cache_duration
-        ):
-            return self._cached_status
-        
+
         async with self._lock:
             services = list(self._services.keys())
 
-        tasks = [self.check_service_health(service) for service in services]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        evaluated = await self.evaluate_services(services)
+        results = [evaluated[service] for service in services]
 
         health_status = {
             "status" : ServiceStatus.HEALTHY,
@@ -218,20 +388,151 @@ class HealthCheck:
         self._last_check_time = current_time
         return health_status
     
-    async def wait_for_services(self, timeout: float=30.0) -> bool:
+    @staticmethod
+    def _snapshot_key(service_name: str) -> str:
+        return f"health:service:{service_name}"
+
+    async def _acquire_probe_lease(self, service_name: str) -> bool:
+        """Let only one worker probe a service per interval; probe locally if Redis is unreachable."""
+        interval = self._probe_intervals[service_name]
+        try:
+            acquired = await get_redis().set(
+                f"health:lease:{service_name}",
+                self._worker_id,
+                nx=True,
+                px=int(interval * 1000),
+            )
+            return bool(acquired)
+        except Exception as e:
+            logger.warning(f"Health probe lease for '{service_name}' unavailable, probing locally: {e}")
+            return True
+
+    async def _publish_status(self, service_name: str, status: ServiceStatus) -> None:
+        interval = self._probe_intervals[service_name]
+        snapshot = {
+            "status": status,
+            "last_check": self._last_check[service_name].isoformat(),
+            "checked_by": self._worker_id,
+            "probe_interval": interval,
+        }
+        ttl = max(int(interval * 3), settings.HEALTH_SNAPSHOT_TTL_SECONDS)
+        try:
+            await get_redis().set(self._snapshot_key(service_name), json.dumps(snapshot), ex=ttl)
+        except Exception as e:
+            logger.warning(f"Failed to publish health status for '{service_name}': {e}")
+
+    async def _probe_loop(self, service_name: str) -> None:
+        interval = self._probe_intervals[service_name]
+        while True:
+            try:
+                if await self._acquire_probe_lease(service_name):
+                    status = await self.check_service_health(service_name, probe_dependencies=False)
+                    await self._publish_status(service_name, status)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Background health probe for '{service_name}' failed: {e}")
+            await asyncio.sleep(interval)
+
+    async def start_background_probes(self) -> None:
+        async with self._lock:
+            services = [s for s in self._services if s not in self._probe_tasks]
+        for service_name in services:
+            self._probe_tasks[service_name] = asyncio.create_task(
+                self._probe_loop(service_name), name=f"health-probe-{service_name}"
+            )
+        logger.info(f"Background health probes started for {services}")
+
+    async def stop_background_probes(self) -> None:
+        tasks = list(self._probe_tasks.values())
+        self._probe_tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def get_snapshot(self) -> Dict[str, Any]:
+        """Read the latest published status of every service with a single MGET."""
+        async with self._lock:
+            services = list(self._services.keys())
+
         try:
-            start_time = datetime.now(timezone.utc)
-            while (datetime.now(timezone.utc) - start_time) < timedelta(seconds=timeout):
-                status = await self.check_all_services()
-                if status["status"] == ServiceStatus.HEALTHY:
+            raw_snapshots = await get_redis().mget([self._snapshot_key(s) for s in services]) if services else []
+        except Exception as e:
+            logger.warning(f"Health snapshot unavailable, probing inline: {e}")
+            return await self.check_all_services()
+
+        current_time = datetime.now(timezone.utc)
+        health_status = {
+            "status" : ServiceStatus.HEALTHY,
+            "timestamp" : current_time.isoformat(),
+            "services" : {}
+        }
+
+        for service, raw in zip(services, raw_snapshots):
+            stale_after = self._probe_intervals[service] * 2
+            if raw is None:
+                health_status["services"][service] = {
+                    "status" : self._services[service],
+                    "last_check" : self._last_check[service].isoformat(),
+                    "age_seconds" : None,
+                    "stale" : True,
+                }
+                health_status["status"] = ServiceStatus.DEGRADED
+                continue
+
+            snapshot = json.loads(raw)
+            age = (current_time - datetime.fromisoformat(snapshot["last_check"])).total_seconds()
+            is_stale = age > stale_after
+            health_status["services"][service] = {
+                "status" : snapshot["status"],
+                "last_check" : snapshot["last_check"],
+                "age_seconds" : round(age, 3),
+                "stale" : is_stale,
+            }
+            if snapshot["status"] != ServiceStatus.HEALTHY or is_stale:
+                health_status["status"] = ServiceStatus.DEGRADED
+
+        return health_status
+
+    async def wait_for_services(self, 
+        timeout: float=30.0, 
+        backoff_base: float=0.25, 
+        backoff_max: float=5.0
+    ) -> bool:
+        """Re-probe all services, bypassing the status cache, until healthy or ``timeout``.
+
+        Attempts are spaced with jittered exponential backoff.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            attempt = 0
+            while True:
+                results = await self.evaluate_services()
+                unhealthy = [name for name, result in results.items() if result != ServiceStatus.HEALTHY]
+                if not unhealthy:
                     return True
-                await asyncio.sleep(1)
-            return False
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    logger.error(f"Services still unhealthy after {timeout} seconds: {unhealthy}")
+                    return False
+
+                delay = min(remaining, backoff_delay(attempt, backoff_base, backoff_max))
+                logger.warning(f"Services not healthy yet: {unhealthy}. Retrying in {delay:.2f} seconds...")
+                await asyncio.sleep(delay)
+                attempt += 1
         except Exception as e:  
             logger.error(f"Error while waiting for services to be healthy: {e}")
             return False
         
     async def cleanup(self) -> None:
+        await self.stop_background_probes()
+        if self._background_refresh is not None:
+            self._background_refresh.cancel()
+        if self._probe_executor is not None:
+            self._probe_executor.shutdown(wait=False, cancel_futures=True)
+            self._probe_executor = None
         async with self._lock:
             self._services.clear()
             self._check_functions.clear()
@@ -240,6 +541,7 @@ class HealthCheck:
             self._retry_delays.clear()
             self._max_retries.clear()
             self._dependencies.clear()
+            self._probe_intervals.clear()
             self._cached_status = None
             self._last_check_time = None
 
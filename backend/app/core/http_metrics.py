@@ -0,0 +1,95 @@
+import asyncio
+import os
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT
+
+logger = get_logger()
+
+
+class PrometheusMiddleware:
+    """Records per-route latency and in-flight requests.
+
+    Requests are labelled with the matched route template (``/users/{user_id}``)
+    rather than the raw path so label cardinality stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp, excluded_paths: tuple[str, ...] = ("/metrics",)):
+        self.app = app
+        self.excluded_paths = excluded_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight = HTTP_REQUESTS_IN_FLIGHT.labels(method=method)
+        in_flight.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_flight.dec()
+            route = getattr(scope.get("route"), "path", "unmatched")
+            HTTP_REQUEST_DURATION.labels(method=method, route=route, status=str(status_code)).observe(
+                time.perf_counter() - started_at
+            )
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Render the exposition, aggregating every worker process in multiprocess mode."""
+    from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest, multiprocess
+
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead() -> None:
+    """Drop this process's live gauges from the multiprocess aggregate on shutdown."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(os.getpid())
+
+
+class QueueDepthRefresher:
+    """Refreshes the Celery queue depth gauges from the broker at most once per interval."""
+
+    def __init__(self, interval: float):
+        self._interval = interval
+        self._refreshed_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def maybe_refresh(self) -> None:
+        if time.monotonic() - self._refreshed_at < self._interval or self._lock.locked():
+            return
+
+        async with self._lock:
+            # Imports the Celery app, so keep it off the API import path.
+            from backend.app.core.queue_metrics import get_queue_depths
+
+            try:
+                await asyncio.to_thread(get_queue_depths)
+            except Exception as e:
+                logger.warning(f"Failed to refresh queue depth metrics: {e}")
+            self._refreshed_at = time.monotonic()
+
+
+queue_depth_refresher = QueueDepthRefresher(settings.METRICS_QUEUE_DEPTH_REFRESH_SECONDS)
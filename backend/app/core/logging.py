@@ -1,4 +1,10 @@
+import json
 import os
+import queue
+import random
+import sys
+import threading
+import zipfile
 from loguru import logger
 from backend.app.core.config import settings
 
@@ -13,26 +19,107 @@ LOG_FORMAT = (
     "{message}"
 )
 
-logger.add(
-    sink=os.path.join(LOG_DIR, "debug.log"),
-    format=LOG_FORMAT,
-    level="DEBUG" if settings.ENVIRONMENT == "local" else "INFO",
-    filter= lambda record: record["level"].no <= logger.level("WARNING").no,
-    rotation="10MB",
-    compression="zip",
-    retention="30 days",
-)
+_compression_queue: "queue.Queue[str]" = queue.Queue()
+_compression_worker: threading.Thread | None = None
+_compression_worker_lock = threading.Lock()
 
-logger.add(
-    sink=os.path.join(LOG_DIR, "error.log"),
-    format=LOG_FORMAT,
-    level="ERROR",
-    rotation="10MB",
-    compression="zip",
-    retention="30 days",
-    backtrace=True,
-    diagnose=True,
-)
+def _compress_rotated_files() -> None:
+    while True:
+        path = _compression_queue.get()
+        try:
+            with zipfile.ZipFile(f"{path}.zip", "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                archive.write(path, arcname=os.path.basename(path))
+            os.remove(path)
+        except OSError as e:
+            # Keep the uncompressed file rather than a partial archive.
+            if os.path.exists(f"{path}.zip"):
+                os.remove(f"{path}.zip")
+            logger.opt(exception=e).error(f"Failed to compress rotated log {path}")
+        finally:
+            _compression_queue.task_done()
+
+def _compress_in_background(path: str) -> None:
+    """Hand a rotated file to the single compression thread so the logging thread keeps draining."""
+    global _compression_worker
+    with _compression_worker_lock:
+        if _compression_worker is None or not _compression_worker.is_alive():
+            _compression_worker = threading.Thread(target=_compress_rotated_files, name="log-compression", daemon=True)
+            _compression_worker.start()
+    _compression_queue.put(path)
+
+def _longest_prefix_match(name: str | None, table: dict) -> object | None:
+    """Return the value whose key is the longest dotted prefix of ``name``."""
+    name = name or ""
+    best = None
+    for prefix, value in table.items():
+        if (name == prefix or name.startswith(f"{prefix}.")) and (best is None or len(prefix) > len(best[0])):
+            best = (prefix, value)
+    return best[1] if best else None
+
+_LEVEL_OVERRIDES = {prefix: logger.level(level.upper()).no for prefix, level in settings.LOG_LEVEL_OVERRIDES.items()}
+_WARNING_NO = logger.level("WARNING").no
+
+def _passes_overrides_and_sampling(record: dict) -> bool:
+    minimum = _longest_prefix_match(record["name"], _LEVEL_OVERRIDES)
+    if minimum is not None and record["level"].no < minimum:
+        return False
+
+    if record["level"].no < _WARNING_NO:
+        rate = _longest_prefix_match(record["name"], settings.LOG_SAMPLE_RATES)
+        if rate is not None and random.random() >= rate:
+            return False
+    return True
+
+def _json_format(record: dict) -> str:
+    entry = {
+        "ts": record["time"].isoformat(),
+        "level": record["level"].name,
+        "logger": record["name"],
+        "func": record["function"],
+        "line": record["line"],
+        "msg": record["message"],
+    }
+    if record["exception"] is not None:
+        entry["exc"] = f"{record['exception'].type.__name__}: {record['exception'].value}"
+    # Returned text is itself a format string, so route the JSON through extra to avoid brace parsing.
+    record["extra"]["_json"] = json.dumps(entry, separators=(",", ":"), default=str)
+    return "{extra[_json]}\n"
+
+_default_level = "DEBUG" if settings.ENVIRONMENT == "local" else "INFO"
+
+if settings.LOG_FILE_SINKS:
+    logger.add(
+        sink=os.path.join(LOG_DIR, "debug.log"),
+        format=LOG_FORMAT,
+        level=_default_level,
+        filter=lambda record: record["level"].no <= _WARNING_NO and _passes_overrides_and_sampling(record),
+        rotation="10MB",
+        compression=_compress_in_background,
+        retention="30 days",
+        enqueue=settings.LOG_ENQUEUE,
+    )
+
+    logger.add(
+        sink=os.path.join(LOG_DIR, "error.log"),
+        format=LOG_FORMAT,
+        level="ERROR",
+        rotation="10MB",
+        compression=_compress_in_background,
+        retention="30 days",
+        backtrace=True,
+        # Variable values in tracebacks are costly to collect and may leak secrets outside local.
+        diagnose=settings.ENVIRONMENT == "local",
+        enqueue=settings.LOG_ENQUEUE,
+    )
+
+if settings.LOG_JSON_STDOUT:
+    logger.add(
+        sink=sys.stdout,
+        format=_json_format,
+        level=_default_level,
+        filter=_passes_overrides_and_sampling,
+        enqueue=settings.LOG_ENQUEUE,
+    )
 
 def get_logger():
-    return logger
\ No newline at end of file
+    return logger
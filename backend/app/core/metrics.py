@@ -0,0 +1,118 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Time spent hashing or verifying a password on the process pool.",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+PASSWORD_HASH_QUEUE_WAIT = Histogram(
+    "password_hash_queue_wait_seconds",
+    "Time a password hashing call waited for an admission slot.",
+    ["operation"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0),
+)
+
+PASSWORD_HASH_IN_FLIGHT = Gauge(
+    "password_hash_in_flight",
+    "Password hashing calls currently running on the process pool.",
+    multiprocess_mode="livesum",
+)
+
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Password hashing calls rejected because the admission queue timed out.",
+    ["operation"],
+)
+
+USER_CACHE_REQUESTS = Counter(
+    "user_cache_requests_total",
+    "User cache lookups by tier and result.",
+    ["tier", "result"],
+)
+
+SINGLEFLIGHT_CALLS = Counter(
+    "singleflight_calls_total",
+    "Calls through a single-flight group, split into leaders and coalesced waiters.",
+    ["name", "role"],
+)
+
+HEALTH_CACHE_EVENTS = Counter(
+    "health_cache_events_total",
+    "Health status cache events: hits, stale_hits, refreshes and coalesced_waits.",
+    ["event"],
+)
+
+OUTBOX_MESSAGES = Counter(
+    "outbox_messages_total",
+    "Outbox messages handled by the relay: published, failed (will be retried) and dead (attempts exhausted).",
+    ["result"],
+)
+
+CELERY_QUEUE_WAIT = Histogram(
+    "celery_queue_wait_seconds",
+    "Time a task spent in its queue between publish and the start of execution.",
+    ["queue"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 300.0),
+)
+
+CELERY_QUEUE_DEPTH = Gauge(
+    "celery_queue_depth",
+    "Messages ready in each Celery queue as last reported by the broker.",
+    ["queue"],
+    multiprocess_mode="mostrecent",
+)
+
+CELERY_QUEUE_CONSUMERS = Gauge(
+    "celery_queue_consumers",
+    "Consumers attached to each Celery queue as last reported by the broker.",
+    ["queue"],
+    multiprocess_mode="mostrecent",
+)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template, method and status code.",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being handled.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Database connections currently checked out of the pool.",
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Database connections open beyond the pool size.",
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting to check a connection out of the pool, including connecting.",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+
+HEALTH_PROBE_DURATION = Histogram(
+    "health_probe_duration_seconds",
+    "Duration of a health probe including retries, by service and resulting status.",
+    ["service", "status"],
+    buckets=(0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 15.0),
+)
+
+EMAIL_ENQUEUE_DURATION = Histogram(
+    "email_enqueue_duration_seconds",
+    "Time to render and hand an email to the broker or outbox, by template and path.",
+    ["template", "path"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
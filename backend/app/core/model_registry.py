@@ -1,11 +1,17 @@
+import argparse
 import importlib
+import json
 import os
 import pathlib
+import sys
 
+from backend.app.core.config import settings
 from backend.app.core.logging import get_logger
 
 logger = get_logger()
 
+MANIFEST_PATH = pathlib.Path(__file__).parent / "model_manifest.json"
+
 def discover_models() -> list[str]:
     models_modules = []
     root_path = pathlib.Path(__file__).parent.parent
@@ -28,13 +34,69 @@ def discover_models() -> list[str]:
 
             models_modules.append(full_module_path)
 
-    return models_modules
+    return sorted(models_modules)
+
+def read_manifest() -> list[str] | None:
+    try:
+        return json.loads(MANIFEST_PATH.read_text())["modules"]
+    except FileNotFoundError:
+        return None
+
+def write_manifest(modules: list[str]) -> None:
+    MANIFEST_PATH.write_text(json.dumps({"modules": modules}, indent=2) + "\n")
+
+def stale_manifest_entries() -> tuple[list[str], list[str]]:
+    """Return (missing, extra) modules of the manifest compared with a fresh walk."""
+    manifest = set(read_manifest() or [])
+    discovered = set(discover_models())
+    return sorted(discovered - manifest), sorted(manifest - discovered)
+
+def resolve_model_modules() -> list[str]:
+    modules = read_manifest()
+    if modules is not None:
+        return modules
+
+    if settings.ENVIRONMENT == "local":
+        logger.warning(f"Model manifest {MANIFEST_PATH} not found; walking the source tree instead.")
+        return discover_models()
+
+    raise RuntimeError(
+        f"Model manifest {MANIFEST_PATH} not found. "
+        "Generate it with `python -m backend.app.core.model_registry --write`."
+    )
 
 def load_models() -> None:
-    modules = discover_models()
+    modules = resolve_model_modules()
     for module_path in modules:
         try:
             importlib.import_module(module_path)
             logger.debug(f"Successfully imported models module: {module_path}")
         except ImportError as e:
-            logger.error(f"Failed to import models module {module_path}: {e}")
\ No newline at end of file
+            logger.error(f"Failed to import models module {module_path}: {e}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Manage the SQLModel model manifest.")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--write", action="store_true", help="Regenerate the manifest from the source tree.")
+    group.add_argument("--check", action="store_true", help="Fail if the manifest is missing or stale.")
+    args = parser.parse_args()
+
+    if args.write:
+        modules = discover_models()
+        write_manifest(modules)
+        print(f"Wrote {len(modules)} models modules to {MANIFEST_PATH}")
+        return
+
+    if read_manifest() is None:
+        print(f"Model manifest {MANIFEST_PATH} is missing.", file=sys.stderr)
+        sys.exit(1)
+
+    missing, extra = stale_manifest_entries()
+    if missing or extra:
+        print(f"Model manifest is stale. Missing: {missing}. Extra: {extra}.", file=sys.stderr)
+        print("Run `python -m backend.app.core.model_registry --write`.", file=sys.stderr)
+        sys.exit(1)
+    print("Model manifest is up to date.")
+
+if __name__ == "__main__":
+    main()
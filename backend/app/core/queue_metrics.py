@@ -0,0 +1,77 @@
+import os
+import time
+from typing import Any
+
+from celery.signals import before_task_publish, task_prerun, worker_process_shutdown, worker_ready
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.metrics import CELERY_QUEUE_CONSUMERS, CELERY_QUEUE_DEPTH, CELERY_QUEUE_WAIT
+
+logger = get_logger()
+
+ENQUEUED_AT_HEADER = "enqueued_at"
+
+
+@before_task_publish.connect
+def stamp_enqueued_at(headers: dict | None = None, **kwargs: Any) -> None:
+    if headers is not None:
+        headers.setdefault(ENQUEUED_AT_HEADER, time.time())
+
+
+@task_prerun.connect
+def observe_queue_wait(task: Any = None, **kwargs: Any) -> None:
+    request = getattr(task, "request", None)
+    enqueued_at = getattr(request, ENQUEUED_AT_HEADER, None)
+    if enqueued_at is None:
+        return
+
+    delivery_info = getattr(request, "delivery_info", None) or {}
+    queue = delivery_info.get("routing_key") or "unknown"
+    # Clamp clock skew between the publishing host and this worker.
+    CELERY_QUEUE_WAIT.labels(queue=queue).observe(max(time.time() - float(enqueued_at), 0.0))
+
+
+@worker_ready.connect
+def start_metrics_exporter(**kwargs: Any) -> None:
+    """Serve the metrics of every pool process from the worker's main process."""
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ or not settings.CELERY_METRICS_PORT:
+        return
+
+    from prometheus_client import CollectorRegistry, multiprocess, start_http_server
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    start_http_server(settings.CELERY_METRICS_PORT, registry=registry)
+    logger.info(f"Worker metrics exporter listening on port {settings.CELERY_METRICS_PORT}")
+
+
+@worker_process_shutdown.connect
+def mark_pool_process_dead(pid: int | None = None, **kwargs: Any) -> None:
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+
+def get_queue_depths() -> dict[str, dict[str, int]]:
+    """Ask the broker for the ready messages and consumers of every configured queue.
+
+    Blocking; call it from a thread. Also updates the queue depth gauges.
+    """
+    from backend.app.core.celery_app import celery_app
+
+    depths = {}
+    with celery_app.connection_for_read() as connection:
+        for queue in celery_app.conf.task_queues:
+            try:
+                # A failed passive declare closes its channel, so each queue gets its own.
+                with connection.channel() as channel:
+                    _, messages, consumers = queue.bind(channel).queue_declare(passive=True)
+            except Exception as e:
+                logger.warning(f"Failed to read depth of queue {queue.name}: {e}")
+                continue
+            depths[queue.name] = {"messages": messages, "consumers": consumers}
+            CELERY_QUEUE_DEPTH.labels(queue=queue.name).set(messages)
+            CELERY_QUEUE_CONSUMERS.labels(queue=queue.name).set(consumers)
+    return depths
@@ -0,0 +1,91 @@
+import time
+import uuid
+from dataclasses import dataclass
+
+from backend.app.core.redis_client import get_redis
+
+RATE_LIMIT_KEY_PREFIX = "ratelimit:"
+
+# Sliding-window log over several keys at once: the hit is only recorded if every
+# window still has room, so one caller cannot consume the per-email budget while
+# being rejected by the global one.
+SLIDING_WINDOW_HIT = """
+local now = tonumber(ARGV[1])
+local member = ARGV[2]
+for i = 1, #KEYS do
+    local window = tonumber(ARGV[1 + 2 * i])
+    local limit = tonumber(ARGV[2 + 2 * i])
+    redis.call('ZREMRANGEBYSCORE', KEYS[i], '-inf', now - window)
+    if redis.call('ZCARD', KEYS[i]) >= limit then
+        local oldest = redis.call('ZRANGE', KEYS[i], 0, 0, 'WITHSCORES')
+        return {i, math.max(tonumber(oldest[2]) + window - now, 1)}
+    end
+end
+for i = 1, #KEYS do
+    redis.call('ZADD', KEYS[i], now, member)
+    redis.call('PEXPIRE', KEYS[i], tonumber(ARGV[1 + 2 * i]))
+end
+return {0, 0}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    name: str
+    key: str
+    limit: int
+    window_seconds: float
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    limit_name: str | None = None
+    retry_after_seconds: float = 0.0
+
+
+class SlidingWindowLimiter:
+    """Atomic sliding-window rate limits kept in Redis sorted sets."""
+
+    def __init__(self):
+        self._hit_script = None
+
+    async def hit(self, *limits: RateLimit) -> RateLimitResult:
+        redis = get_redis()
+        if self._hit_script is None:
+            self._hit_script = redis.register_script(SLIDING_WINDOW_HIT)
+
+        now_ms = int(time.time() * 1000)
+        args: list[int | str] = [now_ms, f"{now_ms}-{uuid.uuid4().hex}"]
+        for limit in limits:
+            args.extend([int(limit.window_seconds * 1000), limit.limit])
+
+        index, retry_after_ms = await self._hit_script(
+            keys=[f"{RATE_LIMIT_KEY_PREFIX}{limit.key}" for limit in limits], args=args, client=redis
+        )
+        if index == 0:
+            return RateLimitResult(allowed=True)
+        return RateLimitResult(
+            allowed=False,
+            limit_name=limits[index - 1].name,
+            retry_after_seconds=retry_after_ms / 1000,
+        )
+
+    async def record(self, key: str, window_seconds: float) -> int:
+        """Add an event to ``key`` and return how many fall inside the window."""
+        now_ms = int(time.time() * 1000)
+        window_ms = int(window_seconds * 1000)
+        redis_key = f"{RATE_LIMIT_KEY_PREFIX}{key}"
+        async with get_redis().pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(redis_key, "-inf", now_ms - window_ms)
+            pipe.zadd(redis_key, {f"{now_ms}-{uuid.uuid4().hex}": now_ms})
+            pipe.zcard(redis_key)
+            pipe.pexpire(redis_key, window_ms)
+            _, _, count, _ = await pipe.execute()
+        return count
+
+    async def reset(self, *keys: str) -> None:
+        await get_redis().delete(*(f"{RATE_LIMIT_KEY_PREFIX}{key}" for key in keys))
+
+
+rate_limiter = SlidingWindowLimiter()
@@ -0,0 +1,27 @@
+from redis.asyncio import Redis
+
+from backend.app.core.config import settings
+
+_redis: Redis | None = None
+
+
+def get_redis() -> Redis:
+    """Return the process-wide async Redis client, creating it on first use."""
+    global _redis
+    if _redis is None:
+        _redis = Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            decode_responses=True,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        )
+    return _redis
+
+
+async def close_redis() -> None:
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
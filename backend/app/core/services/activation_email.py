@@ -1,3 +1,4 @@
+from sqlmodel.ext.asyncio.session import AsyncSession
 from backend.app.core.config import settings
 from backend.app.core.emails.base import EmailTemplate
 
@@ -5,8 +6,9 @@ class ActivationEmail(EmailTemplate):
     template_name = "activation.html"
     template_name_plain = "activation.txt"
     subject = "Activate Your Account"
+    priority = 7
 
-async def send_activation_email(email_to: str, token: str) -> None:
+async def send_activation_email(email_to: str, token: str, session: AsyncSession | None = None) -> None:
     activation_url = (
         f"{settings.API_BASE_URL}{settings.API_V1_STR}/auth/activate/{token}"
     )
@@ -19,4 +21,5 @@ async def send_activation_email(email_to: str, token: str) -> None:
     await ActivationEmail.send_email(
         email_to=email_to, 
         context=context,
+        session=session,
     )
\ No newline at end of file
@@ -0,0 +1,51 @@
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+from backend.app.core.metrics import SINGLEFLIGHT_CALLS
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one in-flight call.
+
+    The first caller for a key runs ``func``; callers arriving while it is
+    running await the same result instead of starting their own call. If
+    the leading caller is cancelled, one of the waiters takes over.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        while (future := self._calls.get(key)) is not None:
+            SINGLEFLIGHT_CALLS.labels(name=self._name, role="coalesced").inc()
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+
+        SINGLEFLIGHT_CALLS.labels(name=self._name, role="leader").inc()
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved so an unwaited future does not log it.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
@@ -0,0 +1,125 @@
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAMETER_LIST = re.compile(r"\((?:\s*\?\s*,)+\s*\?\s*\)")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):\w+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """Reduce a statement to its shape so the same query with different values groups together."""
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _PARAMETER_LIST.sub("(?...)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    total_seconds: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+
+    def record(self, normalized: str, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.statements[normalized] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= threshold]
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _query_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    # Kept on the per-statement execution context, so a failed statement leaves nothing behind.
+    if context is not None:
+        context._query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = getattr(context, "_query_started_at", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+
+    stats = _query_stats.get()
+    slow = elapsed * 1000 >= settings.SQL_SLOW_QUERY_MS
+    if stats is None and not slow:
+        return
+
+    normalized = normalize_sql(statement)
+    if stats is not None:
+        stats.record(normalized, elapsed)
+    if slow:
+        logger.warning(f"Slow query ({elapsed * 1000:.1f} ms): {normalized}")
+
+
+def install_query_instrumentation(engine: AsyncEngine) -> None:
+    """Time every statement on ``engine`` and log the slow ones."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """Collects per-request query counts and DB time and flags likely N+1 patterns.
+
+    With ``expose_headers`` the numbers are returned as ``X-DB-Query-Count`` and
+    ``X-DB-Time-Ms`` response headers.
+    """
+
+    def __init__(self, app: ASGIApp, expose_headers: bool = False):
+        self.app = app
+        self.expose_headers = expose_headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _query_stats.set(stats)
+
+        async def send_wrapper(message: Message) -> None:
+            if self.expose_headers and message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Query-Count"] = str(stats.count)
+                headers["X-DB-Time-Ms"] = f"{stats.total_seconds * 1000:.1f}"
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _query_stats.reset(token)
+            self._report(scope, stats)
+
+    def _report(self, scope: Scope, stats: QueryStats) -> None:
+        if not stats.count:
+            return
+        route = getattr(scope.get("route"), "path", scope["path"])
+        for sql, times in stats.repeated(settings.SQL_N_PLUS_ONE_THRESHOLD):
+            logger.warning(f"Possible N+1 on {scope['method']} {route}: {times} x {sql}")
+        logger.debug(
+            f"{scope['method']} {route} ran {stats.count} queries in {stats.total_seconds * 1000:.1f} ms"
+        )
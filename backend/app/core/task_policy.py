@@ -0,0 +1,55 @@
+from enum import Enum
+
+from celery import Task
+from celery.backends.redis import RedisBackend
+
+
+class ResultPolicy(str, Enum):
+    """How much a task leaves behind in the result backend.
+
+    ``ignore`` stores nothing, ``minimal`` stores the final state and return
+    value, and ``extended`` also records STARTED and the task name, worker,
+    retries and queue.
+    """
+
+    IGNORE = "ignore"
+    MINIMAL = "minimal"
+    EXTENDED = "extended"
+
+
+class PolicyTask(Task):
+    """Task base that derives result storage from ``result_policy``.
+
+    Declared on the decorator: ``@celery_app.task(result_policy="minimal")``.
+    Fire-and-forget tasks keep the ``ignore`` default.
+    """
+
+    result_policy: ResultPolicy | str = ResultPolicy.IGNORE
+
+    @classmethod
+    def on_bound(cls, app):
+        policy = ResultPolicy(cls.result_policy)
+        cls.result_policy = policy
+        cls.ignore_result = policy is ResultPolicy.IGNORE
+        cls.track_started = policy is ResultPolicy.EXTENDED
+
+
+class PolicyRedisBackend(RedisBackend):
+    """Redis result backend that only writes extended metadata for ``extended`` tasks."""
+
+    def _get_result_meta(self, result, state, traceback, request, format_date=True, encode=False):
+        meta = super()._get_result_meta(result, state, traceback, request, format_date, encode)
+        if request is None:
+            return meta
+
+        task = self.app.tasks.get(getattr(request, "task", None))
+        if getattr(task, "result_policy", None) is ResultPolicy.EXTENDED:
+            delivery_info = getattr(request, "delivery_info", None) or {}
+            # Args and kwargs are left out on purpose: they can carry rendered emails or personal data.
+            meta.update({
+                "name": request.task,
+                "worker": getattr(request, "hostname", None),
+                "retries": getattr(request, "retries", None),
+                "queue": delivery_info.get("routing_key"),
+            })
+        return meta
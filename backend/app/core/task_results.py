@@ -0,0 +1,30 @@
+import json
+from typing import Any
+
+from backend.app.core.redis_client import get_redis
+
+# Key prefix Celery's Redis result backend stores task results under.
+TASK_RESULT_KEY_PREFIX = "celery-task-meta-"
+
+TASK_STATUS_FIELDS = ("status", "result", "date_done", "name", "worker", "retries", "queue")
+
+
+async def get_task_status(task_id: str) -> dict[str, Any]:
+    """Read a stored task result straight from Redis without importing Celery.
+
+    Like Celery, a task with nothing stored (queued, unknown, or ``ignore``
+    result policy) reports ``PENDING``.
+    """
+    raw = await get_redis().get(f"{TASK_RESULT_KEY_PREFIX}{task_id}")
+    if raw is None:
+        return {"task_id": task_id, "status": "PENDING"}
+
+    meta = json.loads(raw)
+    status = {"task_id": task_id, **{field: meta[field] for field in TASK_STATUS_FIELDS if field in meta}}
+    if meta.get("status") == "FAILURE":
+        # Return the exception type and message only; the traceback stays in the backend.
+        exc_message = meta["result"].get("exc_message")
+        if isinstance(exc_message, (list, tuple)):
+            exc_message = " ".join(str(part) for part in exc_message)
+        status["result"] = {"type": meta["result"].get("exc_type"), "message": exc_message}
+    return status
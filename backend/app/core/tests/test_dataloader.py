@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from backend.app.core.dataloader import DataLoader
+
+pytestmark = pytest.mark.anyio
+
+
+class RecordingBatch:
+    """A batch_load that records its calls and fails if two run at once."""
+
+    def __init__(self, missing: set = frozenset()):
+        self.calls: list[list] = []
+        self.missing = missing
+        self._running = False
+
+    async def __call__(self, keys: list) -> list:
+        assert not self._running, "batches overlapped"
+        self._running = True
+        self.calls.append(list(keys))
+        await asyncio.sleep(0)
+        self._running = False
+        return [None if key in self.missing else key * 10 for key in keys]
+
+
+async def test_loads_in_the_same_tick_share_one_batch():
+    batch = RecordingBatch(missing={3})
+    loader = DataLoader(batch)
+
+    results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(3), loader.load(1))
+
+    assert results == [10, 20, None, 10]
+    assert batch.calls == [[1, 2, 3]]
+
+
+async def test_results_are_memoized_and_primed_keys_skip_the_batch():
+    batch = RecordingBatch()
+    loader = DataLoader(batch)
+    loader.prime(5, 55)
+
+    assert await loader.load(5) == 55
+    assert await loader.load(1) == 10
+    assert await loader.load(1) == 10
+    assert batch.calls == [[1]]
+
+
+async def test_large_dispatch_runs_chunks_sequentially():
+    batch = RecordingBatch()
+    loader = DataLoader(batch, max_batch_size=2)
+
+    results = await loader.load_many([1, 2, 3, 4, 5])
+
+    assert results == [10, 20, 30, 40, 50]
+    assert batch.calls == [[1, 2], [3, 4], [5]]
+
+
+async def test_failed_batch_rejects_its_keys_and_allows_retry():
+    attempts = []
+
+    async def flaky(keys):
+        attempts.append(keys)
+        if len(attempts) == 1:
+            raise RuntimeError("database unavailable")
+        return keys
+
+    loader = DataLoader(flaky)
+    with pytest.raises(RuntimeError):
+        await loader.load("a")
+
+    assert await loader.load("a") == "a"
+    assert attempts == [["a"], ["a"]]
+
+
+async def test_wrong_result_length_is_an_error():
+    async def short(keys):
+        return keys[:-1]
+
+    loader = DataLoader(short)
+    with pytest.raises(ValueError):
+        await loader.load_many([1, 2])
+
+
+async def test_cancelling_a_dispatch_releases_every_pending_key():
+    started = asyncio.Event()
+
+    async def hang(keys):
+        started.set()
+        await asyncio.sleep(3600)
+
+    loader = DataLoader(hang, max_batch_size=2)
+    waiters = [asyncio.ensure_future(loader.load(key)) for key in range(5)]
+    await started.wait()
+
+    for task in list(loader._tasks):
+        task.cancel()
+    results = await asyncio.wait_for(asyncio.gather(*waiters, return_exceptions=True), timeout=1)
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    # Cancelled keys are forgotten, so a later load retries them.
+    loader._batch_load = RecordingBatch()
+    assert await loader.load(4) == 40
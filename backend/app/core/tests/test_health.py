@@ -0,0 +1,267 @@
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.app.core import health
+from backend.app.core.health import HealthCheck, ServiceStatus
+from backend.app.core.worker_registry import WORKER_INDEX_KEY, worker_key
+
+pytestmark = pytest.mark.anyio
+
+
+class Probe:
+    """A health check that records when it ran relative to other probes."""
+
+    def __init__(self, name: str, order: list[str], healthy: bool = True):
+        self.name = name
+        self.order = order
+        self.healthy = healthy
+
+    async def __call__(self) -> bool:
+        self.order.append(self.name)
+        await asyncio.sleep(0)
+        return self.healthy
+
+
+async def build(services: dict[str, tuple[bool, list[str]]], order: list[str]) -> HealthCheck:
+    checker = HealthCheck()
+    for name, (healthy, depends_on) in services.items():
+        await checker.add_service(
+            name, Probe(name, order, healthy), timeout=1.0, retry_delay=0, max_retries=1,
+            depends_on=depends_on, probe_interval=10,
+        )
+    return checker
+
+
+async def test_evaluate_services_probes_dependencies_first():
+    order: list[str] = []
+    checker = await build(
+        {"database": (True, []), "redis": (True, []), "celery": (True, ["redis"]), "api": (True, ["database", "celery"])},
+        order,
+    )
+
+    results = await checker.evaluate_services()
+
+    assert all(status == ServiceStatus.HEALTHY for status in results.values())
+    assert order.index("redis") < order.index("celery") < order.index("api")
+    assert order.index("database") < order.index("api")
+    assert sorted(order) == sorted(set(order))
+
+
+async def test_unhealthy_dependency_degrades_dependents_without_probing_them():
+    order: list[str] = []
+    checker = await build(
+        {"redis": (False, []), "celery": (True, ["redis"]), "api": (True, ["celery"])},
+        order,
+    )
+
+    results = await checker.evaluate_services()
+
+    assert results == {
+        "redis": ServiceStatus.UNHEALTHY,
+        "celery": ServiceStatus.DEGRADED,
+        "api": ServiceStatus.DEGRADED,
+    }
+    assert order == ["redis"]
+
+
+async def test_evaluating_one_service_pulls_in_only_its_dependencies():
+    order: list[str] = []
+    checker = await build({"database": (True, []), "redis": (True, []), "celery": (True, ["redis"])}, order)
+
+    results = await checker.evaluate_services(["celery"])
+
+    assert set(results) == {"redis", "celery"}
+    assert "database" not in order
+
+
+async def test_cyclic_dependencies_are_rejected():
+    checker = await build({"a": (True, []), "b": (True, ["a"])}, [])
+
+    with pytest.raises(ValueError):
+        await checker.add_service("a", Probe("a", []), depends_on=["b"])
+
+
+async def publish_snapshot(redis, service: str, status: ServiceStatus, age_seconds: float = 0) -> None:
+    """Write a snapshot as if another worker had just probed ``service``."""
+    last_check = datetime.now(timezone.utc) - timedelta(seconds=age_seconds)
+    await redis.set(f"health:service:{service}", json.dumps({"status": status, "last_check": last_check.isoformat()}))
+
+
+async def test_background_check_uses_shared_dependency_snapshot(redis):
+    order: list[str] = []
+    checker = await build({"redis": (True, []), "celery": (True, ["redis"])}, order)
+    # This worker last saw redis healthy, but another worker has since found it down.
+    await checker.evaluate_services(["redis"])
+    await publish_snapshot(redis, "redis", ServiceStatus.UNHEALTHY)
+
+    assert await checker.check_service_health("celery", probe_dependencies=False) == ServiceStatus.DEGRADED
+
+    await publish_snapshot(redis, "redis", ServiceStatus.HEALTHY)
+    assert await checker.check_service_health("celery", probe_dependencies=False) == ServiceStatus.HEALTHY
+
+    await publish_snapshot(redis, "redis", ServiceStatus.HEALTHY, age_seconds=60)
+    assert await checker.check_service_health("celery", probe_dependencies=False) == ServiceStatus.DEGRADED
+    assert order == ["redis", "celery"]
+
+
+async def wait_for_snapshot(checker: HealthCheck, service: str) -> dict:
+    async with asyncio.timeout(1):
+        while True:
+            snapshot = await checker.get_snapshot()
+            if snapshot["services"][service]["age_seconds"] is not None:
+                return snapshot
+            await asyncio.sleep(0.01)
+
+
+async def test_background_probes_publish_what_get_snapshot_serves(redis):
+    order: list[str] = []
+    checker = await build({"redis": (True, []), "database": (True, [])}, order)
+
+    await checker.start_background_probes()
+    try:
+        await wait_for_snapshot(checker, "redis")
+        snapshot = await wait_for_snapshot(checker, "database")
+    finally:
+        await checker.cleanup()
+
+    assert snapshot["status"] == ServiceStatus.HEALTHY
+    assert all(not service["stale"] for service in snapshot["services"].values())
+    # get_snapshot only reads Redis; it never runs a probe itself.
+    assert sorted(order) == ["database", "redis"]
+
+
+async def test_one_worker_probes_each_service_per_interval(redis):
+    order: list[str] = []
+    workers = [await build({"redis": (True, [])}, order) for _ in range(3)]
+
+    for worker in workers:
+        await worker.start_background_probes()
+    try:
+        for worker in workers:
+            await wait_for_snapshot(worker, "redis")
+    finally:
+        for worker in workers:
+            await worker.cleanup()
+
+    assert order == ["redis"]
+
+
+async def test_snapshot_reports_missing_and_stale_services(redis):
+    checker = await build({"redis": (True, []), "database": (True, [])}, [])
+    await publish_snapshot(redis, "redis", ServiceStatus.HEALTHY, age_seconds=60)
+
+    snapshot = await checker.get_snapshot()
+
+    assert snapshot["status"] == ServiceStatus.DEGRADED
+    assert snapshot["services"]["redis"]["stale"] is True
+    assert snapshot["services"]["redis"]["age_seconds"] >= 60
+    assert snapshot["services"]["database"]["status"] == ServiceStatus.STARTING
+    assert snapshot["services"]["database"]["age_seconds"] is None
+    assert snapshot["services"]["database"]["stale"] is True
+
+
+async def test_celery_probe_trusts_live_heartbeats(redis, monkeypatch):
+    def unexpected_broker_ping(connect_timeout: float) -> None:
+        raise AssertionError("broker pinged despite a live worker heartbeat")
+
+    monkeypatch.setattr(HealthCheck, "_ping_broker", staticmethod(unexpected_broker_ping))
+    await redis.set(worker_key("celery@worker-1"), json.dumps({"hostname": "celery@worker-1"}), ex=30)
+    await redis.zadd(WORKER_INDEX_KEY, {"celery@worker-1": time.time() + 30})
+
+    assert await HealthCheck().check_celery() is True
+
+
+async def test_broker_fallback_runs_off_the_event_loop(redis, monkeypatch):
+    probe_threads: list[str] = []
+
+    def slow_broker_ping(connect_timeout: float) -> None:
+        probe_threads.append(threading.current_thread().name)
+        time.sleep(0.3)
+
+    monkeypatch.setattr(HealthCheck, "_ping_broker", staticmethod(slow_broker_ping))
+    checker = HealthCheck()
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticking = asyncio.create_task(ticker())
+    try:
+        assert await checker.check_celery() is True
+    finally:
+        ticking.cancel()
+
+    assert probe_threads[0].startswith("health-probe")
+    assert ticks > 5
+
+    # Cleanup shuts the pool down; a checker reused afterwards gets a fresh one.
+    await checker.cleanup()
+    assert await checker.check_celery() is True
+    assert len(probe_threads) == 2
+    await checker.cleanup()
+
+
+class SlowProbe:
+    """A health check that counts its calls and takes long enough for callers to pile up."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self) -> bool:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return True
+
+
+def advance_clock(monkeypatch, seconds: float) -> None:
+    offset = timedelta(seconds=seconds)
+
+    class ShiftedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + offset
+
+    monkeypatch.setattr(health, "datetime", ShiftedDatetime)
+
+
+async def test_concurrent_cold_callers_share_one_refresh():
+    probe = SlowProbe()
+    checker = HealthCheck()
+    await checker.add_service("database", probe, retry_delay=0, max_retries=1)
+
+    results = await asyncio.gather(*(checker.check_all_services() for _ in range(10)))
+
+    assert probe.calls == 1
+    assert all(result is results[0] for result in results)
+    assert checker.cache_stats()["refreshes"] == 1
+    assert checker.cache_stats()["coalesced_waits"] == 9
+
+
+async def test_stale_status_is_served_while_one_refresh_runs(monkeypatch):
+    probe = SlowProbe()
+    checker = HealthCheck()
+    await checker.add_service("database", probe, retry_delay=0, max_retries=1)
+    first = await checker.check_all_services()
+    assert await checker.check_all_services() is first
+
+    advance_clock(monkeypatch, 30)
+    stale = await asyncio.gather(*(checker.check_all_services() for _ in range(5)))
+
+    assert all(result is first for result in stale)
+    async with asyncio.timeout(1):
+        while (fresh := await checker.check_all_services()) is first:
+            await asyncio.sleep(0.01)
+
+    assert fresh["timestamp"] > first["timestamp"]
+    assert probe.calls == 2
+    assert checker.cache_stats()["hits"] >= 1
+    assert checker.cache_stats()["stale_hits"] >= 5
+    assert checker.cache_stats()["refreshes"] == 2
@@ -0,0 +1,91 @@
+import json
+import os
+import threading
+import zipfile
+
+from loguru import logger
+
+from backend.app.core import logging as app_logging
+
+
+def compress(*paths: str) -> None:
+    for path in paths:
+        app_logging._compress_in_background(path)
+    app_logging._compression_queue.join()
+
+
+def test_rotated_file_is_zipped_off_thread(tmp_path):
+    rotated = tmp_path / "debug.2026-01-01.log"
+    rotated.write_text("line one\nline two\n")
+
+    compress(str(rotated))
+
+    assert not rotated.exists()
+    with zipfile.ZipFile(f"{rotated}.zip") as archive:
+        assert archive.read(rotated.name) == b"line one\nline two\n"
+
+
+def test_one_thread_compresses_every_rotation(tmp_path):
+    paths = [tmp_path / f"debug.{i}.log" for i in range(5)]
+    for path in paths:
+        path.write_text("x" * 1000)
+
+    compress(*map(str, paths))
+
+    assert all(os.path.exists(f"{path}.zip") for path in paths)
+    assert [thread.name for thread in threading.enumerate()].count("log-compression") == 1
+
+
+def test_failed_compression_leaves_no_partial_archive(tmp_path):
+    missing = tmp_path / "gone.log"
+    survivor = tmp_path / "next.log"
+    survivor.write_text("still here")
+
+    compress(str(missing), str(survivor))
+
+    assert not os.path.exists(f"{missing}.zip")
+    # The worker thread keeps going after a failure.
+    assert os.path.exists(f"{survivor}.zip")
+
+
+def test_rotation_through_loguru_hands_files_to_the_compressor(tmp_path):
+    sink = logger.add(
+        tmp_path / "app.log",
+        rotation="200 B",
+        compression=app_logging._compress_in_background,
+        filter=lambda record: record["extra"].get("rotation_test"),
+    )
+    try:
+        test_logger = logger.bind(rotation_test=True)
+        for i in range(20):
+            test_logger.info(f"message {i:02d} " + "x" * 40)
+    finally:
+        logger.remove(sink)
+    app_logging._compression_queue.join()
+
+    archives = list(tmp_path.glob("*.zip"))
+    assert archives
+    assert not [path for path in tmp_path.iterdir() if path.suffix == ".log" and path.name != "app.log"]
+
+
+def test_json_format_emits_one_compact_line():
+    records = []
+    sink = logger.add(records.append, format=app_logging._json_format, filter=lambda r: r["extra"].get("json_test"))
+    try:
+        logger.bind(json_test=True).warning("balance {amount} reached", amount=5)
+    finally:
+        logger.remove(sink)
+
+    [line] = records
+    entry = json.loads(line)
+    assert entry["level"] == "WARNING"
+    assert entry["msg"] == "balance 5 reached"
+    assert line.endswith("}\n") and "\n" not in line[:-1]
+
+
+def test_level_overrides_use_the_longest_matching_prefix():
+    table = {"backend": 10, "backend.app.core": 30}
+
+    assert app_logging._longest_prefix_match("backend.app.core.health", table) == 30
+    assert app_logging._longest_prefix_match("backend.app.auth", table) == 10
+    assert app_logging._longest_prefix_match("backendish", table) is None
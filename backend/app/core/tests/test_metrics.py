@@ -0,0 +1,106 @@
+import httpx
+import prometheus_client
+import pytest
+from fastapi import FastAPI
+
+from backend.app import main
+from backend.app.core import queue_metrics
+from backend.app.core.config import settings
+from backend.app.core.http_metrics import PrometheusMiddleware
+
+pytestmark = pytest.mark.anyio
+
+
+def capture_exporter(monkeypatch) -> list[tuple]:
+    started: list[tuple] = []
+    monkeypatch.setattr(prometheus_client, "start_http_server", lambda port, registry: started.append((port, registry)))
+    return started
+
+
+def test_worker_exporter_serves_the_multiprocess_registry(monkeypatch, tmp_path):
+    started = capture_exporter(monkeypatch)
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "CELERY_METRICS_PORT", 9808)
+
+    queue_metrics.start_metrics_exporter()
+
+    [(port, registry)] = started
+    assert port == 9808
+    assert registry is not prometheus_client.REGISTRY
+
+
+def test_worker_exporter_needs_the_multiprocess_dir(monkeypatch):
+    started = capture_exporter(monkeypatch)
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+
+    queue_metrics.start_metrics_exporter()
+
+    assert started == []
+
+
+def request_count(route: str, status: str) -> float:
+    labels = {"method": "GET", "route": route, "status": status}
+    return prometheus_client.REGISTRY.get_sample_value("http_request_duration_seconds_count", labels) or 0.0
+
+
+async def test_requests_are_labelled_by_route_template():
+    app = FastAPI()
+    app.add_middleware(PrometheusMiddleware)
+
+    @app.get("/accounts/{account_id}")
+    async def account(account_id: int):
+        return {"id": account_id}
+
+    @app.get("/metrics")
+    async def metrics():
+        return {}
+
+    before = request_count("/accounts/{account_id}", "200")
+    unmatched_before = request_count("unmatched", "404")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        for account_id in range(3):
+            await client.get(f"/accounts/{account_id}")
+        await client.get("/no/such/route")
+        await client.get("/metrics")
+
+    assert request_count("/accounts/{account_id}", "200") - before == 3
+    assert request_count("unmatched", "404") - unmatched_before == 1
+    assert request_count("/metrics", "200") == 0
+    assert prometheus_client.REGISTRY.get_sample_value(
+        "http_request_duration_seconds_count", {"method": "GET", "route": "/accounts/1", "status": "200"}
+    ) is None
+
+
+@pytest.fixture
+async def api_client(monkeypatch):
+    async def skip_refresh() -> None:
+        pass
+
+    monkeypatch.setattr(main.queue_depth_refresher, "maybe_refresh", skip_refresh)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://test") as client:
+        yield client
+
+
+async def test_metrics_are_open_locally_without_a_token(api_client, monkeypatch):
+    monkeypatch.setattr(settings, "ENVIRONMENT", "local")
+    monkeypatch.setattr(settings, "METRICS_BEARER_TOKEN", "")
+
+    assert (await api_client.get("/metrics")).status_code == 200
+
+
+async def test_metrics_are_closed_outside_local_without_a_token(api_client, monkeypatch):
+    monkeypatch.setattr(settings, "ENVIRONMENT", "production")
+    monkeypatch.setattr(settings, "METRICS_BEARER_TOKEN", "")
+
+    assert (await api_client.get("/metrics")).status_code == 403
+
+
+async def test_metrics_require_the_configured_token(api_client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_BEARER_TOKEN", "scrape-token")
+
+    assert (await api_client.get("/metrics")).status_code == 403
+    wrong = await api_client.get("/metrics", headers={"Authorization": "Bearer wrong-token"})
+    assert wrong.status_code == 403
+    right = await api_client.get("/metrics", headers={"Authorization": "Bearer scrape-token"})
+    assert right.status_code == 200
+    assert b"http_request_duration_seconds" in right.content
@@ -0,0 +1,38 @@
+import pytest
+
+from backend.app.core import model_registry
+from backend.app.core.config import settings
+
+
+def test_checked_in_manifest_matches_the_source_tree():
+    assert model_registry.stale_manifest_entries() == ([], [])
+
+
+def test_manifest_is_loaded_without_walking_the_tree(monkeypatch, tmp_path):
+    monkeypatch.setattr(model_registry, "MANIFEST_PATH", tmp_path / "model_manifest.json")
+    model_registry.write_manifest(["backend.app.auth.models"])
+
+    def walk_not_allowed():
+        raise AssertionError("walked the tree despite a manifest")
+
+    monkeypatch.setattr(model_registry, "discover_models", walk_not_allowed)
+    assert model_registry.resolve_model_modules() == ["backend.app.auth.models"]
+
+
+def test_stale_manifest_reports_missing_and_extra_modules(monkeypatch, tmp_path):
+    monkeypatch.setattr(model_registry, "MANIFEST_PATH", tmp_path / "model_manifest.json")
+    discovered = model_registry.discover_models()
+    model_registry.write_manifest(discovered[1:] + ["backend.app.removed.models"])
+
+    assert model_registry.stale_manifest_entries() == ([discovered[0]], ["backend.app.removed.models"])
+
+
+def test_missing_manifest_falls_back_to_the_walk_only_locally(monkeypatch, tmp_path):
+    monkeypatch.setattr(model_registry, "MANIFEST_PATH", tmp_path / "model_manifest.json")
+
+    monkeypatch.setattr(settings, "ENVIRONMENT", "local")
+    assert model_registry.resolve_model_modules() == model_registry.discover_models()
+
+    monkeypatch.setattr(settings, "ENVIRONMENT", "production")
+    with pytest.raises(RuntimeError):
+        model_registry.resolve_model_modules()
@@ -0,0 +1,78 @@
+import pytest
+
+from backend.app.core import rate_limit
+from backend.app.core.rate_limit import RATE_LIMIT_KEY_PREFIX, RateLimit, SlidingWindowLimiter
+
+pytestmark = pytest.mark.anyio
+
+
+class Clock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limit.time, "time", clock.time)
+    return clock
+
+
+@pytest.fixture
+def limiter(redis):
+    return SlidingWindowLimiter()
+
+
+async def test_allows_up_to_the_limit_then_reports_retry_after(limiter, clock):
+    limit = RateLimit("email", "login:email:a", limit=2, window_seconds=10)
+
+    assert (await limiter.hit(limit)).allowed
+    clock.now += 4
+    assert (await limiter.hit(limit)).allowed
+
+    result = await limiter.hit(limit)
+    assert not result.allowed
+    assert result.limit_name == "email"
+    assert result.retry_after_seconds == pytest.approx(6.0)
+
+
+async def test_window_slides_as_old_hits_expire(limiter, clock):
+    limit = RateLimit("email", "login:email:a", limit=2, window_seconds=10)
+    await limiter.hit(limit)
+    clock.now += 4
+    await limiter.hit(limit)
+
+    clock.now += 6.001
+    assert (await limiter.hit(limit)).allowed
+    assert not (await limiter.hit(limit)).allowed
+
+
+async def test_rejected_hit_is_not_recorded_in_any_window(limiter, redis, clock):
+    per_email = RateLimit("email", "login:email:a", limit=5, window_seconds=10)
+    global_limit = RateLimit("global", "login:global", limit=1, window_seconds=10)
+
+    assert (await limiter.hit(per_email, global_limit)).allowed
+    result = await limiter.hit(per_email, global_limit)
+
+    assert not result.allowed and result.limit_name == "global"
+    assert await redis.zcard(f"{RATE_LIMIT_KEY_PREFIX}login:email:a") == 1
+
+
+async def test_keys_expire_with_the_window(limiter, redis, clock):
+    await limiter.hit(RateLimit("ip", "login:ip:1", limit=3, window_seconds=10))
+
+    assert 0 < await redis.pttl(f"{RATE_LIMIT_KEY_PREFIX}login:ip:1") <= 10_000
+
+
+async def test_record_counts_events_in_window_and_reset_clears(limiter, clock):
+    assert await limiter.record("login:failures:a", 60) == 1
+    clock.now += 30
+    assert await limiter.record("login:failures:a", 60) == 2
+    clock.now += 31
+    assert await limiter.record("login:failures:a", 60) == 2
+
+    await limiter.reset("login:failures:a")
+    assert await limiter.record("login:failures:a", 60) == 1
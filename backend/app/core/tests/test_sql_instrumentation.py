@@ -0,0 +1,67 @@
+import pytest
+from sqlalchemy import create_engine, event, text
+
+from backend.app.core import sql_instrumentation
+from backend.app.core.sql_instrumentation import QueryStats, _query_stats, normalize_sql
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        ("SELECT * FROM users WHERE id = 42", "SELECT * FROM users WHERE id = ?"),
+        ("SELECT * FROM users WHERE email = 'a@b.com'", "SELECT * FROM users WHERE email = ?"),
+        ("SELECT * FROM users WHERE name = 'O''Brien'", "SELECT * FROM users WHERE name = ?"),
+        ("SELECT * FROM users WHERE id = $1 AND age > $2", "SELECT * FROM users WHERE id = ? AND age > ?"),
+        ("SELECT * FROM users WHERE id = %(id_1)s", "SELECT * FROM users WHERE id = ?"),
+        ("SELECT * FROM users WHERE id = :id", "SELECT * FROM users WHERE id = ?"),
+        ("SELECT * FROM users WHERE id IN (1, 2, 3)", "SELECT * FROM users WHERE id IN (?...)"),
+        ("SELECT * FROM users WHERE id IN ($1, $2)", "SELECT * FROM users WHERE id IN (?...)"),
+        ("SELECT id::text FROM users", "SELECT id::text FROM users"),
+        ("SELECT price * 1.5\n  FROM   items", "SELECT price * ? FROM items"),
+        ("SELECT col1 FROM table2", "SELECT col1 FROM table2"),
+    ],
+)
+def test_normalize_sql(statement, expected):
+    assert normalize_sql(statement) == expected
+
+
+def test_same_shape_groups_together():
+    assert normalize_sql("SELECT * FROM t WHERE id = 1") == normalize_sql("SELECT * FROM t  WHERE id = 2")
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    event.listen(engine, "before_cursor_execute", sql_instrumentation._before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", sql_instrumentation._after_cursor_execute)
+    yield engine
+    engine.dispose()
+
+
+def test_statements_are_recorded_per_context(engine):
+    stats = QueryStats()
+    token = _query_stats.set(stats)
+    try:
+        with engine.connect() as conn:
+            for value in range(3):
+                conn.execute(text("SELECT :value"), {"value": value})
+    finally:
+        _query_stats.reset(token)
+
+    assert stats.count == 3
+    assert stats.repeated(3) == [("SELECT ?", 3)]
+
+
+def test_failed_statement_leaves_no_timing_state(engine):
+    with engine.connect() as conn:
+        with pytest.raises(Exception):
+            conn.execute(text("SELECT * FROM missing_table"))
+        assert not any(key.startswith("query") for key in conn.info)
+
+        stats = QueryStats()
+        token = _query_stats.set(stats)
+        try:
+            conn.execute(text("SELECT 1"))
+        finally:
+            _query_stats.reset(token)
+    assert stats.count == 1
@@ -0,0 +1,82 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.core.celery_app import celery_app
+from backend.app.core.emails.tasks import send_bulk_email_task, send_email_task
+from backend.app.core.task_policy import ResultPolicy
+from backend.app.core.task_results import TASK_RESULT_KEY_PREFIX, get_task_status
+
+pytestmark = pytest.mark.anyio
+
+
+@celery_app.task(name="test_extended_report_task", result_policy="extended")
+def extended_report_task() -> None:
+    pass
+
+
+def request_for(task_name: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id="task-1", task=task_name, hostname="celery@worker-1", retries=2,
+        delivery_info={"routing_key": "bank_tasks"}, parent_id=None, group=None, chord=None,
+        ignore_result=False,
+    )
+
+
+def test_policy_on_the_decorator_sets_result_storage():
+    assert send_email_task.result_policy is ResultPolicy.IGNORE
+    assert send_email_task.ignore_result is True
+
+    assert send_bulk_email_task.result_policy is ResultPolicy.MINIMAL
+    assert send_bulk_email_task.ignore_result is False
+    assert send_bulk_email_task.track_started is False
+
+    assert extended_report_task.result_policy is ResultPolicy.EXTENDED
+    assert extended_report_task.track_started is True
+
+
+def test_backend_writes_extended_metadata_only_for_extended_tasks():
+    backend = celery_app.backend
+
+    minimal = backend._get_result_meta({"a@example.com": "sent"}, "SUCCESS", None, request_for("send_bulk_email_task"))
+    extended = backend._get_result_meta(None, "SUCCESS", None, request_for("test_extended_report_task"))
+
+    assert not {"name", "worker", "retries", "queue"} & set(minimal)
+    assert extended["name"] == "test_extended_report_task"
+    assert extended["worker"] == "celery@worker-1"
+    assert extended["retries"] == 2
+    assert extended["queue"] == "bank_tasks"
+    assert "args" not in extended and "kwargs" not in extended
+
+
+async def test_task_status_reads_the_stored_result(redis):
+    meta = celery_app.backend._get_result_meta(
+        {"a@example.com": "sent"}, "SUCCESS", None, request_for("send_bulk_email_task")
+    )
+    await redis.set(f"{TASK_RESULT_KEY_PREFIX}task-1", json.dumps(meta))
+
+    status = await get_task_status("task-1")
+
+    assert status == {
+        "task_id": "task-1",
+        "status": "SUCCESS",
+        "result": {"a@example.com": "sent"},
+        "date_done": meta["date_done"],
+    }
+
+
+async def test_task_status_hides_the_failure_traceback(redis):
+    error = celery_app.backend.prepare_exception(ValueError("bad", "recipient"))
+    meta = celery_app.backend._get_result_meta(error, "FAILURE", "Traceback ...", request_for("send_bulk_email_task"))
+    await redis.set(f"{TASK_RESULT_KEY_PREFIX}task-1", json.dumps(meta))
+
+    status = await get_task_status("task-1")
+
+    assert status["status"] == "FAILURE"
+    assert status["result"] == {"type": "ValueError", "message": "bad recipient"}
+    assert "traceback" not in status
+
+
+async def test_unknown_or_ignored_task_reports_pending(redis):
+    assert await get_task_status("never-stored") == {"task_id": "never-stored", "status": "PENDING"}
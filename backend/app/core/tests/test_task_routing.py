@@ -0,0 +1,45 @@
+import pytest
+
+from backend.app.core.celery_app import DEFAULT_PRIORITY, DEFAULT_QUEUE, HIGH_PRIORITY_QUEUE, celery_app
+from backend.app.core.services.activation_email import ActivationEmail
+from backend.app.core.services.login_otp_email import LoginOTPEmail
+
+pytestmark = pytest.mark.anyio
+
+
+def route(task_name: str, **options) -> dict:
+    return celery_app.amqp.router.route(options, task_name)
+
+
+def test_transactional_mail_goes_to_the_priority_queue():
+    routed = route("send_email_task")
+    assert routed["queue"].name == HIGH_PRIORITY_QUEUE
+    assert routed["priority"] == DEFAULT_PRIORITY
+    assert route("send_email_task", priority=9)["priority"] == 9
+    # A row published without a priority keeps the route default.
+    assert route("send_email_task", priority=None)["priority"] == DEFAULT_PRIORITY
+
+
+def test_bulk_and_unrouted_tasks_stay_on_the_default_queue():
+    assert route("send_bulk_email_task")["queue"].name == DEFAULT_QUEUE
+    assert route("some_report_task")["queue"].name == DEFAULT_QUEUE
+
+
+def test_otp_mail_outranks_activation_mail():
+    assert LoginOTPEmail.priority > ActivationEmail.priority > DEFAULT_PRIORITY
+
+
+async def test_staged_mail_carries_its_template_priority():
+    class FakeSession:
+        def __init__(self):
+            self.added = []
+
+        def add(self, instance):
+            self.added.append(instance)
+
+    session = FakeSession()
+    await LoginOTPEmail.send_email("a@example.com", {"otp": "1"}, session=session)
+
+    [message] = session.added
+    assert message.task_name == "send_email_task"
+    assert message.priority == LoginOTPEmail.priority
@@ -0,0 +1,30 @@
+import json
+import time
+
+import pytest
+
+from backend.app.core.worker_registry import WORKER_INDEX_KEY, get_live_workers, worker_key
+
+pytestmark = pytest.mark.anyio
+
+
+async def add_worker(redis, hostname: str, expires_at: float) -> None:
+    await redis.set(worker_key(hostname), json.dumps({"hostname": hostname}))
+    await redis.zadd(WORKER_INDEX_KEY, {hostname: expires_at})
+
+
+async def test_returns_indexed_workers_and_prunes_expired_entries(redis):
+    await add_worker(redis, "live@a", time.time() + 30)
+    await add_worker(redis, "dead@b", time.time() - 1)
+    await redis.set(worker_key("unindexed@c"), json.dumps({"hostname": "unindexed@c"}))
+
+    workers = await get_live_workers()
+
+    assert [worker["hostname"] for worker in workers] == ["live@a"]
+    assert await redis.zrange(WORKER_INDEX_KEY, 0, -1) == ["live@a"]
+
+
+async def test_index_entry_without_heartbeat_key_is_skipped(redis):
+    await redis.zadd(WORKER_INDEX_KEY, {"gone@a": time.time() + 30})
+
+    assert await get_live_workers() == []
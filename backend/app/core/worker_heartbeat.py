@@ -0,0 +1,119 @@
+import json
+import os
+import resource
+import threading
+import time
+from typing import Any
+
+import redis
+from celery.signals import worker_ready, worker_shutdown
+from celery.worker import state as worker_state
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.worker_registry import WORKER_INDEX_KEY, worker_key
+
+logger = get_logger()
+
+
+def _rss_kb() -> int:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class WorkerHeartbeat:
+    """Publishes this worker's liveness and capacity to a Redis key that expires if it stops.
+
+    The hostname is also indexed in a sorted set scored by the key's expiry, so
+    readers find live workers without scanning the keyspace.
+    """
+
+    def __init__(self, consumer: Any, interval: float, ttl: int):
+        self._consumer = consumer
+        self._hostname = consumer.hostname
+        self._interval = interval
+        self._ttl = ttl
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="worker-heartbeat", daemon=True)
+        self._client = redis.Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        )
+
+    def _queues(self) -> list[str]:
+        task_consumer = getattr(self._consumer, "task_consumer", None)
+        if task_consumer is not None:
+            return sorted(queue.name for queue in task_consumer.queues)
+        return sorted(self._consumer.app.amqp.queues.consume_from)
+
+    def _collect(self) -> dict[str, Any]:
+        controller = getattr(self._consumer, "controller", None)
+        return {
+            "hostname": self._hostname,
+            "pid": os.getpid(),
+            "queues": self._queues(),
+            "concurrency": getattr(controller, "concurrency", None),
+            "active_tasks": len(worker_state.active_requests),
+            "rss_kb": _rss_kb(),
+            "heartbeat_at": time.time(),
+        }
+
+    def publish(self) -> None:
+        try:
+            with self._client.pipeline(transaction=False) as pipe:
+                pipe.set(worker_key(self._hostname), json.dumps(self._collect()), ex=self._ttl)
+                pipe.zadd(WORKER_INDEX_KEY, {self._hostname: time.time() + self._ttl})
+                pipe.expire(WORKER_INDEX_KEY, self._ttl)
+                pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to publish heartbeat for worker {self._hostname}: {e}")
+
+    def _run(self) -> None:
+        self.publish()
+        while not self._stop.wait(self._interval):
+            self.publish()
+
+    def start(self) -> None:
+        self._thread.start()
+        logger.info(f"Worker heartbeat started for {self._hostname} every {self._interval} seconds.")
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=self._interval)
+        try:
+            with self._client.pipeline(transaction=False) as pipe:
+                pipe.delete(worker_key(self._hostname))
+                pipe.zrem(WORKER_INDEX_KEY, self._hostname)
+                pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to remove heartbeat for worker {self._hostname}: {e}")
+        finally:
+            self._client.close()
+
+
+_heartbeat: WorkerHeartbeat | None = None
+
+
+@worker_ready.connect
+def start_worker_heartbeat(sender: Any, **kwargs: Any) -> None:
+    global _heartbeat
+    _heartbeat = WorkerHeartbeat(
+        sender,
+        interval=settings.CELERY_HEARTBEAT_INTERVAL_SECONDS,
+        ttl=settings.CELERY_HEARTBEAT_TTL_SECONDS,
+    )
+    _heartbeat.start()
+
+
+@worker_shutdown.connect
+def stop_worker_heartbeat(**kwargs: Any) -> None:
+    global _heartbeat
+    if _heartbeat is not None:
+        _heartbeat.stop()
+        _heartbeat = None
@@ -0,0 +1,26 @@
+import json
+import time
+from typing import Any
+
+from backend.app.core.redis_client import get_redis
+
+WORKER_KEY_PREFIX = "celery:worker:"
+# Sorted set of worker hostnames scored by the time their heartbeat key expires.
+WORKER_INDEX_KEY = "celery:workers"
+
+
+def worker_key(hostname: str) -> str:
+    return f"{WORKER_KEY_PREFIX}{hostname}"
+
+
+async def get_live_workers() -> list[dict[str, Any]]:
+    """Read every unexpired worker heartbeat through the worker index with one pipeline."""
+    now = time.time()
+    async with get_redis().pipeline(transaction=False) as pipe:
+        pipe.zremrangebyscore(WORKER_INDEX_KEY, "-inf", now)
+        pipe.zrange(WORKER_INDEX_KEY, 0, -1)
+        _, hostnames = await pipe.execute()
+    if not hostnames:
+        return []
+    values = await get_redis().mget([worker_key(hostname) for hostname in hostnames])
+    return [json.loads(value) for value in values if value]
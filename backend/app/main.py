@@ -1,36 +1,38 @@
-from fastapi import FastAPI, status
+from fastapi import Depends, FastAPI, HTTPException, Response, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from backend.app.api.main import api_router
 from backend.app.core.config import settings
 from contextlib import asynccontextmanager
-from backend.app.core.db import init_db, engine
+from backend.app.core.db import init_db, engine, warm_pool
 from backend.app.core.logging import get_logger
 from fastapi.responses import JSONResponse
 from backend.app.core.health import health_checker, ServiceStatus
-import asyncio, time
+from backend.app.auth.hashing import password_hash_pool
+from backend.app.auth.tokens import token_service
+from backend.app.api.services.user_cache import user_cache
+from backend.app.core.redis_client import close_redis
+from backend.app.core.sql_instrumentation import QueryStatsMiddleware
+from backend.app.core.http_metrics import PrometheusMiddleware, mark_worker_dead, queue_depth_refresher, render_metrics
+from typing import Awaitable, TypeVar
+import asyncio, hmac, time
 
 logger = get_logger()
 
+T = TypeVar("T")
+
 async def startup_health_check(timeout: float=90.0) -> bool:
     try:
         async with asyncio.timeout(timeout):
-            retry_intervals = [1, 2, 5, 10, 15]
-            start_time = time.time()
-            while True:
-                is_healthy = await health_checker.wait_for_services()
-                if is_healthy:
-                    logger.info("All services are healthy.")
-                    return True
-                
-                elapsed_time = time.time() - start_time
-                if elapsed_time >= timeout:
-                    logger.error("Services failed health check during startup.")
-                    return False
-                
-                wait_time = retry_intervals[
-                    min(len(retry_intervals) - 1, int(elapsed_time / 10))
-                ]
-                logger.warning(f"Services not healthy yet. Retrying in {wait_time} seconds...")
-                await asyncio.sleep(wait_time)
+            is_healthy = await health_checker.wait_for_services(
+                timeout=timeout,
+                backoff_base=settings.STARTUP_BACKOFF_BASE_SECONDS,
+                backoff_max=settings.STARTUP_BACKOFF_MAX_SECONDS,
+            )
+            if is_healthy:
+                logger.info("All services are healthy.")
+            else:
+                logger.error("Services failed health check during startup.")
+            return is_healthy
     except asyncio.TimeoutError:
         logger.error(f"Startup health check timed out after {timeout} seconds.")
         return False
@@ -38,33 +40,75 @@ async def startup_health_check(timeout: float=90.0) -> bool:
         logger.error(f"Unexpected error during startup health check: {e}")
         return False
 
+async def _timed(timings: dict[str, float], name: str, coro: Awaitable[T]) -> T:
+    started_at = time.perf_counter()
+    try:
+        return await coro
+    finally:
+        timings[name] = time.perf_counter() - started_at
+
+async def _init_database(timings: dict[str, float]) -> None:
+    await _timed(timings, "init_db", init_db())
+    logger.info("Database initialized successfully.")
+    if settings.DB_POOL_WARMUP:
+        await _timed(timings, "pool_warmup", warm_pool())
+
+def _log_password_hashing_parameters() -> None:
+    # Pinned in settings by `make calibrate-argon2` so every worker hashes identically.
+    logger.info(
+        f"Argon2 parameters: t={settings.ARGON2_TIME_COST} m={settings.ARGON2_MEMORY_COST} "
+        f"p={settings.ARGON2_PARALLELISM}"
+    )
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    timings: dict[str, float] = {}
+    startup_started = time.perf_counter()
     try:
-        await init_db()
-        logger.info("Database initialized successfully.")
-
         await health_checker.add_service("database", health_checker.check_database)
         await health_checker.add_service("redis", health_checker.check_redis)
         await health_checker.add_service("celery", health_checker.check_celery)
 
-        if not await startup_health_check():
+        _log_password_hashing_parameters()
+
+        async with asyncio.TaskGroup() as startup:
+            startup.create_task(_init_database(timings))
+            health_task = startup.create_task(
+                _timed(timings, "health_checks", startup_health_check(settings.STARTUP_TIMEOUT_SECONDS))
+            )
+
+        if not health_task.result():
             logger.critical("Application startup aborted due to unhealthy services.")
             raise RuntimeError("Unhealthy services detected during startup.")
-        
-        logger.info("Application startup complete.")
+
+        await health_checker.start_background_probes()
+        user_cache.start_invalidation_listener()
+
+        timings["total"] = time.perf_counter() - startup_started
+        logger.info(
+            "Application startup complete. Timings: "
+            + ", ".join(f"{name}={seconds:.3f}s" for name, seconds in timings.items())
+        )
         yield
 
     except Exception as e:
         logger.error(f"Application failed to start: {e}")
+        await user_cache.stop_invalidation_listener()
         await engine.dispose()
         await health_checker.cleanup()
+        password_hash_pool.shutdown()
+        await close_redis()
+        mark_worker_dead()
         raise e
 
     finally:
         logger.info("Shutting down application...")
+        await user_cache.stop_invalidation_listener()
         await engine.dispose()
         await health_checker.cleanup()
+        password_hash_pool.shutdown()
+        await close_redis()
+        mark_worker_dead()
     
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -76,10 +120,14 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+app.add_middleware(PrometheusMiddleware)
+if settings.SQL_INSTRUMENTATION:
+    app.add_middleware(QueryStatsMiddleware, expose_headers=settings.ENVIRONMENT != "production")
+
 @app.get("/health", response_class=JSONResponse)
 async def health_check():
     try:
-        health_status = await health_checker.check_all_services()
+        health_status = await health_checker.get_snapshot()
 
         if health_status["status"] == ServiceStatus.HEALTHY:
             status_code = status.HTTP_200_OK
@@ -98,4 +146,33 @@ async def health_check():
             content={"status": ServiceStatus.UNHEALTHY, "details": str(e)},
         )
     
+metrics_bearer = HTTPBearer(auto_error=False)
+
+def require_metrics_token(credentials: HTTPAuthorizationCredentials | None = Depends(metrics_bearer)) -> None:
+    """Metrics reveal routes, traffic and queue sizes, so only the scraper may read them outside local."""
+    expected = settings.METRICS_BEARER_TOKEN
+    if not expected and settings.ENVIRONMENT == "local":
+        return
+    if expected and credentials is not None and hmac.compare_digest(credentials.credentials, expected):
+        return
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail={
+            "status": "error",
+            "message": "You do not have permission to access this resource.",
+            "action": "Scrape metrics with the configured METRICS_BEARER_TOKEN.",
+        },
+    )
+
+@app.get("/metrics", include_in_schema=False, dependencies=[Depends(require_metrics_token)])
+async def metrics():
+    await queue_depth_refresher.maybe_refresh()
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+@app.get("/.well-known/jwks.json")
+async def jwks():
+    """Public verification keys so other services can check tokens without calling the API."""
+    return token_service.keyring.jwks()
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
\ No newline at end of file
@@ -0,0 +1,41 @@
+import uuid
+from datetime import datetime, timezone
+from sqlmodel import Field, Column, SQLModel
+from sqlalchemy.dialects import postgresql as pg
+from sqlalchemy import Index, text
+
+class OutboxMessage(SQLModel, table=True):
+    __tablename__ = "outbox_message"
+    __table_args__ = (
+        # The relay only ever scans pending rows in insertion order.
+        Index(
+            "ix_outbox_message_pending",
+            "created_at",
+            postgresql_where=text("published_at IS NULL AND failed_at IS NULL"),
+        ),
+        # Lets the retention purge find old published rows without a full scan.
+        Index(
+            "ix_outbox_message_published_at",
+            "published_at",
+            postgresql_where=text("published_at IS NOT NULL"),
+        ),
+    )
+
+    id: uuid.UUID = Field(sa_column=Column(pg.UUID(as_uuid=True), primary_key=True), default_factory=uuid.uuid4)
+    task_name: str = Field(max_length=100)
+    payload: dict = Field(default_factory=dict, sa_column=Column(pg.JSONB, nullable=False))
+    # Message priority to publish with; None uses the task's route default.
+    priority: int | None = Field(default=None, sa_type=pg.SMALLINT)
+    attempts: int = Field(default=0, sa_type=pg.SMALLINT)
+    last_error: str | None = Field(default=None)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        ),
+    )
+    published_at: datetime | None = Field(default=None, sa_column=Column(pg.TIMESTAMP(timezone=True)))
+    # Set once ``attempts`` reaches OUTBOX_MAX_ATTEMPTS; the relay stops retrying the row.
+    failed_at: datetime | None = Field(default=None, sa_column=Column(pg.TIMESTAMP(timezone=True)))
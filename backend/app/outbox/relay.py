@@ -0,0 +1,173 @@
+"""Publish pending outbox rows to Celery.
+
+Run as its own process with ``python -m backend.app.outbox.relay``. Several
+relays can run side by side: each batch is claimed with ``FOR UPDATE SKIP
+LOCKED`` so concurrent relays never publish the same row twice. Rows that
+fail OUTBOX_MAX_ATTEMPTS times are marked failed, and published rows are
+purged after OUTBOX_RETENTION_HOURS.
+"""
+import asyncio
+import signal
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import any_, bindparam, delete, update
+from sqlalchemy.dialects import postgresql as pg
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.core.config import settings
+from backend.app.core.db import async_session
+from backend.app.core.logging import get_logger
+from backend.app.core.metrics import OUTBOX_MESSAGES
+from backend.app.outbox.models import OutboxMessage
+
+logger = get_logger()
+
+
+def _publish(messages: list[OutboxMessage]) -> dict:
+    """Publish ``messages`` over one broker connection; returns the errors by message id."""
+    from backend.app.core.celery_app import celery_app
+
+    errors = {}
+    with celery_app.producer_or_acquire() as producer:
+        for message in messages:
+            try:
+                # The row id doubles as the task id so a re-published row is recognisable downstream.
+                celery_app.send_task(
+                    message.task_name,
+                    kwargs=message.payload,
+                    task_id=str(message.id),
+                    producer=producer,
+                    priority=message.priority,
+                )
+            except Exception as e:
+                errors[message.id] = e
+    return errors
+
+
+async def relay_batch(session: AsyncSession, batch_size: int | None = None) -> int:
+    """Claim, publish and mark one batch of pending rows. Returns how many rows were claimed."""
+    statement = (
+        select(OutboxMessage)
+        .where(col(OutboxMessage.published_at).is_(None))
+        .where(col(OutboxMessage.failed_at).is_(None))
+        .order_by(col(OutboxMessage.created_at))
+        .limit(batch_size or settings.OUTBOX_BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    )
+    messages = list((await session.exec(statement)).all())
+    if not messages:
+        await session.commit()
+        return 0
+
+    now = datetime.now(timezone.utc)
+    # Rows left over from a higher OUTBOX_MAX_ATTEMPTS are failed without another try.
+    exhausted = [message for message in messages if message.attempts >= settings.OUTBOX_MAX_ATTEMPTS]
+    to_publish = [message for message in messages if message.attempts < settings.OUTBOX_MAX_ATTEMPTS]
+
+    errors = await asyncio.to_thread(_publish, to_publish) if to_publish else {}
+    published = [message.id for message in to_publish if message.id not in errors]
+
+    if published:
+        ids_param = bindparam("ids", published, type_=pg.ARRAY(pg.UUID(as_uuid=True)))
+        await session.exec(
+            update(OutboxMessage)
+            .where(col(OutboxMessage.id) == any_(ids_param))
+            .values(published_at=now)
+        )
+    if exhausted:
+        ids_param = bindparam("ids", [message.id for message in exhausted], type_=pg.ARRAY(pg.UUID(as_uuid=True)))
+        await session.exec(
+            update(OutboxMessage)
+            .where(col(OutboxMessage.id) == any_(ids_param))
+            .values(failed_at=now)
+        )
+    for message in to_publish:
+        if message.id not in errors:
+            continue
+        values = {"attempts": message.attempts + 1, "last_error": str(errors[message.id])[:1000]}
+        if values["attempts"] >= settings.OUTBOX_MAX_ATTEMPTS:
+            values["failed_at"] = now
+            exhausted.append(message)
+        await session.exec(update(OutboxMessage).where(col(OutboxMessage.id) == message.id).values(**values))
+    await session.commit()
+
+    OUTBOX_MESSAGES.labels(result="published").inc(len(published))
+    if errors:
+        OUTBOX_MESSAGES.labels(result="failed").inc(len(errors))
+        logger.warning(f"Failed to publish {len(errors)}/{len(to_publish)} outbox messages: {list(errors.values())[0]}")
+    if exhausted:
+        OUTBOX_MESSAGES.labels(result="dead").inc(len(exhausted))
+        for message in exhausted:
+            logger.error(
+                f"Outbox message {message.id} ({message.task_name}) failed after "
+                f"{settings.OUTBOX_MAX_ATTEMPTS} attempts and will not be retried: {errors.get(message.id, message.last_error)}"
+            )
+    logger.debug(f"Published {len(published)} outbox messages")
+    return len(messages)
+
+
+async def purge_published(session: AsyncSession, older_than: timedelta, batch_size: int | None = None) -> int:
+    """Delete up to ``batch_size`` rows published more than ``older_than`` ago. Returns how many were deleted."""
+    cutoff = datetime.now(timezone.utc) - older_than
+    expired = (
+        select(OutboxMessage.id)
+        .where(col(OutboxMessage.published_at) < cutoff)
+        .limit(batch_size or settings.OUTBOX_BATCH_SIZE)
+    )
+    result = await session.exec(delete(OutboxMessage).where(col(OutboxMessage.id).in_(expired.scalar_subquery())))
+    await session.commit()
+    return result.rowcount
+
+
+async def _purge_expired() -> None:
+    retention = timedelta(hours=settings.OUTBOX_RETENTION_HOURS)
+    total = 0
+    while True:
+        async with async_session() as session:
+            deleted = await purge_published(session, retention)
+        total += deleted
+        if deleted < settings.OUTBOX_BATCH_SIZE:
+            break
+    if total:
+        logger.info(f"Purged {total} outbox messages published more than {settings.OUTBOX_RETENTION_HOURS} hours ago")
+
+
+async def run_relay(stop: asyncio.Event) -> None:
+    logger.info("Outbox relay started")
+    next_purge = time.monotonic()
+    while not stop.is_set():
+        if time.monotonic() >= next_purge:
+            next_purge = time.monotonic() + settings.OUTBOX_PURGE_INTERVAL_SECONDS
+            try:
+                await _purge_expired()
+            except Exception as e:
+                logger.error(f"Outbox retention purge failed: {e}")
+
+        try:
+            async with async_session() as session:
+                claimed = await relay_batch(session)
+        except Exception as e:
+            logger.error(f"Outbox relay batch failed: {e}")
+            claimed = 0
+
+        # A full batch means there is probably more waiting; otherwise poll again later.
+        if claimed < settings.OUTBOX_BATCH_SIZE:
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=settings.OUTBOX_POLL_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+    logger.info("Outbox relay stopped")
+
+
+async def main() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    await run_relay(stop)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
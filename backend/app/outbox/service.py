@@ -0,0 +1,8 @@
+from sqlmodel.ext.asyncio.session import AsyncSession
+from backend.app.outbox.models import OutboxMessage
+
+def add_outbox_message(session: AsyncSession, task_name: str, payload: dict, priority: int | None = None) -> OutboxMessage:
+    """Stage a Celery task in the caller's transaction; the relay publishes it after commit."""
+    message = OutboxMessage(task_name=task_name, payload=payload, priority=priority)
+    session.add(message)
+    return message
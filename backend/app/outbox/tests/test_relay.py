@@ -0,0 +1,140 @@
+from contextlib import contextmanager
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.sql import Delete, Select, Update
+
+from backend.app.core.celery_app import celery_app
+from backend.app.core.config import settings
+from backend.app.core.metrics import OUTBOX_MESSAGES
+from backend.app.outbox import relay
+from backend.app.outbox.models import OutboxMessage
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeResult:
+    def __init__(self, rows=(), rowcount=0):
+        self._rows = list(rows)
+        self.rowcount = rowcount
+
+    def all(self):
+        return self._rows
+
+
+class FakeSession:
+    """Serves the claimed rows to the SELECT and records every UPDATE/DELETE."""
+
+    def __init__(self, rows=(), rowcount=0):
+        self.rows = rows
+        self.rowcount = rowcount
+        self.updates: list[dict] = []
+        self.deletes: list[Delete] = []
+        self.commits = 0
+
+    async def exec(self, statement):
+        if isinstance(statement, Select):
+            return FakeResult(self.rows)
+        if isinstance(statement, Update):
+            params = statement.compile().params
+            self.updates.append({key: value for key, value in params.items() if not key.startswith("id")})
+            return FakeResult()
+        if isinstance(statement, Delete):
+            self.deletes.append(statement)
+            return FakeResult(rowcount=self.rowcount)
+        raise AssertionError(f"Unexpected statement {statement}")
+
+    async def commit(self):
+        self.commits += 1
+
+
+def fake_publish(fail: set):
+    def publish(messages):
+        return {message.id: ConnectionError("broker down") for message in messages if message.task_name in fail}
+    return publish
+
+
+def counter(result: str) -> float:
+    return OUTBOX_MESSAGES.labels(result=result)._value.get()
+
+
+async def test_publish_failure_increments_attempts(monkeypatch):
+    message = OutboxMessage(task_name="flaky", payload={}, attempts=0)
+    ok = OutboxMessage(task_name="ok", payload={})
+    monkeypatch.setattr(relay, "_publish", fake_publish({"flaky"}))
+    session = FakeSession([message, ok])
+
+    assert await relay.relay_batch(session) == 2
+
+    published, retried = session.updates
+    assert "published_at" in published
+    assert retried["attempts"] == 1
+    assert retried["last_error"] == "broker down"
+    assert "failed_at" not in retried
+    assert session.commits == 1
+
+
+async def test_last_attempt_marks_the_row_failed(monkeypatch):
+    message = OutboxMessage(task_name="flaky", payload={}, attempts=settings.OUTBOX_MAX_ATTEMPTS - 1)
+    monkeypatch.setattr(relay, "_publish", fake_publish({"flaky"}))
+    session = FakeSession([message])
+    dead_before = counter("dead")
+
+    await relay.relay_batch(session)
+
+    (update,) = session.updates
+    assert update["attempts"] == settings.OUTBOX_MAX_ATTEMPTS
+    assert update["failed_at"] is not None
+    assert counter("dead") == dead_before + 1
+
+
+async def test_rows_already_past_the_limit_are_failed_without_publishing(monkeypatch):
+    message = OutboxMessage(task_name="old", payload={}, attempts=settings.OUTBOX_MAX_ATTEMPTS)
+    published = []
+    monkeypatch.setattr(relay, "_publish", lambda messages: published.extend(messages) or {})
+    session = FakeSession([message])
+
+    await relay.relay_batch(session)
+
+    assert published == []
+    (update,) = session.updates
+    assert set(update) == {"failed_at"}
+
+
+async def test_empty_batch_only_commits():
+    session = FakeSession([])
+
+    assert await relay.relay_batch(session) == 0
+    assert session.updates == [] and session.commits == 1
+
+
+async def test_purge_deletes_published_rows_past_retention():
+    session = FakeSession(rowcount=3)
+
+    assert await relay.purge_published(session, timedelta(hours=1), batch_size=10) == 3
+    (statement,) = session.deletes
+    assert "published_at <" in str(statement)
+
+
+def test_publish_sends_each_row_with_its_priority(monkeypatch):
+    sent: list[dict] = []
+
+    @contextmanager
+    def producer_or_acquire():
+        yield "producer"
+
+    def send_task(name, **options):
+        sent.append({"name": name, **options})
+
+    monkeypatch.setattr(celery_app, "producer_or_acquire", producer_or_acquire)
+    monkeypatch.setattr(celery_app, "send_task", send_task)
+    otp = OutboxMessage(task_name="send_email_task", payload={"subject": "otp"}, priority=9)
+    bulk = OutboxMessage(task_name="send_bulk_email_task", payload={"messages": []})
+
+    assert relay._publish([otp, bulk]) == {}
+
+    assert [(task["name"], task["priority"], task["task_id"]) for task in sent] == [
+        ("send_email_task", 9, str(otp.id)),
+        ("send_bulk_email_task", None, str(bulk.id)),
+    ]
+    assert all(task["producer"] == "producer" for task in sent)
@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+HEAVY_MODULES = ("celery", "kombu", "fastapi_mail", "jinja2")
+
+
+def imported_heavy_modules(module: str) -> list[str]:
+    """Import ``module`` in a fresh interpreter and list which heavy subsystems came with it."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {module}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))",
+        ],
+        cwd=REPO_ROOT,
+        env={**os.environ, "PYTHONPATH": str(REPO_ROOT)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+def test_api_import_defers_celery_mail_and_templates():
+    assert imported_heavy_modules("backend.app.main") == []
+
+
+def test_email_template_import_defers_the_mail_client_and_task_queue():
+    assert imported_heavy_modules("backend.app.core.emails.base") == []
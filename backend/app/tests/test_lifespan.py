@@ -0,0 +1,81 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app import main
+from backend.app.core.config import settings
+from backend.app.core.health import health_checker
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def startup(monkeypatch, redis):
+    """Replace the steps that need real services with recorders; the lifespan wiring stays real."""
+    state = SimpleNamespace(healthy=True, calls=[])
+    calls = state.calls
+    health_started = asyncio.Event()
+    db_started = asyncio.Event()
+
+    async def init_db() -> None:
+        calls.append("init_db")
+        db_started.set()
+        # Deadlocks unless the health checks run alongside the database init.
+        await asyncio.wait_for(health_started.wait(), timeout=1)
+
+    async def warm_pool() -> int:
+        calls.append("warm_pool")
+        return settings.DB_POOL_SIZE
+
+    async def startup_health_check(timeout: float) -> bool:
+        calls.append("health_checks")
+        health_started.set()
+        await asyncio.wait_for(db_started.wait(), timeout=1)
+        return state.healthy
+
+    async def start_background_probes() -> None:
+        calls.append("background_probes")
+
+    monkeypatch.setattr(main, "init_db", init_db)
+    monkeypatch.setattr(main, "warm_pool", warm_pool)
+    monkeypatch.setattr(main, "startup_health_check", startup_health_check)
+    monkeypatch.setattr(health_checker, "start_background_probes", start_background_probes)
+    monkeypatch.setattr(settings, "DB_POOL_WARMUP", True)
+    return state
+
+
+async def test_startup_runs_init_and_health_checks_concurrently(startup):
+    async with main.lifespan(main.app):
+        assert sorted(startup.calls[:2]) == ["health_checks", "init_db"]
+        assert startup.calls[2:] == ["warm_pool", "background_probes"]
+
+        snapshot = await health_checker.get_snapshot()
+        assert set(snapshot["services"]) == {"database", "redis", "celery"}
+
+    # Shutdown clears the registered services so the next lifespan starts clean.
+    assert (await health_checker.get_snapshot())["services"] == {}
+
+
+async def test_unhealthy_startup_aborts_before_serving(startup):
+    startup.healthy = False
+
+    with pytest.raises(RuntimeError):
+        async with main.lifespan(main.app):
+            pytest.fail("lifespan yielded despite unhealthy services")
+
+    assert "background_probes" not in startup.calls
+    assert (await health_checker.get_snapshot())["services"] == {}
+
+
+async def test_timed_records_duration_even_on_failure():
+    timings: dict[str, float] = {}
+
+    async def fail() -> None:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await main._timed(timings, "step", fail())
+
+    assert timings["step"] >= 0.01
@@ -4,4 +4,14 @@ set -o errexit  # Exit on error
 set -o nounset  # Exit on unset variable
 set -o pipefail # Exit on pipe error
 
-exec watchfiles --filter python celery.__main__.main --args '-A backend.app.core.celery_app worker -l INFO'
\ No newline at end of file
+# Multiprocess metrics files from a previous run would be aggregated into this one.
+if [ -n "${PROMETHEUS_MULTIPROC_DIR:-}" ]; then
+    rm -rf "${PROMETHEUS_MULTIPROC_DIR}"
+    mkdir -p "${PROMETHEUS_MULTIPROC_DIR}"
+fi
+
+# Worker profile: which queues this worker consumes and with how many processes.
+CELERY_WORKER_QUEUES="${CELERY_WORKER_QUEUES:-high_priority,bank_tasks}"
+CELERY_WORKER_CONCURRENCY="${CELERY_WORKER_CONCURRENCY:-2}"
+
+exec watchfiles --filter python celery.__main__.main --args "-A backend.app.core.celery_app worker -l INFO -Q ${CELERY_WORKER_QUEUES} -c ${CELERY_WORKER_CONCURRENCY}"
@@ -44,4 +44,7 @@ END
 
 >&2 echo 'PostgreSQL is ready to accept connections'
 
+# local.yml bind-mounts the source over the image, hiding the templates compiled at build time.
+python -m backend.app.core.emails.compile
+
 exec "$@"
\ No newline at end of file
@@ -4,4 +4,10 @@ set -o errexit  # Exit on error
 set -o nounset  # Exit on unset variable
 set -o pipefail # Exit on pipe error
 
+# Multiprocess metrics files from a previous run would be aggregated into this one.
+if [ -n "${PROMETHEUS_MULTIPROC_DIR:-}" ]; then
+    rm -rf "${PROMETHEUS_MULTIPROC_DIR}"
+    mkdir -p "${PROMETHEUS_MULTIPROC_DIR}"
+fi
+
 exec uvicorn backend.app.main:app --host 0.0.0.0 --port 8000 --reload   # 0.0.0.0 means listen on all available interfaces
\ No newline at end of file
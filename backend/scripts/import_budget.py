@@ -0,0 +1,96 @@
+"""Measure `python -X importtime` for the API and worker entry points and enforce a budget.
+
+Usage:
+    python backend/scripts/import_budget.py [--runs 5] [--budget api=1500] [--output report.json]
+
+Exits with status 1 when the median cumulative import time of an entry point
+exceeds its budget (in milliseconds).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+ENTRY_POINTS = {
+    "api": "backend.app.main",
+    "worker": "backend.app.core.celery_app",
+}
+
+DEFAULT_BUDGETS_MS = {
+    "api": 1500.0,
+    "worker": 1000.0,
+}
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Map module name to (self_us, cumulative_us) from `-X importtime` output."""
+    timings: dict[str, tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def measure(module: str) -> dict[str, tuple[int, int]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        env={**os.environ, "PYTHONPATH": str(REPO_ROOT)},
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", action="append", default=[], metavar="NAME=MS")
+    parser.add_argument("--top", type=int, default=10, help="Show the N slowest modules by self time.")
+    parser.add_argument("--output", type=Path, help="Write the measurements as JSON.")
+    args = parser.parse_args()
+
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    for item in args.budget:
+        name, value = item.split("=", 1)
+        budgets[name] = float(value)
+
+    report = {}
+    over_budget = []
+    for name, module in ENTRY_POINTS.items():
+        runs = [measure(module) for _ in range(args.runs)]
+        median_ms = statistics.median(run[module][1] for run in runs) / 1000
+        slowest = sorted(runs[-1].items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+
+        report[name] = {
+            "module": module,
+            "median_ms": round(median_ms, 1),
+            "budget_ms": budgets[name],
+            "slowest_self_ms": {mod: round(self_us / 1000, 1) for mod, (self_us, _) in slowest},
+        }
+        verdict = "OK" if median_ms <= budgets[name] else "OVER BUDGET"
+        print(f"{name:<8} {module:<32} {median_ms:8.1f} ms (budget {budgets[name]:.0f} ms) {verdict}")
+        for mod, (self_us, _) in slowest:
+            print(f"           {self_us / 1000:8.1f} ms  {mod}")
+
+        if median_ms > budgets[name]:
+            over_budget.append(name)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
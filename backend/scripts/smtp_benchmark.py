@@ -0,0 +1,91 @@
+"""Measure email send throughput through the worker SMTP pool.
+
+Usage:
+    python backend/scripts/smtp_benchmark.py [--messages 1000] [--concurrency 4] [--local-server]
+
+By default messages go to SMTP_HOST:SMTP_PORT (mailpit in local.yml).
+--local-server starts an in-process aiosmtpd sink instead; aiosmtpd is not
+an application dependency, so install it separately for that mode.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from backend.app.core.emails.transport import SMTPConnectionPool, build_message  # noqa: E402
+from backend.app.core.config import settings  # noqa: E402
+
+
+def start_local_server(port: int):
+    from aiosmtpd.controller import Controller
+
+    class Sink:
+        async def handle_DATA(self, server, session, envelope):
+            return "250 OK"
+
+    controller = Controller(Sink(), hostname="127.0.0.1", port=port)
+    controller.start()
+    return controller
+
+
+async def run(pool: SMTPConnectionPool, messages: int, concurrency: int) -> float:
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for index in range(messages):
+        queue.put_nowait(index)
+
+    async def sender() -> None:
+        while not queue.empty():
+            index = queue.get_nowait()
+            await pool.send(build_message(
+                [f"customer{index}@example.com"],
+                "Benchmark",
+                f"<p>Message {index}</p>",
+                f"Message {index}",
+            ))
+
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(sender() for _ in range(concurrency)))
+    finally:
+        await pool.close()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=settings.SMTP_POOL_SIZE)
+    parser.add_argument("--max-messages", type=int, default=settings.SMTP_POOL_MAX_MESSAGES)
+    parser.add_argument("--local-server", action="store_true")
+    parser.add_argument("--port", type=int, default=8825, help="Port for --local-server.")
+    args = parser.parse_args()
+
+    host, port, controller = settings.SMTP_HOST, settings.SMTP_PORT, None
+    if args.local_server:
+        controller = start_local_server(args.port)
+        host, port = "127.0.0.1", args.port
+
+    pool = SMTPConnectionPool(
+        host=host,
+        port=port,
+        size=args.concurrency,
+        max_messages=args.max_messages,
+        max_idle=settings.SMTP_POOL_MAX_IDLE_SECONDS,
+        timeout=settings.SMTP_TIMEOUT_SECONDS,
+    )
+    try:
+        # The benchmark owns its pool; worker_loop.close() would close the module-level smtp_pool instead.
+        elapsed = asyncio.run(run(pool, args.messages, args.concurrency))
+    finally:
+        if controller is not None:
+            controller.stop()
+
+    print(f"Sent {args.messages} messages in {elapsed:.2f} s ({args.messages / elapsed:.0f} msg/s) "
+          f"over {args.concurrency} connections to {host}:{port}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""add_outbox_message_table
+
+Revision ID: 9b41c7e2d5a8
+Revises: 3de3042fe21f
+Create Date: 2026-10-17 09:12:44.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '9b41c7e2d5a8'
+down_revision: Union[str, Sequence[str], None] = '3de3042fe21f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('outbox_message',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('task_name', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=False),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('attempts', sa.SMALLINT(), nullable=False),
+    sa.Column('last_error', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('published_at', postgresql.TIMESTAMP(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_outbox_message_pending', 'outbox_message', ['created_at'], unique=False, postgresql_where=sa.text('published_at IS NULL'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_outbox_message_pending', table_name='outbox_message', postgresql_where=sa.text('published_at IS NULL'))
+    op.drop_table('outbox_message')
@@ -0,0 +1,32 @@
+"""drop_user_otp_columns
+
+Revision ID: c2f8a61d4e37
+Revises: 9b41c7e2d5a8
+Create Date: 2026-10-17 10:03:27.540918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f8a61d4e37'
+down_revision: Union[str, Sequence[str], None] = '9b41c7e2d5a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # OTPs now live in Redis (backend.app.auth.otp).
+    op.drop_column('user', 'otp_expiry_time')
+    op.drop_column('user', 'otp')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('user', sa.Column('otp', sqlmodel.sql.sqltypes.AutoString(length=6), server_default='', nullable=False))
+    op.add_column('user', sa.Column('otp_expiry_time', postgresql.TIMESTAMP(timezone=True), nullable=True))
@@ -0,0 +1,35 @@
+"""add_outbox_message_failed_at
+
+Revision ID: e7a3d91b5c20
+Revises: c2f8a61d4e37
+Create Date: 2026-10-17 14:21:08.733512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a3d91b5c20'
+down_revision: Union[str, Sequence[str], None] = 'c2f8a61d4e37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('outbox_message', sa.Column('failed_at', postgresql.TIMESTAMP(timezone=True), nullable=True))
+    op.drop_index('ix_outbox_message_pending', table_name='outbox_message', postgresql_where=sa.text('published_at IS NULL'))
+    op.create_index('ix_outbox_message_pending', 'outbox_message', ['created_at'], unique=False, postgresql_where=sa.text('published_at IS NULL AND failed_at IS NULL'))
+    op.create_index('ix_outbox_message_published_at', 'outbox_message', ['published_at'], unique=False, postgresql_where=sa.text('published_at IS NOT NULL'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_outbox_message_published_at', table_name='outbox_message', postgresql_where=sa.text('published_at IS NOT NULL'))
+    op.drop_index('ix_outbox_message_pending', table_name='outbox_message', postgresql_where=sa.text('published_at IS NULL AND failed_at IS NULL'))
+    op.create_index('ix_outbox_message_pending', 'outbox_message', ['created_at'], unique=False, postgresql_where=sa.text('published_at IS NULL'))
+    op.drop_column('outbox_message', 'failed_at')
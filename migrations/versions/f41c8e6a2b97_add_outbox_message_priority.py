@@ -0,0 +1,29 @@
+"""add_outbox_message_priority
+
+Revision ID: f41c8e6a2b97
+Revises: e7a3d91b5c20
+Create Date: 2026-10-17 15:02:51.164390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'f41c8e6a2b97'
+down_revision: Union[str, Sequence[str], None] = 'e7a3d91b5c20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('outbox_message', sa.Column('priority', sa.SMALLINT(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('outbox_message', 'priority')